@@ -13,6 +13,8 @@ from typing import IO
 class AssembleArgs:
     manifest: IO
     keep: bool
+    fast_plugin_install: bool
+    compression_level: int
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Assemble an OpenSearch Distribution")
@@ -24,6 +26,20 @@ class AssembleArgs:
             action="store_true",
             help="Do not delete the working temporary directory.",
         )
+        parser.add_argument(
+            "--fast-plugin-install",
+            dest="fast_plugin_install",
+            action="store_true",
+            help="Install plugins by extracting them concurrently instead of running the plugin CLI for each one, when they support it.",
+        )
+        parser.add_argument(
+            "--compression-level",
+            dest="compression_level",
+            type=int,
+            choices=range(0, 10),
+            metavar="{0-9}",
+            help="Compression level of tar.gz and zip distributions, by default 9 for tar.gz and 6 for zip.",
+        )
         parser.add_argument(
             "-v",
             "--verbose",
@@ -39,3 +55,5 @@ class AssembleArgs:
         self.manifest = args.manifest
         self.keep = args.keep
         self.base_url = args.base_url
+        self.fast_plugin_install = args.fast_plugin_install
+        self.compression_level = args.compression_level
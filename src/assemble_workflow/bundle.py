@@ -11,7 +11,7 @@ import os
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, Dict, List
 
 from assemble_workflow.bundle_recorder import BundleRecorder
 from assemble_workflow.dist import Dist
@@ -34,12 +34,13 @@ class Bundle(ABC):
     def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
         self.tmp_dir.__exit__(exc_type, exc_value, exc_traceback)
 
-    def __init__(self, build_manifest: BuildManifest, artifacts_dir: str, bundle_recorder: BundleRecorder, keep: bool = False) -> None:
+    def __init__(self, build_manifest: BuildManifest, artifacts_dir: str, bundle_recorder: BundleRecorder, keep: bool = False, fast_plugin_install: bool = False) -> None:
         """
         Construct a new Bundle instance.
         :param build_manifest: A BuildManifest created from the build workflow.
         :param artifacts_dir: Dir location where build artifacts can be found locally
         :param bundle_recorder: The bundle recorder that will capture and build a BundleManifest
+        :param fast_plugin_install: Install the plugins that support it at once with install_plugins, before the others.
         """
         self.build = build_manifest.build
         self.components = build_manifest.components
@@ -49,6 +50,7 @@ class Bundle(ABC):
         self.min_bundle = self.__get_min_bundle(build_manifest.components)
         self.min_dist = self.__get_min_dist(build_manifest.components)
         self.installed_plugins: List[str] = []
+        self.fast_plugin_install = fast_plugin_install
 
     def install_min(self) -> None:
         install_script = ScriptFinder.find_install_script(self.min_dist.name)
@@ -70,9 +72,15 @@ class Bundle(ABC):
         self._execute(install_command)
 
     def install_components(self) -> None:
+        installed: List[str] = []
+        if self.fast_plugin_install:
+            installed = self.install_plugins([c for c in self.components.values() if self.min_bundle != c and "plugins" in c.artifacts])
         for c in self.components.values():
             if self.min_bundle == c:
                 pass
+            elif c.name in installed:
+                logging.info(f"Recording {c.name}")
+                self.bundle_recorder.record_component(c, self.__get_rel_path(c, "plugins"))
             elif "plugins" in c.artifacts:
                 logging.info(f"Installing {c.name}")
                 self.install_plugin(c)
@@ -83,6 +91,13 @@ class Bundle(ABC):
         if os.path.isdir(plugins_path):
             self.installed_plugins = os.listdir(plugins_path)
 
+    def install_plugins(self, plugins: List[BuildComponent]) -> List[str]:
+        """
+        Install plugins without installing them one by one, and return the names of those installed.
+        The others are installed with install_plugin, by default all of them.
+        """
+        return []
+
     @abstractmethod
     def install_plugin(self, plugin: BuildComponent) -> None:
         install_script = ScriptFinder.find_install_script(plugin.name)
@@ -99,8 +114,8 @@ class Bundle(ABC):
         )
         self._execute(install_command)
 
-    def package(self, dest: str) -> None:
-        self.min_dist.build(self.bundle_recorder.package_name, dest)
+    def package(self, dest: str, compression_level: int = None) -> None:
+        self.min_dist.build(self.bundle_recorder.package_name, dest, compression_level)
 
     def _execute(self, command: str) -> None:
         logging.info(f'Executing "{command}" in {self.min_dist.archive_path}')
@@ -112,6 +127,15 @@ class Bundle(ABC):
         self.bundle_recorder.record_component(component, rel_path)
         return tmp_path
 
+    def _plugin_zips(self, plugins: List[BuildComponent]) -> Dict[str, str]:
+        # plugins with a custom install script are installed with install_plugin, before running it
+        default_install_script = os.path.realpath(os.path.join(ScriptFinder.default_scripts_path, "install.sh"))
+        return {
+            plugin.name: os.path.join(self.artifacts_dir, self.__get_rel_path(plugin, "plugins"))
+            for plugin in plugins
+            if ScriptFinder.find_install_script(plugin.name) == default_install_script
+        }
+
     def __get_rel_path(self, component: BuildComponent, component_type: str) -> str:
         return next(iter(component.artifacts.get(component_type, [])), None)
 
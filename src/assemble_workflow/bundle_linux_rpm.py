@@ -11,6 +11,7 @@ import shutil
 import subprocess
 
 from manifests.build_manifest import BuildManifest
+from system.archive_extractor import ArchiveExtractor
 from system.os import rpm_architecture
 
 
@@ -22,37 +23,13 @@ class BundleLinuxRpm:
         self.min_path = min_path
 
     def extract(self, dest: str) -> None:
-        cpio_basename = os.path.splitext(os.path.basename(self.package_path))[0]
-        cpio_path = os.path.join(dest, f"{cpio_basename}.cpio")
         min_source_path = os.path.join(dest, 'usr', 'share', self.filename)
         min_dest_path = os.path.join(dest, self.min_path)
         min_config_path = os.path.join(dest, 'etc', self.filename)
 
-        # Convert rpm to cpio so we can extract the content
-        logging.info(f"Convert rpm to cpio for extraction: {self.package_path} to {cpio_path}")
-        with open(cpio_path, 'wb') as fp:
-            subprocess.check_call(
-                [
-                    'rpm2cpio',
-                    self.package_path,
-                ],
-                stdout=fp,
-                cwd=dest,
-            )
-
-        # Extract cpio archive based on the rpm package
-        logging.info(f"Extract cpio {cpio_path} content to {dest}")
-        with open(cpio_path, 'rb') as fp:
-            subprocess.check_call(
-                [
-                    'cpio',
-                    '-imdv',
-                ],
-                stdin=fp,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.STDOUT,
-                cwd=dest,
-            )
+        # Extract the rpm payload, without converting it to an intermediate cpio archive
+        logging.info(f"Extract rpm {self.package_path} content to {dest}")
+        ArchiveExtractor().extract_rpm(self.package_path, dest)
 
         # Move core folder destination so plugin install can proceed
         logging.info(f"Move {min_source_path} to {min_dest_path} for plugin installation")
@@ -6,8 +6,10 @@
 # compatible open source license.
 
 import os
+from typing import List
 
 from assemble_workflow.bundle import Bundle
+from assemble_workflow.opensearch_dashboards_plugin_installer import OpenSearchDashboardsPluginInstaller
 from manifests.build_manifest import BuildComponent
 from system.os import current_platform
 
@@ -17,6 +19,9 @@ class BundleOpenSearchDashboards(Bundle):
     def install_plugin_script(self) -> str:
         return "opensearch-dashboards-plugin.bat" if current_platform() == "windows" else "opensearch-dashboards-plugin"
 
+    def install_plugins(self, plugins: List[BuildComponent]) -> List[str]:
+        return OpenSearchDashboardsPluginInstaller(self.min_dist.archive_path, self.build.version).install(self._plugin_zips(plugins))
+
     def install_plugin(self, plugin: BuildComponent) -> None:
         tmp_path = self._copy_component(plugin, "plugins")
         cli_path = os.path.join(self.min_dist.archive_path, "bin", self.install_plugin_script)
@@ -12,10 +12,13 @@ import shutil
 import tarfile
 import zipfile
 from abc import ABC, abstractmethod
+from typing import IO, cast
 
 from assemble_workflow.bundle_linux_deb import BundleLinuxDeb
 from assemble_workflow.bundle_linux_rpm import BundleLinuxRpm
 from manifests.build_manifest import BuildManifest
+from system.archive_extractor import ArchiveExtractor
+from system.parallel_gzip_file import ParallelGzipFile
 from system.zip_file import ZipFile
 
 
@@ -27,6 +30,7 @@ class Dist(ABC):
         self.filename = name.lower()
         self.path = path
         self.min_path = min_path
+        self.compression_level: int = None
 
     @abstractmethod
     def __extract__(self, dest: str) -> None:
@@ -81,7 +85,8 @@ class Dist(ABC):
         )
         return self.archive_path
 
-    def build(self, name: str, dest: str) -> None:
+    def build(self, name: str, dest: str, compression_level: int = None) -> None:
+        self.compression_level = compression_level
         self.__build__(name, dest)
         path = os.path.join(dest, name)
         shutil.copyfile(name, path)
@@ -90,21 +95,21 @@ class Dist(ABC):
 
 class DistTar(Dist):
     def __extract__(self, dest: str) -> None:
-        with tarfile.open(self.path, "r:gz") as tar:
-            tar.extractall(dest)
+        ArchiveExtractor().extract_tar(self.path, dest)
 
     def __build__(self, name: str, dest: str) -> None:
-        with tarfile.open(name, "w:gz") as tar:
-            tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
+        # compressed using all cores, into the same bytes for the same files
+        with ParallelGzipFile(name, 9 if self.compression_level is None else self.compression_level) as gz:
+            with tarfile.open(fileobj=cast(IO[bytes], gz), mode="w") as tar:
+                tar.add(self.archive_path, arcname=os.path.basename(self.archive_path))
 
 
 class DistZip(Dist):
     def __extract__(self, dest: str) -> None:
-        with ZipFile(self.path, "r") as zip:
-            zip.extractall(dest)
+        ArchiveExtractor().extract_zip(self.path, dest)
 
     def __build__(self, name: str, dest: str) -> None:
-        with ZipFile(name, "w", zipfile.ZIP_DEFLATED) as zip:
+        with ZipFile(name, "w", zipfile.ZIP_DEFLATED, compresslevel=self.compression_level) as zip:
             # root               : /tmp/tmp********/opensearch-<version+qualifier>
             # leadingdir         : opensearch-<version+qualifier>
             # root no leading dir: /tmp/tmp********/
@@ -112,10 +117,14 @@ class DistZip(Dist):
             rootlen = len(self.archive_path)
             leadingdirlen = len(os.path.basename(self.archive_path))
             noleadingdirlen = rootlen - leadingdirlen
-            for base, _, files in os.walk(self.archive_path):
-                for file in files:
+            # files are deflated using all cores, in a stable order for the same bytes
+            entries = []
+            for base, dirs, files in os.walk(self.archive_path):
+                dirs.sort()
+                for file in sorted(files):
                     fn = os.path.join(base, file)
-                    zip.write(fn, fn[noleadingdirlen:])
+                    entries.append((fn, fn[noleadingdirlen:]))
+            zip.write_files(entries)
 
 
 class DistDeb(Dist):
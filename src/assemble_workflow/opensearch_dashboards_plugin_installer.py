@@ -0,0 +1,99 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import re
+import shutil
+from typing import Any, Dict
+from zipfile import ZipFile
+
+from assemble_workflow.plugin_installer import PluginInstaller
+
+"""
+This class is responsible for installing OpenSearch Dashboards plugins without the plugin CLI, see --fast-plugin-install.
+Like `opensearch-dashboards-plugin install`, it reads the opensearch_dashboards.json of the plugin in each zip, checks that
+the plugin was built for the version of OpenSearch Dashboards being assembled, and installs the files under
+opensearch-dashboards/<folder> in the zip into plugins/<id>, keeping their permissions. Plugins the CLI would reject
+are left to the CLI, which also reports why they are invalid.
+"""
+
+
+class OpenSearchDashboardsPluginInstaller(PluginInstaller):
+    ARCHIVE_DIR = "opensearch-dashboards"
+    MANIFEST = "opensearch_dashboards.json"
+    DIR_MODE = 0o755
+    FILE_MODE = 0o644
+
+    def __init__(self, archive_path: str, version: str, workers: int = None) -> None:
+        """
+        :param archive_path: The extracted min distribution.
+        :param version: The version of OpenSearch Dashboards, used when the distribution does not have a package.json.
+        """
+        super().__init__(os.path.join(archive_path, "plugins"), workers)
+        self.archive_path = archive_path
+        self.version = self.__clean_version(self.__package_version() or version)
+        self.archive_dirs: Dict[str, str] = {}
+
+    def folder(self, plugin_zip: str) -> str:
+        folder: str = self.manifest(plugin_zip)["id"]
+        return folder
+
+    def manifest(self, plugin_zip: str) -> Dict[str, Any]:
+        """
+        Read and validate the opensearch_dashboards.json of a plugin zip, raise UnsupportedPluginError for plugins left to the CLI.
+        """
+        with ZipFile(plugin_zip) as zip:
+            manifests = [entry for entry in zip.namelist() if re.fullmatch(rf"{self.ARCHIVE_DIR}/[^/]+/{self.MANIFEST}", entry)]
+            if len(manifests) != 1:
+                raise OpenSearchDashboardsPluginInstaller.UnsupportedPluginError(plugin_zip, f"contains {len(manifests)} plugins")
+            archive_dir = os.path.dirname(manifests[0]) + "/"
+            for entry in zip.namelist():
+                if entry.startswith(archive_dir) and ".." in entry.replace("\\", "/").split("/"):
+                    raise OpenSearchDashboardsPluginInstaller.UnsupportedPluginError(plugin_zip, f"contains {entry}, outside of the plugin directory")
+            try:
+                manifest = json.loads(zip.read(manifests[0]))
+            except ValueError as e:
+                raise OpenSearchDashboardsPluginInstaller.UnsupportedPluginError(plugin_zip, f"has an invalid {self.MANIFEST}: {e}")
+
+        if not isinstance(manifest, dict) or not manifest.get("id") or not manifest.get("version"):
+            raise OpenSearchDashboardsPluginInstaller.UnsupportedPluginError(plugin_zip, f"does not set an id and a version in {self.MANIFEST}")
+        plugin_version = self.__clean_version(manifest.get("opensearchDashboardsVersion") or manifest["version"])
+        if plugin_version != self.version:
+            raise OpenSearchDashboardsPluginInstaller.UnsupportedPluginError(plugin_zip, f"was built for OpenSearch Dashboards {plugin_version}, not {self.version}")
+        self.archive_dirs[plugin_zip] = archive_dir
+        return manifest
+
+    def _extract(self, plugin_zip: str, staging: str) -> None:
+        archive_dir = self.archive_dirs[plugin_zip]
+        with ZipFile(plugin_zip) as zip:
+            for info in zip.infolist():
+                if not info.filename.startswith(archive_dir) or info.filename == archive_dir:
+                    continue
+                path = os.path.join(staging, info.filename[len(archive_dir):])
+                if info.is_dir():
+                    os.makedirs(path, self.DIR_MODE, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(path), self.DIR_MODE, exist_ok=True)
+                with zip.open(info) as src, open(path, "wb") as dest:
+                    shutil.copyfileobj(src, dest)
+                # like the CLI, keep the permissions of files, e.g. of executables bundled with a plugin
+                os.chmod(path, (info.external_attr >> 16) & 0o777 or self.FILE_MODE)
+
+    def __package_version(self) -> str:
+        package_json = os.path.join(self.archive_path, "package.json")
+        if not os.path.isfile(package_json):
+            return None
+        with open(package_json) as f:
+            version: str = json.load(f).get("version")
+            return version
+
+    @classmethod
+    def __clean_version(cls, version: str) -> str:
+        # the CLI compares major.minor.patch, e.g. 1.1.0-SNAPSHOT and 1.1.0.0 are built for 1.1.0
+        match = re.match(r"\d+\.\d+\.\d+", str(version))
+        return match.group(0) if match else str(version)
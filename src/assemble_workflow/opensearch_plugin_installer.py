@@ -0,0 +1,96 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+from typing import Dict
+from zipfile import ZipFile
+
+from assemble_workflow.plugin_installer import PluginInstaller
+from system.properties_file import PropertiesFile
+
+"""
+This class is responsible for installing OpenSearch plugins without the plugin CLI, see --fast-plugin-install.
+It validates the plugin-descriptor.properties of each plugin zip like `opensearch-plugin install --batch` does, and leaves
+the same files with the same permissions in plugins/<name> as the CLI. Plugins that need more than their files in
+plugins/<name>, i.e. bin or config files or a security policy to be granted, and plugins the CLI would reject are left
+to the CLI, which also reports why they are invalid. Jar hell is not checked, the assembled distribution is expected to be tested.
+"""
+
+
+class OpenSearchPluginInstaller(PluginInstaller):
+    DESCRIPTOR = "plugin-descriptor.properties"
+    SECURITY_POLICY = "plugin-security.policy"
+    DIR_MODE = 0o755
+    FILE_MODE = 0o644
+
+    def __init__(self, archive_path: str, version: str, workers: int = None) -> None:
+        """
+        :param archive_path: The extracted min distribution.
+        :param version: The version of OpenSearch, plugins must have been built for it.
+        """
+        super().__init__(os.path.join(archive_path, "plugins"), workers)
+        self.archive_path = archive_path
+        self.version = version.split("-")[0]
+        self.descriptors: Dict[str, PropertiesFile] = {}
+
+    def folder(self, plugin_zip: str) -> str:
+        descriptor = self.descriptor(plugin_zip)
+        self.descriptors[plugin_zip] = descriptor
+        folder: str = descriptor.get_value("custom.foldername") or descriptor.get_value("name")
+        return folder
+
+    def descriptor(self, plugin_zip: str) -> PropertiesFile:
+        """
+        Read and validate the descriptor of a plugin zip, raise UnsupportedPluginError for plugins left to the CLI.
+        """
+        with ZipFile(plugin_zip) as zip:
+            names = zip.namelist()
+            for entry in names:
+                parts = entry.replace("\\", "/").split("/")
+                if entry.startswith("/") or ".." in parts:
+                    raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"contains {entry}, outside of the plugin directory")
+                if parts[0] in ["opensearch", "bin", "config"] and len(parts) > 1:
+                    raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"contains {parts[0]} files")
+            if self.SECURITY_POLICY in names:
+                raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, "requests additional permissions")
+            if self.DESCRIPTOR not in names:
+                raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"does not contain {self.DESCRIPTOR}")
+            # like java.util.Properties, which the CLI loads the descriptor with, any byte is a valid ISO-8859-1 character
+            descriptor = PropertiesFile(zip.read(self.DESCRIPTOR).decode("ISO-8859-1"))
+
+        for key in ["name", "description", "version", "classname", "java.version", "opensearch.version"]:
+            if not descriptor.get_value(key):
+                raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"does not set {key} in {self.DESCRIPTOR}")
+        if descriptor.get_value("opensearch.version") != self.version:
+            raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"was built for OpenSearch {descriptor.get_value('opensearch.version')}, not {self.version}")
+        if os.path.exists(os.path.join(self.archive_path, "modules", descriptor.get_value("name"))):
+            raise OpenSearchPluginInstaller.UnsupportedPluginError(plugin_zip, f"has the name of the {descriptor.get_value('name')} module")
+        return descriptor
+
+    def _check(self, plugin_zips: Dict[str, str], folders: Dict[str, str]) -> None:
+        # plugins must be installed after the plugins they extend, leave them to the CLI when those are
+        changed = True
+        while changed:
+            changed = False
+            available = set(os.listdir(self.plugins_dir)) | set(folders.values()) | {self.descriptors[plugin_zips[name]].get_value("name") for name in folders}
+            for name in list(folders):
+                descriptor = self.descriptors[plugin_zips[name]]
+                extended = [plugin.strip() for plugin in descriptor.get_value("extended.plugins", "").split(",") if plugin.strip()]
+                missing = [plugin for plugin in extended if plugin not in available]
+                if missing:
+                    logging.info(f"Installing {name} with the plugin CLI, {os.path.basename(plugin_zips[name])} extends {', '.join(missing)}")
+                    del folders[name]
+                    changed = True
+
+    def _extract(self, plugin_zip: str, staging: str) -> None:
+        with ZipFile(plugin_zip) as zip:
+            zip.extractall(staging)
+        for dir, dirs, files in os.walk(staging):
+            os.chmod(dir, self.DIR_MODE)
+            for file_name in files:
+                os.chmod(os.path.join(dir, file_name), self.FILE_MODE)
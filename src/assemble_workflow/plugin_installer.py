@@ -0,0 +1,90 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+import os
+import shutil
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+"""
+This class is responsible for installing plugins into a distribution without its plugin CLI, see --fast-plugin-install.
+The plugin zips are validated first, then extracted concurrently into staging directories next to the plugins,
+and each staging directory is moved into place atomically, so that a plugin is either fully installed or not at all.
+Plugins that cannot be installed this way are left to the plugin CLI.
+"""
+
+
+class PluginInstaller(ABC):
+    class UnsupportedPluginError(Exception):
+        def __init__(self, plugin_zip: str, reason: str) -> None:
+            self.plugin_zip = plugin_zip
+            super().__init__(f"{os.path.basename(plugin_zip)} {reason}")
+
+    def __init__(self, plugins_dir: str, workers: int = None) -> None:
+        self.plugins_dir = plugins_dir
+        self.workers = workers or os.cpu_count() or 1
+
+    def install(self, plugin_zips: Dict[str, str]) -> List[str]:
+        """
+        Install plugins by component name from their zips, and return the names of the components installed.
+        The others need to be installed with the plugin CLI.
+        """
+        started = time.monotonic()
+        os.makedirs(self.plugins_dir, exist_ok=True)
+        folders: Dict[str, str] = {}
+        for name, plugin_zip in plugin_zips.items():
+            try:
+                folder = self.folder(plugin_zip)
+                if folder in folders.values() or os.path.exists(os.path.join(self.plugins_dir, folder)):
+                    raise PluginInstaller.UnsupportedPluginError(plugin_zip, f"installs into plugins/{folder}, which is already used")
+                folders[name] = folder
+            except PluginInstaller.UnsupportedPluginError as e:
+                logging.info(f"Installing {name} with the plugin CLI, {e}")
+
+        self._check(plugin_zips, folders)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="install") as executor:
+            futures = {name: executor.submit(self.__install, plugin_zips[name], folder) for name, folder in folders.items()}
+            for future in futures.values():
+                future.result()
+        if futures:
+            logging.info(f"Installed {len(futures)} plugin(s) in {time.monotonic() - started:.1f}s")
+        return list(futures)
+
+    @abstractmethod
+    def folder(self, plugin_zip: str) -> str:
+        """
+        Validate a plugin zip and return the folder of the plugin, raise UnsupportedPluginError for plugins left to the CLI.
+        """
+        pass
+
+    def _check(self, plugin_zips: Dict[str, str], folders: Dict[str, str]) -> None:
+        """
+        Remove the plugins that cannot be installed along with the others from folders.
+        """
+        pass
+
+    @abstractmethod
+    def _extract(self, plugin_zip: str, staging: str) -> None:
+        pass
+
+    def __install(self, plugin_zip: str, folder: str) -> None:
+        started = time.monotonic()
+        # the CLIs also stage plugins in hidden directories, which are not loaded as plugins
+        staging = tempfile.mkdtemp(prefix=".installing-", dir=self.plugins_dir)
+        try:
+            os.chmod(staging, 0o755)
+            self._extract(plugin_zip, staging)
+            os.rename(staging, os.path.join(self.plugins_dir, folder))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        logging.info(f"Installed {os.path.basename(plugin_zip)} into plugins/{folder} in {time.monotonic() - started:.1f}s")
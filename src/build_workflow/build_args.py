@@ -7,9 +7,13 @@
 
 import argparse
 import logging
+import os
+import re
 import sys
 from typing import IO, List
 
+from build_workflow.build_incremental import BuildIncremental
+
 
 class BuildArgs:
     SUPPORTED_PLATFORMS = ["linux", "darwin", "windows"]
@@ -26,8 +30,27 @@ class BuildArgs:
     platform: str
     architecture: str
     distribution: str
+    distributions: List[str]
     continue_on_error: bool
     incremental: bool
+    parallel: int
+    build_cache: str
+    build_cache_size: int
+    prefetch: int
+    move_artifacts: bool
+    plan: bool
+    cpus: int
+    memory: float
+    resource_history: str
+    resume: bool
+    path_filter: List[str]
+    workers: List[str]
+    gradle_daemons: bool
+    gradle_user_home: str
+    yarn_cache: bool
+    yarn_cache_dir: str
+    yarn_cache_size: int
+    output_store: str
 
     def __init__(self) -> None:
         parser = argparse.ArgumentParser(description="Build an OpenSearch Distribution")
@@ -84,8 +107,7 @@ class BuildArgs:
             "-d",
             "--distribution",
             type=str,
-            choices=self.SUPPORTED_DISTRIBUTIONS,
-            help="Distribution to build.",
+            help=f"Distribution to build, or a comma-separated list of distributions built from the same checkouts ({', '.join(self.SUPPORTED_DISTRIBUTIONS)}).",
             default="tar",
             dest="distribution"
         )
@@ -96,6 +118,128 @@ class BuildArgs:
             action="store_true",
             help="Do not fail the distribution build on any plugin component failure.",
         )
+        parser.add_argument(
+            "--parallel",
+            dest="parallel",
+            type=int,
+            default=1,
+            help="Number of components to build concurrently, following their dependencies.",
+        )
+        parser.add_argument(
+            "--build-cache",
+            dest="build_cache",
+            type=str,
+            help="Directory of a local cache of component build artifacts, reused when the inputs of a build are unchanged.",
+        )
+        parser.add_argument(
+            "--build-cache-size",
+            dest="build_cache_size",
+            type=int,
+            default=50,
+            help="Maximum size of the build cache in GB, least recently used entries are evicted first.",
+        )
+        parser.add_argument(
+            "--prefetch",
+            dest="prefetch",
+            type=int,
+            default=0,
+            help="Number of upcoming components to check out in the background while a component builds.",
+        )
+        parser.add_argument(
+            "--move-artifacts",
+            dest="move_artifacts",
+            default=False,
+            action="store_true",
+            help="Move artifacts into the output directory instead of copying them, the working directory is discarded anyway.",
+        )
+        parser.add_argument(
+            "--output-store",
+            dest="output_store",
+            type=str,
+            metavar="DIR",
+            help="Store each artifact once by content in DIR and hard link it into the output directory, on the same file system.",
+        )
+        parser.add_argument(
+            "--plan",
+            dest="plan",
+            default=False,
+            action="store_true",
+            help="Show which components would be built, in which order and why, without building them.",
+        )
+        parser.add_argument(
+            "--resume",
+            dest="resume",
+            default=False,
+            action="store_true",
+            help="Resume a build that did not finish in the same output directory, only building the components it did not build.",
+        )
+        parser.add_argument(
+            "--cpus",
+            dest="cpus",
+            type=int,
+            help="Number of CPUs shared by concurrent component builds, requires --parallel.",
+        )
+        parser.add_argument(
+            "--memory",
+            dest="memory",
+            type=float,
+            help="Memory in GB shared by concurrent component builds, requires --parallel.",
+        )
+        parser.add_argument(
+            "--resource-history",
+            dest="resource_history",
+            type=str,
+            default=os.path.join(os.path.expanduser("~"), ".opensearch-build", "build-resources.json"),
+            help="File with the peak memory of earlier component builds, used to estimate the memory of the next ones.",
+        )
+        parser.add_argument(
+            "--gradle-daemons",
+            dest="gradle_daemons",
+            action="store_true",
+            default=False,
+            help="Share warm Gradle daemons between component builds, stopped at the end of the build.",
+        )
+        parser.add_argument(
+            "--gradle-user-home",
+            dest="gradle_user_home",
+            type=str,
+            default=os.path.join(os.path.expanduser("~"), ".opensearch-build", "gradle"),
+            help="GRADLE_USER_HOME of the builds with --gradle-daemons, default is ~/.opensearch-build/gradle.",
+        )
+        parser.add_argument(
+            "--yarn-cache",
+            dest="yarn_cache",
+            action="store_true",
+            default=False,
+            help="Share the yarn and npm package caches between component builds, removed at the end of the build.",
+        )
+        parser.add_argument(
+            "--yarn-cache-dir",
+            dest="yarn_cache_dir",
+            type=str,
+            help="Share the yarn and npm package caches between component builds in a directory kept across builds, implies --yarn-cache.",
+        )
+        parser.add_argument(
+            "--yarn-cache-size",
+            dest="yarn_cache_size",
+            type=int,
+            default=20,
+            help="Maximum size of the yarn cache in --yarn-cache-dir in GB, least recently used packages are evicted first.",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            nargs="+",
+            metavar="HOST:PORT",
+            help="Build components from source on these build workers (see build_worker.sh), one component per worker at a time.",
+        )
+        parser.add_argument(
+            "--path-filter",
+            dest="path_filter",
+            nargs="*",
+            metavar="GLOB",
+            help=f"With --incremental, do not rebuild components whose changes only match these path globs, without GLOB: {' '.join(BuildIncremental.IGNORE_PATHS)}.",
+        )
         group = parser.add_mutually_exclusive_group()
         group.add_argument(
             "-c",
@@ -115,6 +259,32 @@ class BuildArgs:
         )
 
         args = parser.parse_args()
+        if args.parallel < 1:
+            parser.error("--parallel must be at least 1")
+        if args.prefetch < 0:
+            parser.error("--prefetch must not be negative")
+        if args.move_artifacts and args.keep:
+            parser.error("--move-artifacts cannot be combined with --keep")
+        distributions = args.distribution.split(",")
+        for distribution in distributions:
+            if distribution not in self.SUPPORTED_DISTRIBUTIONS:
+                parser.error(f"argument -d/--distribution: invalid choice: '{distribution}' (choose from {', '.join(self.SUPPORTED_DISTRIBUTIONS)})")
+        if len(set(distributions)) != len(distributions):
+            parser.error("--distribution must not repeat a distribution")
+        if len(distributions) > 1 and args.incremental:
+            parser.error("--incremental supports a single --distribution")
+        for worker in args.workers or []:
+            if not re.fullmatch(r"[^:\s]+:\d+", worker):
+                parser.error(f"invalid build worker '{worker}', expected HOST:PORT")
+        if args.path_filter is not None and not args.incremental:
+            parser.error("--path-filter requires --incremental")
+        if args.cpus is not None and args.cpus < 1:
+            parser.error("--cpus must be at least 1")
+        if args.memory is not None and args.memory <= 0:
+            parser.error("--memory must be positive")
+        if (args.cpus is not None or args.memory is not None) and args.parallel < 2:
+            parser.error("--cpus and --memory require --parallel")
+
         self.logging_level = args.logging_level
         self.manifest = args.manifest
         self.ref_manifest = args.manifest.name + ".lock" if args.lock else None
@@ -123,10 +293,31 @@ class BuildArgs:
         self.keep = args.keep
         self.platform = args.platform
         self.architecture = args.architecture
-        self.distribution = args.distribution
+        self.distributions = distributions
+        # the first distribution is built like a single distribution, the shared artifacts are fanned out to the others
+        self.distribution = distributions[0]
         self.script_path = sys.argv[0].replace("/src/run_build.py", "/build.sh")
         self.continue_on_error = args.continue_on_error
         self.incremental = args.incremental
+        self.parallel = args.parallel
+        self.build_cache = args.build_cache
+        self.build_cache_size = args.build_cache_size
+        self.prefetch = args.prefetch
+        self.move_artifacts = args.move_artifacts
+        self.plan = args.plan
+        self.cpus = args.cpus
+        self.memory = args.memory
+        self.resource_history = args.resource_history
+        self.resume = args.resume
+        # --path-filter without globs ignores the default paths, None does not filter paths
+        self.path_filter = BuildIncremental.IGNORE_PATHS if args.path_filter == [] else args.path_filter
+        self.workers = args.workers
+        self.gradle_daemons = args.gradle_daemons
+        self.gradle_user_home = args.gradle_user_home
+        self.yarn_cache = args.yarn_cache or args.yarn_cache_dir is not None
+        self.yarn_cache_dir = args.yarn_cache_dir
+        self.yarn_cache_size = args.yarn_cache_size
+        self.output_store = args.output_store
 
     def component_command(self, name: str) -> str:
         return " ".join(
@@ -0,0 +1,97 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_checks import BuildArtifactChecks
+from build_workflow.build_target import BuildTarget
+
+"""
+This class is responsible for running artifact checks on a pool of worker threads, so that checks overlap with copying artifacts.
+Checks are grouped by component, and all failures of a component are reported together when waiting for it.
+"""
+
+
+class BuildArtifactChecksPool:
+    class BuildArtifactChecksFailedError(Exception):
+        def __init__(self, component_name: str, errors: List[Exception], paths: List[str]) -> None:
+            self.component_name = component_name
+            self.errors = errors
+            self.paths = paths
+            details = "\n".join(f"  {error}" for error in errors)
+            super().__init__(f"{len(errors)} invalid artifact(s) in {component_name}:\n{details}")
+
+    def __init__(self, target: BuildTarget, workers: int = None) -> None:
+        self.target = target
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="check")
+        self.futures: Dict[str, List[Tuple[str, concurrent.futures.Future]]] = {}
+        self.lock = threading.Lock()
+        self.checked = 0
+        self.failed = 0
+        self.check_time = 0.0
+        self.started: float = None
+        self.finished: float = None
+
+    def submit(self, component_name: str, artifact_type: str, path: str) -> None:
+        """
+        Schedule a check of an artifact, a no-op for artifact types that are not checked.
+        """
+        instance = BuildArtifactChecks.create(self.target, artifact_type)
+        if not instance:
+            return
+        with self.lock:
+            if self.started is None:
+                self.started = time.monotonic()
+            self.futures.setdefault(component_name, []).append((path, self.executor.submit(self.__check, instance, path)))
+
+    def wait(self, component_name: str) -> None:
+        """
+        Wait for all checks of a component, and raise a single error listing every invalid artifact and its path.
+        """
+        with self.lock:
+            futures = self.futures.pop(component_name, [])
+        errors: List[Exception] = []
+        paths: List[str] = []
+        for path, future in futures:
+            try:
+                future.result()
+            except Exception as e:
+                errors.append(e)
+                paths.append(path)
+        if errors:
+            raise BuildArtifactChecksPool.BuildArtifactChecksFailedError(component_name, errors, paths)
+
+    def log_summary(self) -> None:
+        with self.lock:
+            if not self.checked:
+                return
+            elapsed = (self.finished or time.monotonic()) - self.started
+            logging.info(
+                f"Checked {self.checked} artifact(s) in {elapsed:.2f}s ({self.check_time:.2f}s across {self.workers} workers), {self.failed} invalid"
+            )
+
+    def __check(self, instance: BuildArtifactCheck, path: str) -> None:
+        start = time.monotonic()
+        try:
+            instance.check(path)
+        except Exception:
+            with self.lock:
+                self.failed += 1
+            raise
+        finally:
+            end = time.monotonic()
+            with self.lock:
+                self.checked += 1
+                self.check_time += end - start
+                self.finished = end
@@ -0,0 +1,148 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from typing import Dict, List
+
+from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
+from build_workflow.component_graph import ComponentGraph
+from manifests.input_manifest import InputManifest
+from system.file_lock import FileLock
+
+"""
+This class is responsible for caching the artifacts produced by component builds in a local directory.
+Entries are keyed by a hash of everything that affects the output of a build: the component commit ID, the content of its build script,
+the build target (version, qualifier, snapshot, platform, architecture, distribution and patches) and the commit IDs of all the components it
+transitively depends on, including the core component. Any earlier build with the same inputs can be reused, not just the previous one.
+The least recently used entries are evicted once the total size of the cache exceeds its limit.
+"""
+
+
+class BuildCache:
+    ENTRY_FILE = "entry.json"
+    ARTIFACTS_DIR = "artifacts"
+
+    def __init__(self, path: str, max_size: int, manifest: InputManifest) -> None:
+        self.path = os.path.realpath(path)
+        self.max_size = max_size
+        graph = ComponentGraph.from_manifest(manifest)
+        self.dependencies: Dict[str, List[str]] = {name: sorted(dependencies) for name, dependencies in graph.transitive_dependencies.items()}
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, component_name: str, commit_id: str, build_script: str, target: BuildTarget, build_recorder: BuildRecorder) -> str:
+        """
+        Compute the cache key of a component build, or None when the commit ID of one of its dependencies is unknown.
+        """
+        dependencies = {}
+        for dependency in self.dependencies.get(component_name, []):
+            dependencies[dependency] = build_recorder.commit_id(dependency)
+            if dependencies[dependency] is None:
+                logging.info(f"Not caching {component_name}, the commit ID of {dependency} is unknown")
+                return None
+
+        with open(build_script, "rb") as f:
+            build_script_digest = hashlib.sha256(f.read()).hexdigest()
+
+        inputs = {
+            "component": component_name,
+            "commit_id": commit_id,
+            "build_script": build_script_digest,
+            "version": target.version,
+            "qualifier": target.qualifier,
+            "snapshot": target.snapshot,
+            "platform": target.platform,
+            "architecture": target.architecture,
+            "distribution": target.distribution,
+            # the compatible versions the build is patching, passed to the build script
+            "patches": target.patches,
+            "dependencies": dependencies,
+        }
+        return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key)
+
+    def restore(self, key: str, dest: str) -> bool:
+        """
+        Copy the artifacts of a cached build into dest, returns False on a cache miss.
+        """
+        entry = self.entry_path(key)
+        entry_file = os.path.join(entry, self.ENTRY_FILE)
+        # evict deletes entries holding the same lock, an entry is never restored while it is being deleted
+        with FileLock(os.path.join(self.path, ".lock")):
+            if not os.path.isfile(entry_file):
+                return False
+            with open(entry_file, "r") as f:
+                size = json.load(f)["size"]
+            artifacts = os.path.join(entry, self.ARTIFACTS_DIR)
+            if not os.path.isdir(artifacts) or self.__size(artifacts) != size:
+                logging.warning(f"Removing incomplete build cache entry {entry}")
+                shutil.rmtree(entry, ignore_errors=True)
+                return False
+            logging.info(f"Restoring {dest} from build cache entry {entry}")
+            os.utime(entry)
+            shutil.copytree(artifacts, dest, dirs_exist_ok=True)
+        return True
+
+    def store(self, key: str, src: str) -> None:
+        """
+        Copy the artifacts of a build into the cache, then evict the least recently used entries.
+        """
+        entry = self.entry_path(key)
+        if os.path.isdir(entry):
+            return
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        staging = tempfile.mkdtemp(dir=os.path.dirname(entry), prefix=f".{key}-")
+        try:
+            shutil.copytree(src, os.path.join(staging, self.ARTIFACTS_DIR))
+            with open(os.path.join(staging, self.ENTRY_FILE), "w") as f:
+                json.dump({"key": key, "size": self.__size(staging), "created": time.time()}, f)
+            os.rename(staging, entry)
+            logging.info(f"Stored {src} in build cache entry {entry}")
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(entry):
+                raise
+        self.evict()
+
+    def evict(self) -> None:
+        with FileLock(os.path.join(self.path, ".lock")):
+            entries = []
+            for prefix in os.listdir(self.path):
+                prefix_path = os.path.join(self.path, prefix)
+                if prefix.startswith(".") or not os.path.isdir(prefix_path):
+                    continue
+                for name in os.listdir(prefix_path):
+                    entry_file = os.path.join(prefix_path, name, self.ENTRY_FILE)
+                    if name.startswith(".") or not os.path.isfile(entry_file):
+                        continue
+                    with open(entry_file, "r") as f:
+                        size = json.load(f)["size"]
+                    entries.append((os.path.getmtime(os.path.join(prefix_path, name)), size, os.path.join(prefix_path, name)))
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries):
+                if total <= self.max_size:
+                    break
+                logging.info(f"Evicting build cache entry {entry}")
+                shutil.rmtree(entry, ignore_errors=True)
+                total -= size
+
+    @classmethod
+    def __size(cls, path: str) -> int:
+        size = 0
+        for dir, _, files in os.walk(path):
+            for file_name in files:
+                size += os.path.getsize(os.path.join(dir, file_name))
+        return size
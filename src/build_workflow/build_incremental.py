@@ -5,26 +5,38 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import fnmatch
 import logging
 import os
-from typing import List
+import subprocess
+from typing import Dict, List
 
+from build_workflow.component_graph import ComponentGraph
+from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
-from manifests.input_manifest import InputManifest
+from manifests.input_manifest import InputComponent, InputManifest
 from system.os import current_platform
 
 
 class BuildIncremental:
-    def __init__(self, input_manifest: InputManifest, distribution: str, platform: str):
+    # changes to these paths do not change build artifacts, see --path-filter
+    IGNORE_PATHS = ["*.md", ".github/*", "docs/*", "release-notes/*", "src/test/*", "*/src/test/*"]
+
+    def __init__(self, input_manifest: InputManifest, distribution: str, platform: str, ignore_paths: List[str] = None):
         self.distribution = distribution
         self.input_manifest = input_manifest
         self.platform = platform or current_platform()
+        # when set, components with only changes to ignored paths are not rebuilt
+        self.ignore_paths = ignore_paths
+        # why each component needs to be rebuilt, see --plan
+        self.reasons: Dict[str, str] = {}
 
     # Given input manifest and return a list of what components changed and added.
     def commits_diff(self, input_manifest: InputManifest) -> List[str]:
         build_manifest_path = os.path.join(self.distribution, "builds", input_manifest.build.filename, "manifest.yml")
         if not os.path.exists(build_manifest_path):
             logging.info("Previous build manifest does not exist. Rebuilding Core.")
+            self.reasons[input_manifest.build.name.replace(" ", "-")] = "previous build manifest does not exist"
             return [input_manifest.build.name.replace(" ", "-")]
         previous_build_manifest = BuildManifest.from_path(build_manifest_path)
         stable_input_manifest = input_manifest.stable()
@@ -35,6 +47,7 @@ class BuildIncremental:
         )
         if previous_build_manifest.build.version != stable_input_manifest_version:
             logging.info("The version of previous build manifest doesn't match the current input manifest. Rebuilding Core.")
+            self.reasons[input_manifest.build.name.replace(" ", "-")] = f"version changed from {previous_build_manifest.build.version} to {stable_input_manifest_version}"
             return [input_manifest.build.name.replace(" ", "-")]
         components = []
         for component in stable_input_manifest.components.select():
@@ -44,31 +57,55 @@ class BuildIncremental:
             if component.name not in previous_build_manifest.components:
                 components.append(component.name)
                 logging.info(f"Adding {component.name} since it is missing from previous build manifest")
+                self.reasons[component.name] = "missing from previous build manifest"
                 continue
             if component.ref != previous_build_manifest.components[component.name].commit_id:  # type: ignore[attr-defined]
+                if self.ignore_paths is not None and self.__only_ignored_paths_changed(component, previous_build_manifest.components[component.name].commit_id):  # type: ignore[attr-defined]
+                    continue
                 components.append(component.name)
                 logging.info(f"Adding {component.name} because it has different commit ID and needs to be rebuilt.")
+                self.reasons[component.name] = f"commit changed from {previous_build_manifest.components[component.name].commit_id} to {component.ref}"  # type: ignore[attr-defined]
                 continue
         return components
 
+    # Given a component with a different commit ID, check whether the changes since the previous build only touch ignored paths.
+    def __only_ignored_paths_changed(self, component: InputComponent, previous_commit_id: str) -> bool:
+        ignore_paths = self.ignore_paths + (getattr(component, "ignore_paths", None) or [])
+        try:
+            paths = GitRepository.changed_paths(component.repository, previous_commit_id, component.ref)  # type: ignore[attr-defined]
+        except subprocess.CalledProcessError as e:
+            logging.info(f"Unable to list the changes of {component.name} since {previous_commit_id}, rebuilding: {e}")
+            return False
+        changed_paths = [path for path in paths if not any(fnmatch.fnmatch(path, glob) for glob in ignore_paths)]
+        if changed_paths:
+            logging.info(f"{component.name} has changes to {len(changed_paths)} path(s) that are not ignored, e.g. {changed_paths[0]}")
+            return False
+        logging.info(f"Skipping {component.name}, the previous build is reused because only ignored paths changed: {', '.join(paths)}")
+        return True
+
     # Given updated plugins and look into the depends_on of all components to finalize a list of rebuilding components.
     def rebuild_plugins(self, changed_plugins: List, input_manifest: InputManifest) -> List[str]:
         if not changed_plugins:
             return []
 
+        graph = ComponentGraph(input_manifest.components.select(), input_manifest.build.name.replace(" ", "-"))
+
         if any(core in changed_plugins for core in ("OpenSearch", "OpenSearch-Dashboards")):
             logging.info("Core engine has new changes, rebuilding all components.")
-            return [component.name for component in input_manifest.components.select()]
+            for name in graph.names:
+                self.reasons.setdefault(name, "core engine changed")
+            return graph.names
 
-        queue = changed_plugins
-        rebuild_list = []
+        rebuild_list = graph.dependents_of(changed_plugins)
+        rebuild_list.extend(plugin for plugin in changed_plugins if plugin not in rebuild_list)
+        for plugin in rebuild_list:
+            changed_dependencies = [dependency for dependency in graph.transitive_dependencies.get(plugin, []) if dependency in changed_plugins]
+            if changed_dependencies:
+                self.reasons.setdefault(plugin, f"depends on {', '.join(changed_dependencies)}")
 
-        rebuild_list.append("OpenSearch-Dashboards") if input_manifest.build.filename == "opensearch-dashboards" else rebuild_list
-        while queue:
-            plugin = queue.pop(0)
-            rebuild_list.append(plugin) if plugin not in rebuild_list else rebuild_list
-            for dependent_plugin in input_manifest.plugins_depend_on(plugin):
-                queue.append(dependent_plugin) if dependent_plugin not in rebuild_list else queue
+        if input_manifest.build.filename == "opensearch-dashboards" and "OpenSearch-Dashboards" not in rebuild_list:
+            rebuild_list.insert(0, "OpenSearch-Dashboards")
+            self.reasons.setdefault("OpenSearch-Dashboards", "plugins are built with OpenSearch-Dashboards")
 
         logging.info(f"Rebuilding list is {rebuild_list}")
         return rebuild_list
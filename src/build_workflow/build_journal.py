@@ -0,0 +1,98 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, List
+
+from build_workflow.build_target import BuildTarget
+
+"""
+This class is responsible for journaling the progress of a build, so that a build that did not finish can be resumed, see --resume.
+The journal is an append-only file of JSON lines next to the build manifest. The first line identifies the build, and each
+following line is the build manifest entry of a component, written once the component has been built and its artifacts recorded.
+A line that was only partially written when the build died is ignored. The journal is removed once the build manifest is written.
+"""
+
+
+class BuildJournal:
+    FILENAME = "build-journal.jsonl"
+
+    def __init__(self, target: BuildTarget) -> None:
+        self.target = target
+        self.lock = threading.Lock()
+        self.started = False
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.target.output_dir, self.FILENAME)
+
+    @property
+    def build(self) -> Dict[str, Any]:
+        return {
+            "name": self.target.name,
+            "version": self.target.opensearch_version,
+            "platform": self.target.platform,
+            "architecture": self.target.architecture,
+            "distribution": self.target.distribution if self.target.distribution else "tar",
+        }
+
+    def start(self) -> None:
+        """
+        Start a new journal, so that a build that dies before recording any component cannot resume an earlier one.
+        """
+        with self.lock:
+            self.__start()
+
+    def append(self, component: Dict[str, Any]) -> None:
+        with self.lock:
+            if not self.started:
+                # a new build starts a new journal, a resumed build continues it
+                self.__start()
+            with open(self.path, "a") as f:
+                f.write(json.dumps({"component": component}) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        Return the components recorded by an earlier run of the same build, components built next are appended to the same journal.
+        """
+        with self.lock:
+            if not os.path.isfile(self.path):
+                logging.info(f"No build journal found at {self.path}, building all components")
+                return []
+            entries = []
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        logging.warning(f"Ignoring a partially written entry in {self.path}")
+            if not entries or entries[0].get("build", None) != self.build:
+                logging.warning(f"Ignoring {self.path}, it was written by a different build")
+                return []
+            # rewrite the journal without any partially written entry before appending to it
+            with open(self.path, "w") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry) + "\n")
+            self.started = True
+            return [entry["component"] for entry in entries[1:] if "component" in entry]
+
+    def remove(self) -> None:
+        with self.lock:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+            self.started = False
+
+    def __start(self) -> None:
+        os.makedirs(self.target.output_dir, exist_ok=True)
+        with open(self.path, "w") as f:
+            f.write(json.dumps({"build": self.build}) + "\n")
+        self.started = True
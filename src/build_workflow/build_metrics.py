@@ -0,0 +1,136 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List
+
+from build_workflow.build_target import BuildTarget
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+"""
+This class is responsible for timing the phases of each component build (checkout, build, export and check).
+Each phase records its wall time and the CPU time used by child processes (e.g. Gradle) while it ran.
+Child processes are accounted for the whole process, so CPU times overlap when components are built concurrently.
+Metrics are written to build-metrics.json next to the build manifest, and durations of a previous build can be read back.
+"""
+
+
+class BuildMetrics:
+    FILENAME = "build-metrics.json"
+    PHASES = ["checkout", "build", "export", "check"]
+
+    def __init__(self, target: BuildTarget) -> None:
+        self.target = target
+        self.components: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+
+    @contextmanager
+    def phase(self, component_name: str, phase: str) -> Generator[None, None, None]:
+        wall = time.monotonic()
+        cpu = self.__children_cpu()
+        status = "failed"
+        try:
+            yield
+            status = "success"
+        finally:
+            with self.lock:
+                component = self.components.setdefault(component_name, {"name": component_name, "status": "success", "phases": {}})
+                component["phases"][phase] = {
+                    "wall": round(time.monotonic() - wall, 3),
+                    "cpu": round(self.__children_cpu() - cpu, 3),
+                }
+                if status == "failed":
+                    component["status"] = status
+
+    def record(self, component_name: str, key: str, value: Any) -> None:
+        with self.lock:
+            component = self.components.setdefault(component_name, {"name": component_name, "status": "success", "phases": {}})
+            component[key] = value
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            components = []
+            for component in self.components.values():
+                data = dict(component)
+                data["wall"] = round(sum(phase["wall"] for phase in component["phases"].values()), 3)
+                data["cpu"] = round(sum(phase["cpu"] for phase in component["phases"].values()), 3)
+                components.append(data)
+            return {
+                "build": {
+                    "id": self.target.build_id,
+                    "name": self.target.name,
+                    "version": self.target.opensearch_version,
+                    "platform": self.target.platform,
+                    "architecture": self.target.architecture,
+                    "distribution": self.target.distribution if self.target.distribution else "tar",
+                },
+                "wall": round(time.monotonic() - self.started, 3),
+                "components": components,
+            }
+
+    def write(self) -> str:
+        path = os.path.join(self.target.output_dir, self.FILENAME)
+        os.makedirs(self.target.output_dir, exist_ok=True)
+        # a build killed while writing must not leave truncated metrics for the next one
+        with open(f"{path}.tmp", "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(f"{path}.tmp", path)
+        logging.info(f"Created build metrics {path}")
+        return path
+
+    @property
+    def summary(self) -> List[str]:
+        """
+        A table of components and the time spent in each phase, slowest components first.
+        """
+        data = self.to_dict()
+        components = sorted(data["components"], key=lambda component: float(component["wall"]), reverse=True)
+        width = max([len("Component")] + [len(component["name"]) for component in components])
+        header = f"{'Component':<{width}}" + "".join(f"{phase:>10}" for phase in self.PHASES + ["total", "cpu"]) + "  status"
+        lines = [header]
+        for component in components:
+            phases = component["phases"]
+            times = [phases[phase]["wall"] if phase in phases else None for phase in self.PHASES] + [component["wall"], component["cpu"]]
+            lines.append(f"{component['name']:<{width}}" + "".join(f"{'-' if value is None else f'{value:.1f}s':>10}" for value in times) + f"  {component['status']}")
+        lines.append(f"Built {len(components)} component(s) in {data['wall']:.1f}s")
+        return lines
+
+    def log_summary(self) -> None:
+        for line in self.summary:
+            logging.info(line)
+
+    @classmethod
+    def durations(cls, path: str) -> Dict[str, float]:
+        """
+        Wall time of each component in the metrics of an earlier build, or nothing when there are none or they are invalid.
+        """
+        if not os.path.isfile(path):
+            return {}
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except ValueError as e:
+            logging.warning(f"Ignoring the invalid build metrics {path}: {e}")
+            return {}
+        return {component["name"]: sum(phase["wall"] for phase in component["phases"].values()) for component in data.get("components", [])}
+
+    @classmethod
+    def __children_cpu(cls) -> float:
+        if not resource:  # pragma: no cover
+            return 0.0
+        usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+        return usage.ru_utime + usage.ru_stime
@@ -0,0 +1,110 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import logging
+import os
+import threading
+import uuid
+
+from system.checksums import file_digests
+from system.file_copier import FileCopier
+
+"""
+This class is responsible for storing the artifacts of builds once by content, see --output-store.
+Each artifact is stored as a blob named after its sha256, and the output directory of a build is made of hard links to
+the blobs, so identical artifacts of consecutive builds, e.g. unchanged plugins and maven poms, share the same disk space.
+The number of links of a blob counts the build outputs that reference it: once the build directories that reference a blob
+are removed or overwritten, only the store links to it and it is collected by the next build with the same store.
+The store must be on the same file system as the build outputs. Artifacts in build outputs are shared, do not modify them in place.
+"""
+
+
+class BuildOutputStore:
+    BLOBS_DIR = "blobs"
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.realpath(path)
+        self.lock = threading.Lock()
+        self.stored = 0
+        self.deduplicated = 0
+        self.saved = 0
+        os.makedirs(os.path.join(self.path, self.BLOBS_DIR), exist_ok=True)
+
+    def blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, self.BLOBS_DIR, digest[:2], digest)
+
+    def store(self, src: str, dest: str, file_copier: FileCopier, digest: str = None) -> bool:
+        """
+        Materialize src at dest as a link to its blob, storing the blob when it is new. Returns True when the blob existed.
+        Pass the sha256 of src when it is already known to avoid reading it again.
+        """
+        digest = digest or self.digest(src)
+        blob = self.blob_path(digest)
+        if self.__link(blob, dest):
+            with self.lock:
+                self.stored += 1
+                self.deduplicated += 1
+                self.saved += os.path.getsize(dest)
+            return True
+
+        # the copier replaces dest rather than writing through it, dest may be a link to the blob of an earlier artifact
+        file_copier.copy(src, dest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        try:
+            os.link(dest, blob)
+        except FileExistsError:
+            # stored by a concurrent build in the meantime
+            self.__link(blob, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            logging.warning(f"Not storing {dest}, {self.path} is on another file system")
+        with self.lock:
+            self.stored += 1
+        return False
+
+    def gc(self) -> int:
+        """
+        Remove the blobs that are no longer linked from any build output, and return how many were removed.
+        """
+        removed = freed = 0
+        blobs_dir = os.path.join(self.path, self.BLOBS_DIR)
+        for dir, _, files in os.walk(blobs_dir):
+            for file_name in files:
+                blob = os.path.join(dir, file_name)
+                try:
+                    stat = os.stat(blob)
+                    if stat.st_nlink == 1:
+                        os.unlink(blob)
+                        removed += 1
+                        freed += stat.st_size
+                except FileNotFoundError:
+                    continue
+        if self.stored:
+            logging.info(f"Stored {self.stored} artifact(s) in {self.path}, {self.deduplicated} of them were already stored, saving {self.saved // 1024 ** 2}MB")
+        if removed:
+            logging.info(f"Removed {removed} blob(s) no longer used by any build from {self.path}, freeing {freed // 1024 ** 2}MB")
+        return removed
+
+    @classmethod
+    def digest(cls, path: str) -> str:
+        return file_digests(path, ["sha256"])["sha256"]
+
+    def __link(self, blob: str, dest: str) -> bool:
+        # a blob may be collected by a concurrent build at any time, in which case it is stored again
+        tmp = f"{dest}.{uuid.uuid4().hex}.tmp"
+        try:
+            os.link(blob, tmp)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            return False
+        os.replace(tmp, dest)
+        return True
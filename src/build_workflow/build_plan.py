@@ -0,0 +1,40 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+from typing import Dict, List
+
+from build_workflow.component_graph import ComponentGraph
+
+"""
+This class is responsible for describing what a build would do without building anything, see --plan.
+Components are listed in the order they can be built, with the reason they are built and what they depend on.
+When durations of a previous build are known, the critical path of the build is shown as well.
+"""
+
+
+class BuildPlan:
+    def __init__(self, graph: ComponentGraph, reasons: Dict[str, str] = {}, durations: Dict[str, float] = {}) -> None:
+        self.graph = graph
+        self.reasons = reasons
+        self.durations = durations
+
+    @property
+    def lines(self) -> List[str]:
+        lines = [f"Building {len(self.graph.names)} component(s):"]
+        for name in self.graph.topological_order():
+            reason = self.reasons.get(name, "selected")
+            dependencies = ", ".join(self.graph.dependencies[name]) or "nothing"
+            lines.append(f"  {name}: {reason}, depends on {dependencies}")
+        if self.durations:
+            path, duration = self.graph.critical_path(self.durations)
+            lines.append(f"Critical path based on the previous build ({duration:.0f}s): {' -> '.join(path)}")
+        return lines
+
+    def log(self) -> None:
+        for line in self.lines:
+            logging.info(line)
@@ -5,31 +5,48 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import copy
 import logging
 import os
-import shutil
-from typing import Any, Dict
+import threading
+from typing import Any, Dict, List
 
-from build_workflow.build_artifact_checks import BuildArtifactChecks
+from build_workflow.build_artifact_checks_pool import BuildArtifactChecksPool
+from build_workflow.build_journal import BuildJournal
+from build_workflow.build_metrics import BuildMetrics
+from build_workflow.build_output_store import BuildOutputStore
 from build_workflow.build_target import BuildTarget
 from git.git_repository import GitRepository
+from git.git_stable_refs import GitStableRefs
 from manifests.build_manifest import BuildManifest
+from manifests.input_manifest import InputComponentFromSource, InputManifest
+from system.checksums import file_digests
+from system.file_copier import FileCopier
 
 
 class BuildRecorder:
-    def __init__(self, target: BuildTarget, build_manifest: BuildManifest = None) -> None:
+    def __init__(self, target: BuildTarget, build_manifest: BuildManifest = None, move_artifacts: bool = False, output_store: BuildOutputStore = None) -> None:
         self.build_manifest = self.BuildManifestBuilder(target, build_manifest)
         self.target = target
         self.name = target.name
+        self.lock = threading.Lock()
+        self.file_copier = FileCopier(move=move_artifacts)
+        # artifacts recorded for another distribution are shared, never moved
+        self.fan_out_copier = FileCopier()
+        self.output_store = output_store
+        self.artifact_checks = BuildArtifactChecksPool(target)
+        self.metrics = BuildMetrics(target)
+        self.journal = BuildJournal(target)
 
     def record_component(self, component_name: str, git_repo: GitRepository) -> None:
-        self.build_manifest.append_component(
-            component_name,
-            self.target.component_version,
-            git_repo.url,
-            git_repo.ref,
-            git_repo.sha,
-        )
+        with self.lock:
+            self.build_manifest.append_component(
+                component_name,
+                self.target.component_version,
+                git_repo.url,
+                git_repo.ref,
+                git_repo.sha,
+            )
 
     def record_artifact(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str) -> None:
         logging.info(f"Recording {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})")
@@ -37,20 +54,112 @@ class BuildRecorder:
         dest_file = os.path.join(self.target.output_dir, artifact_path)
         dest_dir = os.path.dirname(dest_file)
         os.makedirs(dest_dir, exist_ok=True)
-        # Check artifact
-        BuildArtifactChecks.check(self.target, artifact_type, artifact_file)
-        # Copy the file
-        shutil.copyfile(artifact_file, dest_file)
+        # The only pass over the content of the artifact, copies below are done by the kernel or are links
+        digests = file_digests(artifact_file)
+        # Copy the file, or link it when on the same filesystem, or to an identical artifact in the output store
+        if self.output_store:
+            self.output_store.store(artifact_file, dest_file, self.file_copier, digests["sha256"])
+        else:
+            self.file_copier.copy(artifact_file, dest_file)
+        # Check the artifact in the background, see check_artifacts
+        self.artifact_checks.submit(component_name, artifact_type, dest_file)
         # Notify the recorder
-        self.build_manifest.append_artifact(component_name, artifact_type, artifact_path)
+        with self.lock:
+            self.build_manifest.append_artifact(component_name, artifact_type, artifact_path, digests)
+
+    def record_from(self, build_recorder: 'BuildRecorder', component_name: str) -> None:
+        """
+        Record a component built for another distribution, linking its artifacts and log into this output directory.
+        """
+        with build_recorder.lock:
+            component = copy.deepcopy(build_recorder.build_manifest.components_hash[component_name])
+        paths = [path for artifact_paths in component["artifacts"].values() for path in artifact_paths] + ([component["log"]] if component.get("log", None) else [])
+        logging.info(f"Recording {component_name} and {len(paths)} file(s) from {build_recorder.target.output_dir}")
+        for path in paths:
+            dest_file = os.path.join(self.target.output_dir, path)
+            os.makedirs(os.path.dirname(dest_file), exist_ok=True)
+            self.fan_out_copier.copy(os.path.join(build_recorder.target.output_dir, path), dest_file)
+        with self.lock:
+            self.build_manifest.components_hash[component_name] = component
+
+    def log_path(self, component_name: str) -> str:
+        return os.path.join(self.target.output_dir, "logs", f"{component_name}.log.gz")
+
+    def record_log(self, component_name: str, log_file: str) -> None:
+        with self.lock:
+            self.build_manifest.append_log(component_name, os.path.relpath(log_file, self.target.output_dir))
+
+    def check_artifacts(self, component_name: str) -> None:
+        try:
+            self.artifact_checks.wait(component_name)
+        except BuildArtifactChecksPool.BuildArtifactChecksFailedError as e:
+            # the build may continue without the component, its invalid artifacts must not be assembled
+            for path in e.paths:
+                logging.info(f"Removing invalid artifact {path}")
+                with self.lock:
+                    self.build_manifest.remove_artifact(component_name, os.path.relpath(path, self.target.output_dir))
+                if os.path.lexists(path):
+                    os.remove(path)
+            raise
+
+    def journal_component(self, component_name: str) -> None:
+        with self.lock:
+            component = copy.deepcopy(self.build_manifest.components_hash.get(component_name, None))
+        if component:
+            self.journal.append(component)
+
+    def start_journal(self) -> None:
+        self.journal.start()
+
+    def resume(self, input_manifest: InputManifest) -> List[str]:
+        """
+        Replay the components journaled by an earlier run of this build that did not finish, and return their names.
+        Components no longer in the input manifest, or whose repository or ref changed or now resolves to another commit, are not replayed.
+        """
+        journaled = self.journal.read()
+        sources: Dict[str, InputComponentFromSource] = {}
+        for component in journaled:
+            input_component = input_manifest.components.get(component["name"], None)
+            if isinstance(input_component, InputComponentFromSource):
+                sources[component["name"]] = input_component
+        commits = GitStableRefs.resolve([(source.repository, source.ref) for source in sources.values()])
+        components = []
+        for component in journaled:
+            source = sources.get(component["name"], None)
+            if component["name"] not in input_manifest.components:
+                logging.info(f"Not resuming {component['name']}, it is no longer in the input manifest")
+            elif source and (component["repository"], component["ref"], component["commit_id"]) != (source.repository, source.ref, commits[(source.repository, source.ref)][0]):
+                logging.info(f"Not resuming {component['name']}, {source.repository}@{source.ref} changed since it was built from {component['commit_id']}")
+            else:
+                components.append(component)
+        with self.lock:
+            for component in components:
+                self.build_manifest.components_hash[component["name"]] = component
+        return [component["name"] for component in components]
+
+    def commit_id(self, component_name: str) -> str:
+        with self.lock:
+            return self.build_manifest.components_hash.get(component_name, {}).get("commit_id", None)
+
+    def sort_components(self, component_names: List[str]) -> None:
+        with self.lock:
+            self.build_manifest.sort_components(component_names)
 
     def get_manifest(self) -> BuildManifest:
-        return self.build_manifest.to_manifest()
+        with self.lock:
+            return self.build_manifest.to_manifest()
 
     def write_manifest(self) -> None:
         manifest_path = os.path.join(self.target.output_dir, "manifest.yml")
         self.get_manifest().to_file(manifest_path)
         logging.info(f"Created build manifest {manifest_path}")
+        # the build is complete, there is nothing to resume
+        self.journal.remove()
+        self.artifact_checks.log_summary()
+
+    def write_metrics(self) -> None:
+        self.metrics.write()
+        self.metrics.log_summary()
 
     class BuildManifestBuilder:
         def __init__(self, target: BuildTarget, build_manifest: BuildManifest = None) -> None:
@@ -60,8 +169,10 @@ class BuildRecorder:
             if build_manifest:
                 self.data = build_manifest.__to_dict__()
                 self.data["build"]["id"] = target.build_id
+                self.data["schema-version"] = "1.3"
                 for component in build_manifest.components.select():
-                    self.components_hash[component.name] = component.__to_dict__()
+                    # optional fields of the previous manifest, e.g. log, are None when absent
+                    self.components_hash[component.name] = {key: value for key, value in component.__to_dict__().items() if value is not None}
             else:
                 self.data["build"] = {}
                 self.data["build"]["id"] = target.build_id
@@ -70,7 +181,7 @@ class BuildRecorder:
                 self.data["build"]["platform"] = target.platform
                 self.data["build"]["architecture"] = target.architecture
                 self.data["build"]["distribution"] = target.distribution if target.distribution else "tar"
-                self.data["schema-version"] = "1.2"
+                self.data["schema-version"] = "1.3"
 
         def append_component(self, name: str, version: str, repository_url: str, ref: str, commit_id: str) -> None:
             component = {
@@ -84,12 +195,32 @@ class BuildRecorder:
             self.components_hash[name] = component
             logging.info(f"Appended {name} component in build manifest.")
 
-        def append_artifact(self, component: str, type: str, path: str) -> None:
+        def append_artifact(self, component: str, type: str, path: str, digests: Dict[str, str] = None) -> None:
             artifacts = self.components_hash[component]["artifacts"]
             list = artifacts.get(type, [])
             if len(list) == 0:
                 artifacts[type] = list
             list.append(path)
+            if digests:
+                self.components_hash[component].setdefault("digests", {})[path] = digests
+
+        def remove_artifact(self, component: str, path: str) -> None:
+            artifacts = self.components_hash[component]["artifacts"]
+            for type in list(artifacts):
+                if path in artifacts[type]:
+                    artifacts[type].remove(path)
+                    if not artifacts[type]:
+                        del artifacts[type]
+            self.components_hash[component].get("digests", {}).pop(path, None)
+
+        def append_log(self, component: str, path: str) -> None:
+            self.components_hash[component]["log"] = path
+
+        def sort_components(self, component_names: List[str]) -> None:
+            # Components are appended in the order they finish building, which is not deterministic when building concurrently
+            order = {name: index for index, name in enumerate(component_names)}
+            components = sorted(self.components_hash.items(), key=lambda item: order.get(item[0], len(order)))
+            self.components_hash = dict(components)
 
         def to_manifest(self) -> 'BuildManifest':
             # The build manifest expects `components` to be a list, not a hash, so we need to munge things a bit
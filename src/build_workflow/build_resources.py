@@ -0,0 +1,169 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, NamedTuple
+
+import psutil
+
+from manifests.input_manifest import InputComponent
+from system.file_lock import FileLock
+
+"""
+This class is responsible for admitting concurrent component builds against a budget of CPUs and memory.
+The cost of a component is declared with `resources` in the input manifest, or learned from the peak memory observed
+in earlier builds on the same host (see BuildResources.History), or a default.
+A build is only admitted when its cost fits in what is left of the budget and the host currently has enough available memory,
+so that builds wait instead of being killed for running out of memory. A build that costs more than the whole budget runs alone.
+"""
+
+
+class BuildResources:
+    class Cost(NamedTuple):
+        cpus: int
+        memory: int
+
+    DEFAULT_CPUS = 1
+    DEFAULT_MEMORY = 4 * 1024 ** 3
+
+    # head room on top of the peak memory observed in earlier builds
+    HISTORY_MARGIN = 1.25
+
+    def __init__(self, cpus: int = None, memory: int = None, history: 'BuildResources.History' = None) -> None:
+        self.cpus = cpus
+        self.memory = memory
+        self.history = history
+        self.used_cpus = 0
+        self.used_memory = 0
+        self.running = 0
+        self.lock = threading.Lock()
+
+    def cost(self, component: InputComponent) -> 'BuildResources.Cost':
+        resources = getattr(component, "resources", None) or {}
+        cpus = resources.get("cpus", self.DEFAULT_CPUS)
+        if "memory" in resources:
+            memory = int(resources["memory"] * 1024 ** 3)
+        elif self.history and self.history.peak_rss(component.name):
+            memory = int(self.history.peak_rss(component.name) * self.HISTORY_MARGIN)
+        else:
+            memory = self.DEFAULT_MEMORY
+        return BuildResources.Cost(cpus, memory)
+
+    def acquire(self, component: InputComponent) -> bool:
+        """
+        Reserve the resources to build a component, or return False when it has to wait.
+        """
+        cost = self.cost(component)
+        with self.lock:
+            if self.running:
+                if self.cpus and self.used_cpus + cost.cpus > self.cpus:
+                    return False
+                if self.memory and self.used_memory + cost.memory > self.memory:
+                    return False
+                if cost.memory > self.__available_memory():
+                    logging.info(f"Waiting for memory to build {component.name}, needs {cost.memory // 1024 ** 2}MB")
+                    return False
+            self.used_cpus += cost.cpus
+            self.used_memory += cost.memory
+            self.running += 1
+            return True
+
+    def release(self, component: InputComponent) -> None:
+        cost = self.cost(component)
+        with self.lock:
+            self.used_cpus -= cost.cpus
+            self.used_memory -= cost.memory
+            self.running -= 1
+
+    def __available_memory(self) -> int:
+        return int(psutil.virtual_memory().available)
+
+    class History:
+        """
+        Peak memory used by the builds of each component on this host, shared by concurrent builds.
+        """
+
+        def __init__(self, path: str) -> None:
+            self.path = path
+            self.data: Dict[str, Dict[str, int]] = self.__read()
+
+        def peak_rss(self, component_name: str) -> int:
+            return self.data.get(component_name, {}).get("peak_rss", None)
+
+        def update(self, peaks: Dict[str, int]) -> None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with FileLock(f"{self.path}.lock"):
+                self.data = self.__read()
+                for component_name, peak_rss in peaks.items():
+                    self.data[component_name] = {"peak_rss": peak_rss}
+                with open(f"{self.path}.tmp", "w") as f:
+                    json.dump(self.data, f, indent=2)
+                os.replace(f"{self.path}.tmp", self.path)
+
+        def __read(self) -> Dict[str, Dict[str, int]]:
+            try:
+                with open(self.path) as f:
+                    data: Dict[str, Dict[str, int]] = json.load(f)
+                    return data
+            except (FileNotFoundError, ValueError):
+                return {}
+
+    class Monitor:
+        """
+        Samples the memory used by the build script of each component, i.e. the process started in its checkout and all of
+        its descendants, and keeps the peak of each component. A process stays attributed to the component whose build
+        started it after it leaves the tree, e.g. a Gradle daemon once its client exits.
+        """
+
+        INTERVAL = 1.0
+
+        def __init__(self, dirs: Dict[str, str]) -> None:
+            self.dirs = {name: os.path.realpath(dir) for name, dir in dirs.items()}
+            self.peaks: Dict[str, int] = {}
+            self.processes: Dict[psutil.Process, str] = {}
+            self.stopped = threading.Event()
+            self.thread = threading.Thread(target=self.__run, name="resource-monitor", daemon=True)
+
+        def __enter__(self) -> 'BuildResources.Monitor':
+            self.thread.start()
+            return self
+
+        def __exit__(self, exc_type: object, exc_value: object, exc_traceback: object) -> None:
+            self.stopped.set()
+            self.thread.join()
+
+        def sample(self) -> None:
+            # build scripts are children of this process, run in the checkout of their component
+            for process in psutil.Process().children():
+                try:
+                    names = self.__components(os.path.realpath(process.cwd()))
+                    if names:
+                        for descendant in [process] + process.children(recursive=True):
+                            self.processes.setdefault(descendant, names[0])
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
+            usage: Dict[str, int] = {}
+            for process, name in list(self.processes.items()):
+                try:
+                    rss = process.memory_info().rss
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    del self.processes[process]
+                    continue
+                usage[name] = usage.get(name, 0) + rss
+            for name, rss in usage.items():
+                self.peaks[name] = max(self.peaks.get(name, 0), rss)
+
+        def __components(self, cwd: str) -> List[str]:
+            return [name for name, dir in self.dirs.items() if cwd == dir or cwd.startswith(dir + os.sep)]
+
+        def __run(self) -> None:
+            while not self.stopped.wait(self.INTERVAL):
+                self.sample()
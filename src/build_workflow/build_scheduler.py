@@ -0,0 +1,102 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+from typing import Callable, Dict, List, Set
+
+from build_workflow.build_resources import BuildResources
+from build_workflow.component_graph import ComponentGraph
+from manifests.input_manifest import InputComponent
+
+"""
+This class is responsible for building components concurrently, following the dependency graph described by `depends_on`.
+A component is only started once all of its dependencies that are part of the same build have been built successfully.
+The core component (e.g. OpenSearch or OpenSearch-Dashboards) is an implicit dependency of every other component.
+Given the durations of an earlier build, components on the longest remaining chain of builds are started first.
+Given build resources, a component is only started once its CPU and memory cost fits, see BuildResources.
+"""
+
+
+class BuildScheduler:
+    RESOURCES_INTERVAL = 5.0
+
+    def __init__(self, components: List[InputComponent], parallel: int = 1, core: str = None, durations: Dict[str, float] = {},
+                 resources: BuildResources = None) -> None:
+        self.components = components
+        self.parallel = max(parallel, 1)
+        self.durations = durations
+        self.resources = resources
+        self.graph = ComponentGraph(components, core)
+        self.dependencies: Dict[str, Set[str]] = {name: set(dependencies) for name, dependencies in self.graph.dependencies.items()}
+        self.dependents: Dict[str, List[str]] = self.graph.dependents
+
+    def run(self, build: Callable[[InputComponent], None], on_error: Callable[[InputComponent, Exception], bool]) -> List[str]:
+        """
+        Build all components, at most `parallel` at a time.
+
+        :param build: Builds a single component.
+        :param on_error: Called with a failed component, returns True to continue the build without the component and its dependents.
+        :return: Names of the components skipped because one of their dependencies failed.
+        :raises Exception: The first build error that on_error did not choose to continue from.
+        :raises ComponentGraph.CircularDependencyError: Components that can never be built, before building anything.
+        """
+        order = self.graph.topological_order()
+
+        # start the components with the longest chain of builds ahead of them first, in manifest order without durations
+        remaining: Dict[str, float] = {}
+        for name in reversed(order):
+            remaining[name] = self.durations.get(name, 0.0) + max([remaining[dependent] for dependent in self.dependents[name]], default=0.0)
+
+        waiting = {name: set(dependencies) for name, dependencies in self.dependencies.items()}
+        queued = sorted(self.components, key=lambda component: -remaining[component.name])
+        skipped: List[str] = []
+        running: Dict[concurrent.futures.Future, InputComponent] = {}
+        error: Exception = None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.parallel) as executor:
+            while True:
+                deferred = False
+                if error is None:
+                    for component in [component for component in queued if not waiting[component.name]]:
+                        if len(running) >= self.parallel:
+                            break
+                        # do not start smaller builds ahead of a deferred one, or it could wait forever
+                        if self.resources and not self.resources.acquire(component):
+                            deferred = True
+                            break
+                        logging.info(f"Scheduling {component.name}")
+                        queued.remove(component)
+                        running[executor.submit(build, component)] = component
+
+                if not running:
+                    break
+
+                # deferred builds may fit as soon as memory is freed on the host, not only when another build completes
+                timeout = self.RESOURCES_INTERVAL if deferred else None
+                done, _ = concurrent.futures.wait(running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    component = running.pop(future)
+                    if self.resources:
+                        self.resources.release(component)
+                    exception = future.exception()
+                    if exception is None:
+                        for dependent in self.dependents[component.name]:
+                            waiting[dependent].discard(component.name)
+                    elif on_error(component, exception):  # type: ignore[arg-type]
+                        for dependent in self.graph.transitive_dependents[component.name]:
+                            if dependent not in skipped and any(queued_component.name == dependent for queued_component in queued):
+                                logging.error(f"Skipping {dependent} because {component.name} failed to build")
+                                skipped.append(dependent)
+                        queued = [queued_component for queued_component in queued if queued_component.name not in skipped]
+                    else:
+                        error = error or exception  # type: ignore[assignment]
+
+        if error is not None:
+            raise error
+
+        return skipped
@@ -0,0 +1,114 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+import socket
+from typing import Dict, List
+
+from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
+from build_workflow.build_worker_connection import BuildWorkerConnection
+from build_workflow.builder_from_source import BuilderFromSource
+from git.git_repository import GitRepository
+from manifests.input_manifest import InputComponentFromSource
+from system.checksums import file_digests
+from system.temporary_directory import TemporaryDirectory
+
+"""
+This class is responsible for building components from source for a build coordinator on another host or process, see --workers.
+Builds are run one at a time, each in a new temporary directory. Maven artifacts the build depends on are received from
+the coordinator into maven local first, and the git information, build log and artifacts of the build are streamed back
+as they are recorded. The protocol is not authenticated, only listen on a network where all hosts are trusted.
+"""
+
+
+class BuildWorker:
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, maven_local: str = None) -> None:
+        self.maven_local = maven_local or os.path.join(os.path.expanduser("~"), ".m2", "repository")
+        self.socket = socket.create_server((host, port))
+        host, port = self.socket.getsockname()[:2]
+        self.address = f"{host}:{port}"
+        self.closed = False
+
+    def serve_forever(self) -> None:
+        logging.info(f"Build worker listening on {self.address}")
+        while not self.closed:
+            try:
+                sock, address = self.socket.accept()
+            except OSError:
+                if self.closed:
+                    break
+                raise
+            logging.info(f"Accepted a build from {address[0]}")
+            self.handle(BuildWorkerConnection(sock))
+
+    def close(self) -> None:
+        self.closed = True
+        try:
+            # wakes up serve_forever, closing alone does not interrupt accept
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+    def handle(self, connection: BuildWorkerConnection) -> None:
+        try:
+            request = connection.receive()
+            self.__receive_maven(connection, request["maven"])
+            component = InputComponentFromSource(request["component"])
+            with TemporaryDirectory() as work_dir:
+                target = BuildTarget(**request["target"], output_dir=os.path.join(work_dir.name, "output"))
+                builder = BuilderFromSource(component, target)
+                logging.info(f"Building {component.name} in {work_dir.name}")
+                builder.checkout(os.path.join(work_dir.name, "checkout"))
+                recorder = BuildWorker.Recorder(target, connection)
+                builder.build(recorder)
+                builder.export_artifacts(recorder)
+            connection.send({"type": "done"})
+            logging.info(f"Successfully built {component.name}")
+        except Exception as e:
+            logging.error(f"Error building: {e}")
+            try:
+                connection.send({"type": "error", "message": str(e)})
+            except OSError:
+                pass
+        finally:
+            connection.close()
+
+    def __receive_maven(self, connection: BuildWorkerConnection, digests: Dict[str, str]) -> None:
+        missing: List[str] = []
+        for path, sha256 in digests.items():
+            maven_file = BuildWorkerConnection.path(self.maven_local, os.path.relpath(path, "maven"))
+            # a snapshot rebuilt from another commit usually has the same size
+            if not os.path.isfile(maven_file) or file_digests(maven_file, ["sha256"])["sha256"] != sha256:
+                missing.append(path)
+        connection.send({"type": "maven", "missing": missing})
+        for _ in missing:
+            message = connection.receive()
+            connection.receive_file(message, BuildWorkerConnection.path(self.maven_local, os.path.relpath(message["path"], "maven")))
+        if missing:
+            logging.info(f"Received {len(missing)} maven artifact(s) into {self.maven_local}")
+
+    class Recorder(BuildRecorder):
+        """
+        Streams what a build records to the build coordinator instead of the output directory.
+        """
+
+        def __init__(self, target: BuildTarget, connection: BuildWorkerConnection) -> None:
+            super().__init__(target)
+            self.connection = connection
+
+        def record_component(self, component_name: str, git_repo: GitRepository) -> None:
+            self.connection.send({"type": "component", "name": component_name, "url": git_repo.url, "ref": git_repo.ref, "sha": git_repo.sha})
+
+        def record_artifact(self, component_name: str, artifact_type: str, artifact_path: str, artifact_file: str) -> None:
+            logging.info(f"Sending {artifact_type} artifact for {component_name}: {artifact_path} (from {artifact_file})")
+            self.connection.send_file({"type": "artifact", "artifact_type": artifact_type, "path": artifact_path}, artifact_file)
+
+        def record_log(self, component_name: str, log_file: str) -> None:
+            self.connection.send_file({"type": "log"}, log_file)
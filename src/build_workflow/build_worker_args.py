@@ -0,0 +1,53 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import argparse
+import logging
+
+
+class BuildWorkerArgs:
+    host: str
+    port: int
+    maven_local: str
+
+    def __init__(self) -> None:
+        parser = argparse.ArgumentParser(description="Build OpenSearch components for a build on another host, see build.sh --workers")
+        parser.add_argument(
+            "--host",
+            dest="host",
+            type=str,
+            default="127.0.0.1",
+            help="Address to listen on, default is 127.0.0.1. Only listen on a network where all hosts are trusted.",
+        )
+        parser.add_argument(
+            "--port",
+            dest="port",
+            type=int,
+            default=8788,
+            help="Port to listen on, default is 8788.",
+        )
+        parser.add_argument(
+            "--maven-local",
+            dest="maven_local",
+            type=str,
+            help="Maven local repository to receive the maven artifacts of dependencies into, default is ~/.m2/repository.",
+        )
+        parser.add_argument(
+            "-v",
+            "--verbose",
+            help="Show more verbose output.",
+            action="store_const",
+            default=logging.INFO,
+            const=logging.DEBUG,
+            dest="logging_level",
+        )
+
+        args = parser.parse_args()
+        self.logging_level = args.logging_level
+        self.host = args.host
+        self.port = args.port
+        self.maven_local = args.maven_local
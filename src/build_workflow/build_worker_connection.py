@@ -0,0 +1,89 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import socket
+import struct
+from typing import Any, Dict
+
+"""
+This class is responsible for the protocol between the build coordinator and a build worker, see BuildWorker.
+Messages are JSON objects prefixed with their length. A message with a `size` is followed by that many bytes of a file,
+which are streamed in chunks so that artifacts of any size use a constant amount of memory.
+"""
+
+
+class BuildWorkerConnection:
+    CHUNK = 1024 * 1024
+    TIMEOUT = 60.0
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.socket = sock
+        self.file = sock.makefile("rwb")
+
+    @classmethod
+    def connect(cls, address: str) -> 'BuildWorkerConnection':
+        host, port = address.rsplit(":", 1)
+        sock = socket.create_connection((host, int(port)), timeout=cls.TIMEOUT)
+        # a build can run for a long time without sending anything
+        sock.settimeout(None)
+        return cls(sock)
+
+    def send(self, message: Dict[str, Any]) -> None:
+        data = json.dumps(message).encode()
+        self.file.write(struct.pack(">I", len(data)) + data)
+        self.file.flush()
+
+    def receive(self) -> Dict[str, Any]:
+        (size,) = struct.unpack(">I", self.__read(4))
+        message: Dict[str, Any] = json.loads(self.__read(size))
+        return message
+
+    def send_file(self, message: Dict[str, Any], path: str) -> None:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self.send({**message, "size": size})
+            remaining = size
+            while remaining:
+                chunk = f.read(min(self.CHUNK, remaining))
+                if not chunk:
+                    raise ConnectionError(f"{path} was truncated while it was sent")
+                self.file.write(chunk)
+                remaining -= len(chunk)
+        self.file.flush()
+
+    def receive_file(self, message: Dict[str, Any], path: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            remaining = message["size"]
+            while remaining:
+                chunk = self.file.read(min(self.CHUNK, remaining))
+                if not chunk:
+                    raise ConnectionError("Connection closed while receiving a file")
+                f.write(chunk)
+                remaining -= len(chunk)
+
+    def close(self) -> None:
+        self.file.close()
+        self.socket.close()
+
+    @classmethod
+    def path(cls, root: str, relative_path: str) -> str:
+        """
+        Return a path received from the other end of the connection, which must stay within root.
+        """
+        path = os.path.normpath(os.path.join(root, relative_path))
+        if os.path.isabs(relative_path) or not path.startswith(os.path.normpath(root) + os.sep):
+            raise ValueError(f"Invalid path received from build worker: {relative_path}")
+        return path
+
+    def __read(self, size: int) -> bytes:
+        data = self.file.read(size)
+        if len(data) < size:
+            raise ConnectionError("Connection closed")
+        return data
@@ -0,0 +1,30 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import queue
+from contextlib import contextmanager
+from typing import Generator, List
+
+"""
+This class is responsible for handing out build workers (see BuildWorker) to concurrent component builds, one build per worker at a time.
+"""
+
+
+class BuildWorkers:
+    def __init__(self, addresses: List[str]) -> None:
+        self.addresses = addresses
+        self.idle: queue.Queue = queue.Queue()
+        for address in addresses:
+            self.idle.put(address)
+
+    @contextmanager
+    def acquire(self) -> Generator[str, None, None]:
+        address = self.idle.get()
+        try:
+            yield address
+        finally:
+            self.idle.put(address)
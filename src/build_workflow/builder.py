@@ -8,6 +8,7 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
 
@@ -16,11 +17,13 @@ class Builder(ABC):
     component: Any
     target: BuildTarget
     output_path: str
+    build_cache: BuildCache
 
-    def __init__(self, component: Any, target: BuildTarget) -> None:
+    def __init__(self, component: Any, target: BuildTarget, build_cache: BuildCache = None) -> None:
         self.output_path = "builds"
         self.component = component
         self.target = target
+        self.build_cache = build_cache
 
     @abstractmethod
     def checkout(self, work_dir: str) -> None:
@@ -33,3 +36,11 @@ class Builder(ABC):
     @abstractmethod
     def export_artifacts(self, build_recorder: BuildRecorder) -> None:
         pass
+
+    @property
+    def distribution_supported(self) -> bool:
+        # whether the artifacts depend on the distribution of the target, and need to be built again for another distribution
+        return False
+
+    def for_target(self, target: BuildTarget) -> 'Builder':
+        raise NotImplementedError(f"{type(self).__name__} cannot build {self.component.name} for another target")
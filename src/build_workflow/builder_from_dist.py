@@ -7,14 +7,14 @@
 
 import logging
 import os
-import urllib.request
-from typing import Any
+from typing import Any, List, Tuple
 
 import manifests.distribution
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.builder import Builder
 from git.git_repository import GitRepository
 from manifests.build_manifest import BuildManifest
+from system.downloader import Downloader
 
 
 class BuilderFromDist(Builder):
@@ -40,6 +40,8 @@ class BuilderFromDist(Builder):
         logging.info(f"Downloading {component_manifest.name} {component_manifest.version} ({component_manifest.commit_id}) ...")
         logging.info(f"Distribution was built from {component_manifest.repository}#{component_manifest.ref}")
         build_recorder.record_component(self.component.name, BuilderFromDist.ManifestGitRepository(component_manifest))
+        artifacts: List[Tuple[str, str, str]] = []
+        downloads: List[Tuple[str, str]] = []
         for artifact_type in component_manifest.artifacts:
             artifact_path = os.path.join(self.output_path, artifact_type)
             logging.info(f"Downloading into {artifact_path} ...")
@@ -49,8 +51,12 @@ class BuilderFromDist(Builder):
                     artifact_dest = os.path.realpath(os.path.join(self.output_path, artifact))
                     os.makedirs(os.path.dirname(artifact_dest), exist_ok=True)
                     logging.info(f"Downloading {artifact_url} into {artifact_dest}")
-                    urllib.request.urlretrieve(artifact_url, artifact_dest)
-                    build_recorder.record_artifact(self.component.name, artifact_type, artifact, artifact_dest)
+                    artifacts.append((artifact_type, artifact, artifact_dest))
+                    downloads.append((artifact_url, artifact_dest))
+        with Downloader() as downloader:
+            downloader.download_all(downloads)
+        for artifact_type, artifact, artifact_dest in artifacts:
+            build_recorder.record_artifact(self.component.name, artifact_type, artifact, artifact_dest)
 
     def __download_build_manifest(self) -> None:
         self.distribution_url = manifests.distribution.find_build_root(self.component.dist, self.target.platform, self.target.architecture, self.target_name)
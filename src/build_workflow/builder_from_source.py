@@ -5,21 +5,34 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import logging
 import os
+import shutil
 
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
 from build_workflow.builder import Builder
 from git.git_repository import GitRepository
 from paths.script_finder import ScriptFinder
+from system.file_lock import FileLock
 
 """
 This class is responsible for executing the build for a component and passing the results to a build recorder.
 It will notify the build recorder of build information such as repository and git ref, and any artifacts generated by the build.
 Artifacts found in "<build root>/artifacts/<maven|plugins|libs|dist|core-plugins>" will be recognized and recorded.
+When a build cache is given, the artifacts of an identical earlier build are restored instead of running the build script.
+The output of the build script is written to a compressed log per component, only its last lines are shown when the build fails.
 """
 
 
 class BuilderFromSource(Builder):
+    # List of components whose build scripts support `-d` parameter
+    # Bundled plugins do not need `-d` as they are java based zips
+    DISTRIBUTION_SUPPORTED_COMPONENTS = ["OpenSearch", "OpenSearch-Dashboards"]
+
+    # artifacts of an earlier build of the same checkout, see for_target
+    stale_artifacts = False
+
     def checkout(self, work_dir: str) -> None:
         self.git_repo = GitRepository(
             self.component.repository,
@@ -28,14 +41,33 @@ class BuilderFromSource(Builder):
             self.component.working_directory,
         )
 
-    def build(self, build_recorder: BuildRecorder) -> None:
+    def for_target(self, target: BuildTarget) -> 'BuilderFromSource':
+        """
+        Return a builder of the same checkout for another target, e.g. another distribution.
+        """
+        builder = BuilderFromSource(self.component, target, self.build_cache)
+        builder.git_repo = self.git_repo
+        builder.stale_artifacts = True
+        return builder
 
-        # List of components whose build scripts support `-d` parameter
-        # Bundled plugins do not need `-d` as they are java based zips
-        DISTRIBUTION_SUPPORTED_COMPONENTS = ["OpenSearch", "OpenSearch-Dashboards"]
+    @property
+    def distribution_supported(self) -> bool:
+        return self.component.name in self.DISTRIBUTION_SUPPORTED_COMPONENTS
 
+    def build(self, build_recorder: BuildRecorder) -> None:
         build_script = ScriptFinder.find_build_script(self.target.name, self.component.name, self.git_repo.working_directory)
 
+        artifacts_path = os.path.join(self.git_repo.working_directory, self.output_path)
+        if self.stale_artifacts and os.path.isdir(artifacts_path):
+            shutil.rmtree(artifacts_path)
+        cache_key = self.build_cache.key(self.component.name, self.git_repo.sha, build_script, self.target, build_recorder) if self.build_cache else None
+
+        if cache_key and self.build_cache.restore(cache_key, artifacts_path):
+            logging.info(f"Restored {self.component.name} from build cache")
+            self.__publish_to_maven_local(artifacts_path)
+            build_recorder.record_component(self.component.name, self.git_repo)
+            return
+
         build_command = " ".join(
             filter(
                 None,
@@ -46,15 +78,19 @@ class BuilderFromSource(Builder):
                     f"-q {self.target.qualifier}" if self.target.qualifier else None,
                     f"-p {self.target.platform}",
                     f"-a {self.target.architecture}",
-                    f"-d {self.target.distribution}" if self.component.name in DISTRIBUTION_SUPPORTED_COMPONENTS else None,
+                    f"-d {self.target.distribution}" if self.distribution_supported else None,
                     f"-s {str(self.target.snapshot).lower()}",
                     f"-o {self.output_path}",
                 ]
             )
         )
 
-        self.git_repo.execute(build_command)
+        log_path = build_recorder.log_path(self.component.name)
+        self.git_repo.execute(build_command, log=log_path)
+        if cache_key and os.path.isdir(artifacts_path):
+            self.build_cache.store(cache_key, artifacts_path)
         build_recorder.record_component(self.component.name, self.git_repo)
+        build_recorder.record_log(self.component.name, log_path)
 
     def export_artifacts(self, build_recorder: BuildRecorder) -> None:
         artifacts_path = os.path.join(self.git_repo.working_directory, self.output_path)
@@ -64,3 +100,13 @@ class BuilderFromSource(Builder):
                     absolute_path = os.path.join(dir, file_name)
                     relative_path = os.path.relpath(absolute_path, artifacts_path)
                     build_recorder.record_artifact(self.component.name, artifact_type, relative_path, absolute_path)
+
+    def __publish_to_maven_local(self, artifacts_path: str) -> None:
+        # A skipped build did not publish to maven local, dependent components expect to find these artifacts there
+        maven_path = os.path.join(artifacts_path, "maven")
+        if os.path.isdir(maven_path):
+            maven_local = os.path.join(os.path.expanduser("~"), ".m2", "repository")
+            logging.info(f"Publishing {maven_path} to {maven_local}")
+            # concurrent builds restoring from the cache publish the same artifacts
+            with FileLock(f"{maven_local}.lock"):
+                shutil.copytree(maven_path, maven_local, dirs_exist_ok=True)
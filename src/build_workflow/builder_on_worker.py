@@ -0,0 +1,135 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import logging
+import os
+from typing import Any, Dict, List, Tuple
+
+from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
+from build_workflow.build_worker_connection import BuildWorkerConnection
+from build_workflow.build_workers import BuildWorkers
+from build_workflow.builder import Builder
+from build_workflow.builder_from_source import BuilderFromSource
+from git.git_repository import GitRepository
+from system.checksums import file_digests
+
+"""
+This class is responsible for building a component from source on a build worker, see BuildWorker and --workers.
+The worker checks out and builds the component, and streams its git information, build log and artifacts back,
+which are recorded in the build recorder of this build like those of a local build.
+Maven artifacts of the components built so far are sent to the worker first, so that it can build components that depend on them.
+"""
+
+
+class BuilderOnWorker(Builder):
+    class BuildError(Exception):
+        def __init__(self, component_name: str, worker: str, message: str) -> None:
+            self.component_name = component_name
+            self.worker = worker
+            super().__init__(f"Error building {component_name} on {worker}: {message}")
+
+    class WorkerGitRepository(GitRepository):
+        def __init__(self, url: str, ref: str, sha: str) -> None:
+            self.url = url
+            self.ref = ref
+            self.sha = sha
+
+    def __init__(self, component: Any, target: BuildTarget, workers: BuildWorkers) -> None:
+        super().__init__(component, target)
+        self.workers = workers
+        self.artifacts: List[Tuple[str, str, str]] = []
+
+    def checkout(self, work_dir: str) -> None:
+        # the worker checks out the component, artifacts received from the worker are kept here until they are exported
+        self.dir = os.path.join(work_dir, self.component.name)
+
+    @property
+    def distribution_supported(self) -> bool:
+        return self.component.name in BuilderFromSource.DISTRIBUTION_SUPPORTED_COMPONENTS
+
+    def for_target(self, target: BuildTarget) -> 'BuilderOnWorker':
+        builder = BuilderOnWorker(self.component, target, self.workers)
+        builder.dir = os.path.join(self.dir, target.distribution or "tar")
+        return builder
+
+    def build(self, build_recorder: BuildRecorder) -> None:
+        with self.workers.acquire() as worker:
+            logging.info(f"Building {self.component.name} on {worker}")
+            connection = BuildWorkerConnection.connect(worker)
+            try:
+                maven = self.__maven(build_recorder)
+                connection.send({
+                    "type": "build",
+                    "component": self.__component,
+                    "target": self.__target,
+                    "maven": maven,
+                })
+                while True:
+                    message = connection.receive()
+                    if message["type"] == "maven":
+                        logging.info(f"Sending {len(message['missing'])} maven artifact(s) to {worker}")
+                        for path in message["missing"]:
+                            # only send what was offered, never any other file the worker asks for
+                            if path not in maven:
+                                raise BuilderOnWorker.BuildError(self.component.name, worker, f"{path} was not offered to the worker")
+                            connection.send_file({"type": "file", "path": path}, BuildWorkerConnection.path(self.target.output_dir, path))
+                    elif message["type"] == "component":
+                        build_recorder.record_component(self.component.name, BuilderOnWorker.WorkerGitRepository(message["url"], message["ref"], message["sha"]))
+                    elif message["type"] == "log":
+                        log_path = build_recorder.log_path(self.component.name)
+                        connection.receive_file(message, log_path)
+                        build_recorder.record_log(self.component.name, log_path)
+                    elif message["type"] == "artifact":
+                        artifact_file = BuildWorkerConnection.path(os.path.join(self.dir, self.output_path), message["path"])
+                        connection.receive_file(message, artifact_file)
+                        self.artifacts.append((message["artifact_type"], message["path"], artifact_file))
+                    elif message["type"] == "error":
+                        raise BuilderOnWorker.BuildError(self.component.name, worker, message["message"])
+                    elif message["type"] == "done":
+                        break
+            finally:
+                connection.close()
+
+    def export_artifacts(self, build_recorder: BuildRecorder) -> None:
+        for artifact_type, artifact_path, artifact_file in self.artifacts:
+            build_recorder.record_artifact(self.component.name, artifact_type, artifact_path, artifact_file)
+
+    @property
+    def __component(self) -> Dict[str, Any]:
+        return {
+            "name": self.component.name,
+            "repository": self.component.repository,
+            "ref": self.component.ref,
+            "working_directory": self.component.working_directory,
+        }
+
+    @property
+    def __target(self) -> Dict[str, Any]:
+        return {
+            "build_id": self.target.build_id,
+            "name": self.target.name,
+            "version": self.target.version,
+            "qualifier": self.target.qualifier,
+            "patches": self.target.patches,
+            "snapshot": self.target.snapshot,
+            "platform": self.target.platform,
+            "architecture": self.target.architecture,
+            "distribution": self.target.distribution,
+        }
+
+    def __maven(self, build_recorder: BuildRecorder) -> Dict[str, str]:
+        # sha256 of the maven artifacts built so far, the worker asks for those it does not have
+        digests = {}
+        for component in build_recorder.get_manifest().components.values():
+            for path in component.artifacts.get("maven", []):
+                file = os.path.join(self.target.output_dir, path)
+                if os.path.isfile(file):
+                    # components of a build manifest before 1.3 have no digests
+                    sha256 = component.digests.get(path, {}).get("sha256", None)
+                    digests[path] = sha256 or file_digests(file, ["sha256"])["sha256"]
+        return digests
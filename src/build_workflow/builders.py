@@ -7,19 +7,24 @@
 
 from abc import ABC
 
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_target import BuildTarget
+from build_workflow.build_workers import BuildWorkers
 from build_workflow.builder import Builder
 from build_workflow.builder_from_dist import BuilderFromDist
 from build_workflow.builder_from_source import BuilderFromSource
+from build_workflow.builder_on_worker import BuilderOnWorker
 from manifests.input_manifest import InputComponent
 
 
 class Builders(ABC):
     @classmethod
-    def builder_from(self, component: InputComponent, target: BuildTarget) -> Builder:
+    def builder_from(self, component: InputComponent, target: BuildTarget, build_cache: BuildCache = None, workers: BuildWorkers = None) -> Builder:
         if hasattr(component, "dist"):
             return BuilderFromDist(component, target)
+        elif hasattr(component, "repository") and workers:
+            return BuilderOnWorker(component, target, workers)
         elif hasattr(component, "repository"):
-            return BuilderFromSource(component, target)
+            return BuilderFromSource(component, target, build_cache)
         else:
             raise ValueError(f"Invalid component type: {type(component)}")
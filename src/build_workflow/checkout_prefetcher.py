@@ -0,0 +1,55 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Dict, List
+
+from build_workflow.builder import Builder
+
+"""
+This class is responsible for checking out components ahead of their build, so that network-bound fetches overlap with builds.
+When a component is checked out, up to `depth` of the components that follow it are checked out in the background.
+A depth of 0 checks out each component when it is needed, without any background threads.
+"""
+
+
+class CheckoutPrefetcher:
+    def __init__(self, builders: List[Builder], work_dir: str, depth: int = 0) -> None:
+        self.builders = builders
+        self.work_dir = work_dir
+        self.depth = depth
+        self.futures: Dict[int, concurrent.futures.Future] = {}
+        self.lock = threading.Lock()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=depth, thread_name_prefix="checkout") if depth > 0 else None
+
+    def __enter__(self) -> 'CheckoutPrefetcher':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        if self.executor:
+            # checkouts that already started must finish before the work directory can be removed
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def checkout(self, builder: Builder) -> None:
+        """
+        Wait for the checkout of a component, starting it if it was not prefetched, and prefetch the components that follow it.
+        """
+        if not self.executor:
+            builder.checkout(self.work_dir)
+            return
+
+        index = next(index for index, candidate in enumerate(self.builders) if candidate is builder)
+        with self.lock:
+            for upcoming in self.builders[index:index + self.depth + 1]:
+                if id(upcoming) not in self.futures:
+                    if upcoming is not builder:
+                        logging.info(f"Prefetching {upcoming.component.name}")
+                    self.futures[id(upcoming)] = self.executor.submit(upcoming.checkout, self.work_dir)
+            future = self.futures[id(builder)]
+        future.result()
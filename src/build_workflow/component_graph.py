@@ -0,0 +1,121 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from manifests.input_manifest import InputComponent, InputManifest
+
+"""
+This class is responsible for the dependency graph between the components of a manifest, as described by `depends_on`.
+The core component (e.g. OpenSearch or OpenSearch-Dashboards) is an implicit dependency of every other component.
+Dependencies on components that are not part of the graph are ignored.
+Adjacency and transitive closures are computed once, lists of components follow the order of the manifest.
+"""
+
+
+class ComponentGraph:
+    class CircularDependencyError(ValueError):
+        def __init__(self, components: List[str]) -> None:
+            self.components = components
+            super().__init__(f"Circular dependency between components: {', '.join(components)}")
+
+    def __init__(self, components: Iterable[InputComponent], core: str = None) -> None:
+        self.components = list(components)
+        self.names = [component.name for component in self.components]
+        self.core = core if core in self.names else None
+        self.__index = {name: index for index, name in enumerate(self.names)}
+
+        self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.names}
+        for component in self.components:
+            depends_on = getattr(component, "depends_on", None) or []
+            dependencies = set(dependency for dependency in depends_on if dependency in self.__index and dependency != component.name)
+            if self.core and component.name != self.core:
+                dependencies.add(self.core)
+            self.dependencies[component.name] = self.__sorted(dependencies)
+            for dependency in self.dependencies[component.name]:
+                self.dependents[dependency].append(component.name)
+
+        self.transitive_dependencies = {name: self.__closure(name, self.dependencies) for name in self.names}
+        self.transitive_dependents = {name: self.__closure(name, self.dependents) for name in self.names}
+
+    @classmethod
+    def from_manifest(cls, manifest: InputManifest, focus: List[str] = [], platform: str = None) -> 'ComponentGraph':
+        return cls(manifest.components.select(focus=focus, platform=platform), manifest.build.name.replace(" ", "-"))
+
+    def subgraph(self, names: Iterable[str]) -> 'ComponentGraph':
+        """
+        The graph between some of the components, dependencies on other components are dropped.
+        """
+        selected = set(names)
+        return ComponentGraph([component for component in self.components if component.name in selected], self.core)
+
+    def dependents_of(self, names: Iterable[str]) -> List[str]:
+        """
+        The given components and everything that depends on them, directly or not.
+        """
+        result: Set[str] = set()
+        for name in names:
+            if name in self.__index:
+                result.add(name)
+                result.update(self.transitive_dependents[name])
+        return self.__sorted(result)
+
+    def topological_order(self) -> List[str]:
+        """
+        Components ordered so that each one comes after all of its dependencies, otherwise in manifest order.
+
+        :raises ComponentGraph.CircularDependencyError: Components that are part of, or depend on, a cycle.
+        """
+        waiting = {name: len(dependencies) for name, dependencies in self.dependencies.items()}
+        ready = [name for name in self.names if not waiting[name]]
+        order: List[str] = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in self.dependents[name]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+            ready.sort(key=self.__index.__getitem__)
+        if len(order) < len(self.names):
+            raise ComponentGraph.CircularDependencyError([name for name in self.names if waiting[name]])
+        return order
+
+    def critical_path(self, durations: Dict[str, float]) -> Tuple[List[str], float]:
+        """
+        The chain of dependent components with the longest total duration, the lower bound of a build with unlimited concurrency.
+        Components without a duration count as 0.
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, str] = {}
+        for name in self.topological_order():
+            dependency = max(self.dependencies[name], key=finish.__getitem__, default=None)
+            if dependency:
+                previous[name] = dependency
+            finish[name] = (finish[dependency] if dependency else 0.0) + durations.get(name, 0.0)
+
+        if not finish:
+            return [], 0.0
+        last = max(self.names, key=lambda name: finish[name])
+        path = [last]
+        while path[-1] in previous:
+            path.append(previous[path[-1]])
+        return list(reversed(path)), finish[last]
+
+    def __sorted(self, names: Iterable[str]) -> List[str]:
+        return sorted(names, key=self.__index.__getitem__)
+
+    def __closure(self, name: str, edges: Dict[str, List[str]]) -> List[str]:
+        result: Set[str] = set()
+        stack = list(edges[name])
+        while stack:
+            other = stack.pop()
+            if other not in result and other != name:
+                result.add(other)
+                stack.extend(edges[other])
+        return self.__sorted(result)
@@ -0,0 +1,118 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import logging
+import os
+import re
+from typing import Any, Dict, Set
+
+import psutil
+
+"""
+This class is responsible for sharing warm Gradle daemons between the component builds of a build, see --gradle-daemons.
+Build scripts run with a shared GRADLE_USER_HOME in which daemons are enabled, so that each Gradle build after the first
+connects to an idle daemon instead of starting a JVM and configuring Gradle from scratch. Gradle keeps the daemons of each
+Gradle version apart and only reuses a daemon started with the same JDK and JVM arguments, so components that share
+those share daemons. The daemons started by the build are stopped when it ends, and the number of Gradle builds of each
+component that reused a daemon is read from its build log.
+"""
+
+
+class GradleDaemons:
+    # stop daemons left behind by a build that did not tear down, e.g. one that was killed
+    IDLE_TIMEOUT = 15 * 60 * 1000
+
+    # the build scripts of this repository run `./gradlew ${OPENSEARCH_BUILD_GRADLE_DAEMON:---no-daemon}`
+    ENV = {"OPENSEARCH_BUILD_GRADLE_DAEMON": "--daemon"}
+
+    STOP_TIMEOUT = 10
+
+    def __init__(self, gradle_user_home: str) -> None:
+        self.gradle_user_home = os.path.abspath(gradle_user_home)
+        self.env: Dict[str, str] = {**self.ENV, "GRADLE_USER_HOME": self.gradle_user_home}
+        self.saved_env: Dict[str, Any] = {}
+        self.started_before: Set[int] = set()
+        self.totals = {"builds": 0, "daemons_started": 0, "daemons_reused": 0}
+
+    def __enter__(self) -> 'GradleDaemons':
+        os.makedirs(self.gradle_user_home, exist_ok=True)
+        self.__write_properties()
+        self.started_before = self.pids()
+        for key, value in self.env.items():
+            self.saved_env[key] = os.environ.get(key, None)
+            os.environ[key] = value
+        logging.info(f"Sharing Gradle daemons in {self.gradle_user_home}")
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, exc_traceback: object) -> None:
+        for key, value in self.saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        self.stop(self.pids() - self.started_before)
+        if self.totals["builds"]:
+            logging.info(f"Reused a warm Gradle daemon in {self.totals['daemons_reused']} of {self.totals['builds']} Gradle build(s)")
+
+    def pids(self) -> Set[int]:
+        """
+        Process ids of the daemons started in this Gradle user home, from the names of their logs.
+        """
+        pids = set()
+        daemon_dir = os.path.join(self.gradle_user_home, "daemon")
+        for dir, _, files in os.walk(daemon_dir):
+            for file_name in files:
+                match = re.fullmatch(r"daemon-(\d+)\.out\.log", file_name)
+                if match:
+                    pids.add(int(match.group(1)))
+        return pids
+
+    def stop(self, pids: Set[int]) -> None:
+        processes = []
+        for pid in pids:
+            try:
+                process = psutil.Process(pid)
+                if "GradleDaemon" in " ".join(process.cmdline()):
+                    process.terminate()
+                    processes.append(process)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        _, alive = psutil.wait_procs(processes, timeout=self.STOP_TIMEOUT)
+        for process in alive:
+            process.kill()
+        if processes:
+            logging.info(f"Stopped {len(processes)} Gradle daemon(s)")
+
+    def usage(self, log_path: str) -> Dict[str, int]:
+        """
+        Count the Gradle builds in the log of a component build and how many of them started a new daemon.
+        """
+        if not os.path.isfile(log_path):
+            return None
+        builds = started = 0
+        with gzip.open(log_path, "rt", errors="replace") as log:
+            for line in log:
+                if line.startswith(("BUILD SUCCESSFUL", "BUILD FAILED")):
+                    builds += 1
+                elif line.startswith("Starting a Gradle Daemon") or "single-use Daemon process will be forked" in line:
+                    started += 1
+        usage = {"builds": builds, "daemons_started": started, "daemons_reused": max(builds - started, 0)}
+        for key, value in usage.items():
+            self.totals[key] += value
+        return usage
+
+    def __write_properties(self) -> None:
+        # keep any other property in the Gradle user home, e.g. a proxy
+        path = os.path.join(self.gradle_user_home, "gradle.properties")
+        properties = {"org.gradle.daemon": "true", "org.gradle.daemon.idletimeout": str(self.IDLE_TIMEOUT)}
+        lines = []
+        if os.path.isfile(path):
+            with open(path) as f:
+                lines = [line for line in f.read().splitlines() if line.split("=", 1)[0].strip() not in properties]
+        with open(path, "w") as f:
+            f.write("\n".join(lines + [f"{key}={value}" for key, value in properties.items()]) + "\n")
@@ -0,0 +1,132 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import glob
+import logging
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Generator, List
+
+from system.file_lock import FileLock
+
+"""
+This class is responsible for sharing the yarn and npm package caches between the component builds of a build, see --yarn-cache.
+Build scripts run with YARN_CACHE_FOLDER and npm_config_cache in the cache directory, so that each package is downloaded
+and unpacked once instead of once per OpenSearch Dashboards plugin. The cache is removed with the build unless it is
+given a directory, in which case the least recently used yarn packages are evicted once it exceeds its size.
+Yarn reads the metadata of a cached package when it uses it: packages added during the build of a component are counted
+as misses and packages whose metadata was read during the build as hits, which relies on the file system updating access times.
+"""
+
+
+class YarnCache:
+    # access times are kept with the coarse clock of the kernel
+    CLOCK_MARGIN = 1.0
+
+    def __init__(self, path: str, max_size: int = None) -> None:
+        self.path = os.path.realpath(path)
+        self.max_size = max_size
+        self.env: Dict[str, str] = {
+            "YARN_CACHE_FOLDER": os.path.join(self.path, "yarn"),
+            "npm_config_cache": os.path.join(self.path, "npm"),
+            "npm_config_prefer_offline": "true",
+        }
+        self.saved_env: Dict[str, Any] = {}
+        self.lock = threading.Lock()
+        self.running = 0
+        self.metadata: Dict[str, str] = {}
+
+    def __enter__(self) -> 'YarnCache':
+        os.makedirs(self.env["YARN_CACHE_FOLDER"], exist_ok=True)
+        os.makedirs(self.env["npm_config_cache"], exist_ok=True)
+        for key, value in self.env.items():
+            self.saved_env[key] = os.environ.get(key, None)
+            os.environ[key] = value
+        logging.info(f"Sharing the yarn and npm package caches in {self.path}")
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, exc_traceback: object) -> None:
+        for key, value in self.saved_env.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        if self.max_size:
+            self.evict()
+
+    @contextmanager
+    def track(self) -> Generator[Dict[str, int], None, None]:
+        """
+        Count the cached packages used and added while a component is built.
+        Counts overlap, and may miss packages used by more than one component, when components are built concurrently.
+        """
+        with self.lock:
+            if not self.running:
+                for metadata in self.entries().values():
+                    os.utime(metadata, (0, os.path.getmtime(metadata)))
+            self.running += 1
+            before = set(self.entries())
+        started = time.time() - self.CLOCK_MARGIN
+        stats: Dict[str, int] = {}
+        try:
+            yield stats
+        finally:
+            with self.lock:
+                self.running -= 1
+                hits = misses = 0
+                for entry, metadata in self.entries().items():
+                    if entry not in before:
+                        misses += 1
+                    elif os.stat(metadata).st_atime >= started:
+                        hits += 1
+                        os.utime(entry)
+                stats.update({"hits": hits, "misses": misses})
+
+    def entries(self) -> Dict[str, str]:
+        """
+        The packages in the yarn cache, e.g. v6/npm-lodash-4.17.21-<hash>-integrity, and the path of their metadata.
+        """
+        entries = {}
+        for version_dir in glob.glob(os.path.join(self.env["YARN_CACHE_FOLDER"], "v*")):
+            for name in os.listdir(version_dir):
+                entry = os.path.join(version_dir, name)
+                if name.startswith(".") or not os.path.isdir(entry):
+                    continue
+                if entry not in self.metadata:
+                    found = glob.glob(os.path.join(entry, "node_modules", "*", ".yarn-metadata.json")) + glob.glob(os.path.join(entry, "node_modules", "@*", "*", ".yarn-metadata.json"))
+                    if not found:
+                        # still being unpacked
+                        continue
+                    self.metadata[entry] = found[0]
+                entries[entry] = self.metadata[entry]
+        return entries
+
+    def evict(self) -> None:
+        with FileLock(os.path.join(self.path, ".lock")):
+            sizes = [(os.path.getmtime(entry), self.__size(entry), entry) for entry in self.entries()]
+            total = sum(size for _, size, _ in sizes)
+            evicted: List[str] = []
+            for _, size, entry in sorted(sizes):
+                if total <= self.max_size:
+                    break
+                shutil.rmtree(entry, ignore_errors=True)
+                self.metadata.pop(entry, None)
+                evicted.append(entry)
+                total -= size
+            if evicted:
+                logging.info(f"Evicted {len(evicted)} package(s) from the yarn cache in {self.path}")
+
+    @classmethod
+    def __size(cls, path: str) -> int:
+        size = 0
+        for dir, _, files in os.walk(path):
+            for file_name in files:
+                size += os.path.getsize(os.path.join(dir, file_name))
+        return size
@@ -0,0 +1,68 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import logging
+import os
+import re
+import subprocess
+
+from system.file_lock import FileLock
+
+
+class GitCache:
+    """
+    This class maintains a local cache of bare repositories (mirrors) keyed by repository URL.
+    Each requested ref is fetched into its mirror incrementally and pinned under refs/cache/ so that the objects are never pruned.
+    Checkouts borrow objects from the mirror through git alternates instead of downloading them again.
+    Mirrors are locked while being updated, so concurrent jobs on the same host can share one cache root.
+    The cache is enabled by setting the OPENSEARCH_BUILD_GIT_CACHE environment variable to the cache root.
+    """
+
+    ENV = "OPENSEARCH_BUILD_GIT_CACHE"
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.realpath(root)
+
+    @classmethod
+    def from_env(cls) -> 'GitCache':
+        root = os.getenv(cls.ENV)
+        return cls(root) if root else None
+
+    def mirror_path(self, url: str) -> str:
+        normalized = re.sub(r"(\.git)?/*$", "", url.strip())
+        name = re.sub(r"[^\w.-]", "-", os.path.basename(normalized)) or "repository"
+        digest = hashlib.sha1(normalized.encode()).hexdigest()[:12]
+        return os.path.join(self.root, f"{name}-{digest}.git")
+
+    def objects_path(self, url: str) -> str:
+        return os.path.join(self.mirror_path(url), "objects")
+
+    def fetch(self, url: str, ref: str) -> str:
+        """
+        Update the mirror of a repository with a ref and return the commit ID the ref resolved to.
+        """
+        mirror = self.mirror_path(url)
+        with FileLock(f"{mirror}.lock"):
+            if not os.path.isdir(mirror):
+                logging.info(f"Creating git cache mirror for {url} in {mirror}")
+                os.makedirs(mirror)
+                self.__execute("git init --bare", mirror)
+                self.__execute(f"git remote add origin {url}", mirror)
+            self.__execute(f"git fetch origin {ref}", mirror)
+            sha = self.__output('git rev-parse --verify "FETCH_HEAD^{commit}"', mirror)
+            self.__execute(f"git update-ref refs/cache/{sha} {sha}", mirror)
+        logging.info(f"Cached {url}@{ref} in {mirror} at {sha}")
+        return sha
+
+    def __execute(self, command: str, cwd: str) -> None:
+        logging.info(f'Executing "{command}" in {cwd}')
+        subprocess.check_call(command, cwd=cwd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def __output(self, command: str, cwd: str) -> str:
+        logging.info(f'Executing "{command}" in {cwd}')
+        return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
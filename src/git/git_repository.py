@@ -9,9 +9,11 @@ import logging
 import os
 import subprocess
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Dict, List
 
+from git.git_cache import GitCache
 from git.git_commit import GitCommit
+from system.execute import execute_to_log
 from system.temporary_directory import TemporaryDirectory
 
 
@@ -21,6 +23,7 @@ class GitRepository:
     This class checks out a Git repository at a particular ref into an empty named directory (or temporary a directory if no named directory is given).
     Temporary directories will be automatically deleted when the GitRepository object goes out of scope; named directories will be left alone.
     Clients can obtain the actual commit ID by querying the "sha" attribute, and the temp directory name with "dir".
+    When a GitCache is configured (see GitCache.ENV), objects are fetched into the shared cache and borrowed through git alternates.
     """
 
     def __init__(self, url: str, ref: str, directory: str = None, working_subdirectory: str = None) -> None:
@@ -44,10 +47,17 @@ class GitRepository:
             self.temp_dir.__exit__(exc_type, exc_value, exc_traceback)
 
     def __checkout__(self) -> None:
+        cache = GitCache.from_env()
         self.execute_silent("git init", self.dir)
         self.execute_silent(f"git remote add origin {self.url}", self.dir)
-        self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
-        self.execute_silent("git checkout FETCH_HEAD", self.dir)
+        if cache:
+            sha = cache.fetch(self.url, self.ref)
+            with open(os.path.join(self.dir, ".git", "objects", "info", "alternates"), "w") as f:
+                f.write(cache.objects_path(self.url) + "\n")
+            self.execute_silent(f"git checkout {sha}", self.dir)
+        else:
+            self.execute_silent(f"git fetch --depth 1 origin {self.ref}", self.dir)
+            self.execute_silent("git checkout FETCH_HEAD", self.dir)
         self.sha = self.output("git rev-parse HEAD", self.dir)
         logging.info(f"Checked out {self.url}@{self.ref} into {self.dir} at {self.sha}")
 
@@ -58,11 +68,41 @@ class GitRepository:
         else:
             return self.dir
 
+    @classmethod
+    def changed_paths(self, url: str, from_commit: str, to_commit: str) -> List[str]:
+        """
+        List the paths changed between two commits, fetching only the trees of both commits and none of their history or files.
+        """
+        with TemporaryDirectory() as work_dir:
+            for command in [
+                "git init",
+                f"git remote add origin {url}",
+                f"git fetch --depth 1 --filter=blob:none origin {from_commit} {to_commit}",
+            ]:
+                subprocess.check_call(command, cwd=work_dir.name, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # rename detection would fetch the contents of changed files
+            output = subprocess.check_output(f"git diff --name-only --no-renames {from_commit} {to_commit}", cwd=work_dir.name, shell=True)
+            return output.decode().splitlines()
+
     @classmethod
     def stable_ref(self, url: str, ref: str) -> List[str]:
         results = subprocess.check_output(f"git ls-remote {url} {ref}", shell=True).decode().strip().split("\t")
         return results if len(results) > 1 else [ref, ref]
 
+    @classmethod
+    def stable_refs(self, url: str, refs: List[str]) -> Dict[str, List[str]]:
+        """
+        Resolve several refs of a repository with a single ls-remote, with the same result as stable_ref for each of them.
+        """
+        lines = subprocess.check_output(f"git ls-remote {url} {' '.join(refs)}", shell=True).decode().strip().splitlines()
+        remote_refs = [line.split("\t") for line in lines if "\t" in line]
+        results = {}
+        for ref in refs:
+            # ls-remote patterns match the full name of a ref, or its trailing path components
+            matches = [remote_ref for remote_ref in remote_refs if remote_ref[1] == ref or remote_ref[1].endswith(f"/{ref}")]
+            results[ref] = matches[0] if matches else [ref, ref]
+        return results
+
     def execute_silent(self, command: str, cwd: str = None) -> None:
         cwd = cwd or self.working_directory
         logging.info(f'Executing "{command}" in {cwd}')
@@ -79,8 +119,11 @@ class GitRepository:
         logging.info(f'Executing "{command}" in {cwd}')
         return subprocess.check_output(command, cwd=cwd, shell=True).decode().strip()
 
-    def execute(self, command: str, cwd: str = None) -> None:
+    def execute(self, command: str, cwd: str = None, log: str = None) -> None:
         cwd = cwd or self.working_directory
+        if log:
+            execute_to_log(command, cwd, log)
+            return
         logging.info(f'Executing "{command}" in {cwd}')
         subprocess.check_call(command, cwd=cwd, shell=True)
 
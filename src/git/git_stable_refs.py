@@ -0,0 +1,134 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Tuple
+
+from git.git_repository import GitRepository
+from system.file_lock import FileLock
+
+
+class GitStableRefs:
+    """
+    This class resolves refs of remote repositories into commit IDs, as GitRepository.stable_ref does.
+    Repositories are queried concurrently, with a single ls-remote for all the refs requested from a repository.
+    Results are memoized for the lifetime of the process.
+    Setting the OPENSEARCH_BUILD_REFS_CACHE environment variable to a file also keeps results on disk across processes,
+    for OPENSEARCH_BUILD_REFS_CACHE_TTL seconds (300 by default).
+    """
+
+    ENV = "OPENSEARCH_BUILD_REFS_CACHE"
+    ENV_TTL = "OPENSEARCH_BUILD_REFS_CACHE_TTL"
+    DEFAULT_TTL = 300
+
+    WORKERS = 8
+
+    # a full commit ID is already stable, and ls-remote can only match ref names
+    COMMIT_ID = re.compile(r"^[0-9a-f]{40}$")
+
+    resolved: Dict[Tuple[str, str], List[str]] = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def stable_ref(cls, url: str, ref: str) -> List[str]:
+        return cls.resolve([(url, ref)])[(url, ref)]
+
+    @classmethod
+    def resolve(cls, refs: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Resolve (url, ref) pairs into [commit ID, ref name] pairs.
+        """
+        results: Dict[Tuple[str, str], List[str]] = {}
+        with cls.lock:
+            for url, ref in refs:
+                if cls.COMMIT_ID.match(ref):
+                    results[(url, ref)] = [ref, ref]
+                elif (url, ref) in cls.resolved:
+                    results[(url, ref)] = cls.resolved[(url, ref)]
+
+        if any(key not in results for key in refs):
+            for key, value in cls.__load().items():
+                if key in refs and key not in results:
+                    results[key] = value
+
+        pending: Dict[str, List[str]] = {}
+        for url, ref in refs:
+            if (url, ref) not in results and ref not in pending.get(url, []):
+                pending.setdefault(url, []).append(ref)
+
+        if pending:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=cls.WORKERS, thread_name_prefix="ls-remote") as executor:
+                futures = {url: executor.submit(cls.__ls_remote, url, url_refs) for url, url_refs in pending.items()}
+                for url, future in futures.items():
+                    for ref, result in future.result().items():
+                        results[(url, ref)] = result
+            cls.__save({(url, ref): results[(url, ref)] for url, url_refs in pending.items() for ref in url_refs})
+
+        with cls.lock:
+            cls.resolved.update(results)
+        return results
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls.lock:
+            cls.resolved.clear()
+
+    @classmethod
+    def __ls_remote(cls, url: str, refs: List[str]) -> Dict[str, List[str]]:
+        if len(refs) == 1:
+            return {refs[0]: list(GitRepository.stable_ref(url, refs[0]))}
+        return GitRepository.stable_refs(url, refs)
+
+    @classmethod
+    def __cache_path(cls) -> str:
+        return os.environ.get(cls.ENV, None)
+
+    @classmethod
+    def __read(cls, path: str) -> Dict[str, dict]:
+        try:
+            with open(path) as f:
+                data: Dict[str, dict] = json.load(f)
+                return data
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    @classmethod
+    def __load(cls) -> Dict[Tuple[str, str], List[str]]:
+        path = cls.__cache_path()
+        if not path:
+            return {}
+        ttl = float(os.environ.get(cls.ENV_TTL, cls.DEFAULT_TTL))
+        now = time.time()
+        results = {}
+        for key, entry in cls.__read(path).items():
+            if now - entry["time"] < ttl:
+                url, ref = key.split("\t", 1)
+                results[(url, ref)] = entry["result"]
+        return results
+
+    @classmethod
+    def __save(cls, results: Dict[Tuple[str, str], List[str]]) -> None:
+        path = cls.__cache_path()
+        if not path:
+            return
+        with FileLock(f"{path}.lock"):
+            now = time.time()
+            ttl = float(os.environ.get(cls.ENV_TTL, cls.DEFAULT_TTL))
+            data = {key: entry for key, entry in cls.__read(path).items() if now - entry["time"] < ttl}
+            for (url, ref), result in results.items():
+                data[f"{url}\t{ref}"] = {"result": result, "time": now}
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(f"{path}.tmp", "w") as f:
+                json.dump(data, f)
+            os.replace(f"{path}.tmp", path)
+        logging.debug(f"Saved {len(results)} stable ref(s) into {path}")
@@ -7,6 +7,7 @@
 
 from manifests.build.build_manifest_1_0 import BuildManifest_1_0
 from manifests.build.build_manifest_1_1 import BuildManifest_1_1
+from manifests.build.build_manifest_1_2 import BuildManifest_1_2
 from manifests.component_manifest import Component, ComponentManifest, Components
 
 """
@@ -14,8 +15,8 @@ A BuildManifest is an immutable view of the outputs from a build step
 The manifest contains information about the product that was built (in the `build` section),
 and the components that made up the build in the `components` section.
 
-The format for schema version 1.2 is:
-schema-version: "1.2"
+The format for schema version 1.3 is:
+schema-version: "1.3"
 build:
   name: string
   version: string
@@ -38,6 +39,12 @@ components:
       libs:
         - libs/relative/path/to/artifact
         - ...
+    log: logs/relative/path/to/build.log.gz (optional, added in 1.3, the output of the build script)
+    digests: (optional, added in 1.3)
+      maven/relative/path/to/artifact:
+        sha256: hex digest
+        sha512: hex digest
+      ...
   - ...
 """
 
@@ -46,7 +53,8 @@ class BuildManifest(ComponentManifest['BuildManifest', 'BuildComponents']):
     VERSIONS = {
         "1.0": BuildManifest_1_0,
         "1.1": BuildManifest_1_1,
-        # "1.2" : current
+        "1.2": BuildManifest_1_2,
+        # "1.3" : current
     }
 
     SCHEMA = {
@@ -62,7 +70,7 @@ class BuildManifest(ComponentManifest['BuildManifest', 'BuildComponents']):
                 "version": {"required": True, "type": "string"},
             },
         },
-        "schema-version": {"required": True, "type": "string", "allowed": ["1.2"]},
+        "schema-version": {"required": True, "type": "string", "allowed": ["1.3"]},
         "components": {
             "type": "list",
             "schema": {
@@ -79,6 +87,17 @@ class BuildManifest(ComponentManifest['BuildManifest', 'BuildComponents']):
                         },
                     },
                     "commit_id": {"required": True, "type": "string"},
+                    "digests": {
+                        "type": "dict",
+                        "valuesrules": {
+                            "type": "dict",
+                            "schema": {
+                                "sha256": {"type": "string"},
+                                "sha512": {"type": "string"},
+                            },
+                        },
+                    },
+                    "log": {"type": "string"},  # added in 1.3
                     "name": {"required": True, "type": "string"},
                     "ref": {"required": True, "type": "string"},
                     "repository": {"required": True, "type": "string"},
@@ -95,7 +114,7 @@ class BuildManifest(ComponentManifest['BuildManifest', 'BuildComponents']):
 
     def __to_dict__(self) -> dict:
         return {
-            "schema-version": "1.2",
+            "schema-version": "1.3",
             "build": self.build.__to_dict__(),
             "components": self.components.__to_dict__()
         }
@@ -138,6 +157,8 @@ class BuildComponent(Component):
         self.commit_id = data["commit_id"]
         self.artifacts = data.get("artifacts", {})
         self.version = data["version"]
+        self.log = data.get("log", None)
+        self.digests = data.get("digests", {})
 
     def __to_dict__(self) -> dict:
         return {
@@ -147,7 +168,9 @@ class BuildComponent(Component):
             "commit_id": self.commit_id,
             "artifacts": self.artifacts,
             "version": self.version,
+            "log": self.log,
+            "digests": self.digests,
         }
 
 
-BuildManifest.VERSIONS = {"1.0": BuildManifest_1_0, "1.1": BuildManifest_1_1, "1.2": BuildManifest}
+BuildManifest.VERSIONS = {"1.0": BuildManifest_1_0, "1.1": BuildManifest_1_1, "1.2": BuildManifest_1_2, "1.3": BuildManifest}
@@ -42,7 +42,7 @@ import itertools
 import logging
 from typing import Callable, Iterator, List, Optional
 
-from git.git_repository import GitRepository
+from git.git_stable_refs import GitStableRefs
 from manifests.component_manifest import Component, ComponentManifest, Components
 
 
@@ -173,6 +173,8 @@ class InputComponents_1_0(Components['InputComponent_1_0 ']):
         return InputComponent_1_0._from(data)  # type: ignore[no-any-return]
 
     def __stabilize__(self) -> None:
+        # resolve all refs at once, components then pick their commit ID from the results
+        GitStableRefs.resolve([(component.repository, component.ref) for component in self.values() if isinstance(component, InputComponentFromSource_1_0)])
         for component in self.values():
             component.__stabilize__()
 
@@ -240,7 +242,7 @@ class InputComponentFromSource_1_0(InputComponent_1_0):
         self.working_directory = data.get("working_directory", None)
 
     def __stabilize__(self) -> None:
-        ref, name = GitRepository.stable_ref(self.repository, self.ref)
+        ref, name = GitStableRefs.stable_ref(self.repository, self.ref)
         logging.info(f"Updating ref for {self.repository} from {self.ref} to {ref} ({name})")
         self.ref = ref
 
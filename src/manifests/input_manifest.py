@@ -48,6 +48,13 @@ components:
       - windows
       - darwin
       - linux
+    depends_on: optional list of components to build first
+      - ...
+    resources: optional resources needed to build the component, see --cpus and --memory
+      cpus: number of CPUs
+      memory: memory in GB
+    ignore_paths: optional list of path globs that do not need a rebuild when changed, see --path-filter
+      - ...
   - ...
 """
 import copy
@@ -55,7 +62,7 @@ import itertools
 import logging
 from typing import Callable, Dict, Iterator, List, Optional
 
-from git.git_repository import GitRepository
+from git.git_stable_refs import GitStableRefs
 from manifests.component_manifest import Component, ComponentManifest, Components
 from manifests.input.input_manifest_1_0 import InputManifest_1_0
 from manifests.input.input_manifest_1_1 import InputManifest_1_1
@@ -116,7 +123,15 @@ class InputManifest(ComponentManifest['InputManifest', 'InputComponents']):
                             "working_directory": {"type": "string"},
                             "checks": {"type": "list", "schema": {"anyof": [{"type": "string"}, {"type": "dict"}]}},
                             "platforms": {"type": "list", "schema": {"type": "string", "allowed": ["linux", "windows", "darwin"]}},
-                            "depends_on": {"type": "list", "schema": {"type": "string"}}
+                            "depends_on": {"type": "list", "schema": {"type": "string"}},
+                            "resources": {
+                                "type": "dict",
+                                "schema": {
+                                    "cpus": {"type": "integer", "min": 1},
+                                    "memory": {"type": "number", "min": 0},
+                                },
+                            },
+                            "ignore_paths": {"type": "list", "schema": {"type": "string"}},
                         },
                     },
                     {
@@ -229,6 +244,8 @@ class InputComponents(Components['InputComponent']):
         return InputComponent._from(data)  # type: ignore[no-any-return]
 
     def __stabilize__(self) -> None:
+        # resolve all refs at once, components then pick their commit ID from the results
+        GitStableRefs.resolve([(component.repository, component.ref) for component in self.values() if isinstance(component, InputComponentFromSource)])
         for component in self.values():
             component.__stabilize__()
 
@@ -295,9 +312,11 @@ class InputComponentFromSource(InputComponent):
         self.repository = data["repository"]
         self.ref = data["ref"]
         self.working_directory = data.get("working_directory", None)
+        self.resources = data.get("resources", None)
+        self.ignore_paths = data.get("ignore_paths", None)
 
     def __stabilize__(self) -> None:
-        ref, name = GitRepository.stable_ref(self.repository, self.ref)
+        ref, name = GitStableRefs.stable_ref(self.repository, self.ref)
         logging.info(f"Updating ref for {self.repository} from {self.ref} to {ref} ({name})")
         self.ref = ref
 
@@ -310,6 +329,8 @@ class InputComponentFromSource(InputComponent):
             "checks": list(map(lambda check: check.__to_dict__(), self.checks)),
             "platforms": self.platforms,
             "depends_on": self.depends_on,
+            "resources": self.resources,
+            "ignore_paths": self.ignore_paths,
         }
 
 
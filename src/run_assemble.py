@@ -39,14 +39,14 @@ def main() -> int:
         BundleLocations.from_path(args.base_url, os.getcwd(), build.filename, build.distribution)
     )
 
-    with Bundles.create(build_manifest, artifacts_dir, bundle_recorder, args.keep) as bundle:
+    with Bundles.create(build_manifest, artifacts_dir, bundle_recorder, args.keep, args.fast_plugin_install) as bundle:
         bundle.install_min()
         bundle.install_components()
         logging.info(f"Installed plugins: {bundle.installed_plugins}")
 
         #  Save a copy of the manifest inside of the tar
         bundle_recorder.write_manifest(bundle.min_dist.archive_path)
-        bundle.package(output_dir)
+        bundle.package(output_dir, args.compression_level)
 
         bundle_recorder.write_manifest(output_dir)
 
@@ -10,14 +10,27 @@ import logging
 import os
 import sys
 import uuid
+from contextlib import nullcontext
+from typing import ContextManager, Dict
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_cache import BuildCache
 from build_workflow.build_incremental import BuildIncremental
+from build_workflow.build_metrics import BuildMetrics
+from build_workflow.build_output_store import BuildOutputStore
+from build_workflow.build_plan import BuildPlan
 from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_resources import BuildResources
+from build_workflow.build_scheduler import BuildScheduler
 from build_workflow.build_target import BuildTarget
+from build_workflow.build_workers import BuildWorkers
 from build_workflow.builders import Builders
+from build_workflow.checkout_prefetcher import CheckoutPrefetcher
+from build_workflow.component_graph import ComponentGraph
+from build_workflow.gradle_daemons import GradleDaemons
+from build_workflow.yarn_cache import YarnCache
 from manifests.build_manifest import BuildManifest
-from manifests.input_manifest import InputManifest
+from manifests.input_manifest import InputComponent, InputManifest
 from paths.build_output_dir import BuildOutputDir
 from system import console
 from system.temporary_directory import TemporaryDirectory
@@ -45,9 +58,10 @@ def main() -> int:
         return 0
 
     output_dir = BuildOutputDir(manifest.build.filename, args.distribution).dir
+    distribution_output_dirs = {distribution: BuildOutputDir(manifest.build.filename, distribution).dir for distribution in args.distributions[1:]}
 
     if args.incremental:
-        buildIncremental = BuildIncremental(manifest, args.distribution, args.platform)
+        buildIncremental = BuildIncremental(manifest, args.distribution, args.platform, args.path_filter)
         list_of_updated_plugins = buildIncremental.commits_diff(manifest)
         components = buildIncremental.rebuild_plugins(list_of_updated_plugins, manifest)
 
@@ -58,6 +72,8 @@ def main() -> int:
 
         if not components:
             logging.info("No commit difference found between any components. Skipping the build.")
+            if args.plan:
+                return 0
             build_manifest.build.id = os.getenv("BUILD_NUMBER") or uuid.uuid4().hex
             build_manifest.to_file(build_manifest_path)
             logging.info(f"Updating the build ID in the build manifest to {build_manifest.build.id}.")
@@ -65,44 +81,147 @@ def main() -> int:
 
         logging.info(f"Plugins for incremental build: {components}")
 
+    if args.plan:
+        graph = ComponentGraph.from_manifest(manifest, components, args.platform or manifest.build.platform)
+        durations = BuildMetrics.durations(os.path.join(output_dir, BuildMetrics.FILENAME))
+        BuildPlan(graph, buildIncremental.reasons if args.incremental else {}, durations).log()
+        return 0
+
     with TemporaryDirectory(keep=args.keep, chdir=True) as work_dir:
         logging.info(f"Building in {work_dir.name}")
 
-        target = BuildTarget(
-            name=manifest.build.name,
-            version=manifest.build.version,
-            qualifier=manifest.build.qualifier,
-            patches=manifest.build.patches,
-            snapshot=args.snapshot if args.snapshot is not None else manifest.build.snapshot,
-            output_dir=output_dir,
-            distribution=args.distribution,
-            platform=args.platform or manifest.build.platform,
-            architecture=args.architecture or manifest.build.architecture,
-        )
+        def build_target(distribution: str, output_dir: str, build_id: str = None) -> BuildTarget:
+            return BuildTarget(
+                build_id=build_id,
+                name=manifest.build.name,
+                version=manifest.build.version,
+                qualifier=manifest.build.qualifier,
+                patches=manifest.build.patches,
+                snapshot=args.snapshot if args.snapshot is not None else manifest.build.snapshot,
+                output_dir=output_dir,
+                distribution=distribution,
+                platform=args.platform or manifest.build.platform,
+                architecture=args.architecture or manifest.build.architecture,
+            )
+
+        target = build_target(args.distribution, output_dir)
+        output_store = BuildOutputStore(args.output_store) if args.output_store else None
+        build_recorder = BuildRecorder(target, build_manifest if args.incremental else None, args.move_artifacts, output_store)
+        # other distributions reuse the checkouts and the builds of the first one, only components that take `-d` are built again
+        distribution_recorders = [
+            BuildRecorder(build_target(distribution, distribution_output_dirs[distribution], target.build_id), None, args.move_artifacts, output_store)
+            for distribution in args.distributions[1:]
+        ]
+        resumed = []
+        if args.resume:
+            resumed_by_distribution = [recorder.resume(manifest) for recorder in [build_recorder] + distribution_recorders]
+            resumed = [name for name in resumed_by_distribution[0] if all(name in names for names in resumed_by_distribution[1:])]
+        else:
+            for recorder in [build_recorder] + distribution_recorders:
+                recorder.start_journal()
+        durations = BuildMetrics.durations(os.path.join(target.output_dir, BuildMetrics.FILENAME))
 
-        build_recorder = BuildRecorder(target, build_manifest) if args.incremental else BuildRecorder(target)
+        build_cache = BuildCache(args.build_cache, args.build_cache_size * 1024 ** 3, manifest) if args.build_cache else None
 
         logging.info(f"Building {manifest.build.name} ({target.architecture}) into {target.output_dir}")
 
-        for component in manifest.components.select(focus=components, platform=target.platform):
+        selected_components = list(manifest.components.select(focus=components, platform=target.platform))
+        if resumed:
+            logging.info(f"Resuming the build, skipping components built before: {resumed}")
+            selected_components = [component for component in selected_components if component.name not in resumed]
+        workers = BuildWorkers(args.workers) if args.workers else None
+        builders = {component.name: Builders.builder_from(component, target, build_cache, workers) for component in selected_components}
+        prefetcher = CheckoutPrefetcher(list(builders.values()), work_dir.name, args.prefetch)
+        gradle_daemons = GradleDaemons(args.gradle_user_home) if args.gradle_daemons else None
+        if args.yarn_cache_dir:
+            yarn_cache = YarnCache(args.yarn_cache_dir, args.yarn_cache_size * 1024 ** 3)
+        elif args.yarn_cache:
+            yarn_cache = YarnCache(os.path.join(work_dir.name, "yarn-cache"))
+        else:
+            yarn_cache = None
+
+        def record_gradle_daemons(recorder: BuildRecorder, component: InputComponent) -> None:
+            usage = gradle_daemons.usage(recorder.log_path(component.name)) if gradle_daemons else None
+            if usage:
+                recorder.metrics.record(component.name, "gradle", usage)
+
+        def build_component(component: InputComponent) -> None:
             logging.info(f"Building {component.name}")
 
-            builder = Builders.builder_from(component, target)
-            try:
-                builder.checkout(work_dir.name)
-                builder.build(build_recorder)
+            builder = builders[component.name]
+            with build_recorder.metrics.phase(component.name, "checkout"):
+                prefetcher.checkout(builder)
+            with build_recorder.metrics.phase(component.name, "build"):
+                yarn_tracking: ContextManager[Dict[str, int]] = nullcontext({})
+                if yarn_cache:
+                    yarn_tracking = yarn_cache.track()
+                with yarn_tracking as yarn_stats:
+                    builder.build(build_recorder)
+            if yarn_stats.get("hits", 0) or yarn_stats.get("misses", 0):
+                build_recorder.metrics.record(component.name, "yarn_cache", yarn_stats)
+            record_gradle_daemons(build_recorder, component)
+            with build_recorder.metrics.phase(component.name, "export"):
                 builder.export_artifacts(build_recorder)
-                logging.info(f"Successfully built {component.name}")
-            except Exception as e:
-                logging.error(f"ERROR: {e}")
-                logging.error(f"Error building {component.name}, retry with: {args.component_command(component.name)}")
-                if args.continue_on_error and component.name not in ['OpenSearch', 'job-scheduler', 'common-utils', 'OpenSearch-Dashboards']:
-                    failed_plugins.append(component.name)
-                    continue
+            with build_recorder.metrics.phase(component.name, "check"):
+                build_recorder.check_artifacts(component.name)
+            build_recorder.journal_component(component.name)
+
+            for recorder in distribution_recorders:
+                if builder.distribution_supported:
+                    logging.info(f"Building {component.name} for {recorder.target.distribution}")
+                    distribution_builder = builder.for_target(recorder.target)
+                    with recorder.metrics.phase(component.name, "build"):
+                        distribution_builder.build(recorder)
+                    record_gradle_daemons(recorder, component)
+                    with recorder.metrics.phase(component.name, "export"):
+                        distribution_builder.export_artifacts(recorder)
+                    with recorder.metrics.phase(component.name, "check"):
+                        recorder.check_artifacts(component.name)
                 else:
-                    raise
-
-        build_recorder.write_manifest()
+                    recorder.record_from(build_recorder, component.name)
+                recorder.journal_component(component.name)
+            logging.info(f"Successfully built {component.name}")
+
+        def continue_on_error(component: InputComponent, e: Exception) -> bool:
+            logging.error(f"ERROR: {e}")
+            logging.error(f"Error building {component.name}, retry with: {args.component_command(component.name)}")
+            if args.continue_on_error and component.name not in ['OpenSearch', 'job-scheduler', 'common-utils', 'OpenSearch-Dashboards']:
+                failed_plugins.append(component.name)
+                return True
+            return False
+
+        with prefetcher, gradle_daemons or nullcontext(), yarn_cache or nullcontext():
+            if args.parallel > 1:
+                logging.info(f"Building up to {args.parallel} components concurrently")
+                if args.cpus or args.memory:
+                    history = BuildResources.History(args.resource_history)
+                    resources = BuildResources(args.cpus, int(args.memory * 1024 ** 3) if args.memory else None, history)
+                    scheduler = BuildScheduler(selected_components, args.parallel, manifest.build.name.replace(" ", "-"), durations, resources)
+                    with BuildResources.Monitor({component.name: os.path.join(work_dir.name, component.name) for component in selected_components}) as monitor:
+                        failed_plugins.extend(scheduler.run(build_component, continue_on_error))
+                    for name, peak_rss in monitor.peaks.items():
+                        build_recorder.metrics.record(name, "peak_rss", peak_rss)
+                    history.update(monitor.peaks)
+                else:
+                    scheduler = BuildScheduler(selected_components, args.parallel, manifest.build.name.replace(" ", "-"), durations)
+                    failed_plugins.extend(scheduler.run(build_component, continue_on_error))
+                for recorder in [build_recorder] + distribution_recorders:
+                    recorder.sort_components([component.name for component in manifest.components.select()])
+            else:
+                for component in selected_components:
+                    try:
+                        build_component(component)
+                    except Exception as e:
+                        if continue_on_error(component, e):
+                            continue
+                        else:
+                            raise
+
+        for recorder in [build_recorder] + distribution_recorders:
+            recorder.write_manifest()
+            recorder.write_metrics()
+        if output_store:
+            output_store.gc()
     if len(failed_plugins) > 0:
         logging.error(f"Failed plugins are {failed_plugins}")
     logging.info("Done.")
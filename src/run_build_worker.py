@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import sys
+
+from build_workflow.build_worker import BuildWorker
+from build_workflow.build_worker_args import BuildWorkerArgs
+from system import console
+
+
+def main() -> int:
+    args = BuildWorkerArgs()
+    console.configure(level=args.logging_level)
+    worker = BuildWorker(args.host, args.port, args.maven_local)
+    try:
+        worker.serve_forever()
+    except KeyboardInterrupt:
+        worker.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
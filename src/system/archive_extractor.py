@@ -0,0 +1,152 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+import os
+import shlex
+import shutil
+import stat
+import subprocess
+import tarfile
+import threading
+from typing import Iterator, List
+from zipfile import ZipInfo
+
+from system.execute import execute
+from system.os import current_platform
+from system.rpm_file import RpmFile
+from system.zip_file import ZipFile
+
+"""
+This class is responsible for extracting distributions, keeping the permissions and symbolic links of their files.
+Gzipped tarballs are extracted with tar and pigz when both are installed, pigz decompresses faster than zlib. Otherwise they
+are streamed through tarfile, which is faster than seeking in the archive and does not need to read the gzip stream twice.
+Zips are extracted on a pool of threads, each with its own handle on the archive, zlib releases the GIL while decompressing.
+The permissions of directories and symbolic links in zips are applied last, so that an archive cannot make later files
+unwritable or write through a link. Tarfile only extracts members inside the destination, with its data filter where
+available and by checking the paths and link targets of members otherwise. Rpms are unpacked from their payload in one pass, see RpmFile, and with rpm2cpio and
+cpio when their payload is compressed with a compressor Python does not have.
+"""
+
+
+class ArchiveExtractor:
+    class UnsafeMemberError(tarfile.TarError):
+        def __init__(self, name: str, dest: str) -> None:
+            super().__init__(f"{name} would be extracted outside of {dest}")
+
+    def __init__(self, native: bool = True, workers: int = None) -> None:
+        """
+        :param native: Use tar and pigz when they are installed.
+        :param workers: The number of threads extracting a zip, the number of cores by default.
+        """
+        self.native = native
+        self.workers = workers or os.cpu_count() or 1
+
+    def extract_tar(self, path: str, dest: str) -> None:
+        os.makedirs(dest, exist_ok=True)
+        command = self.__native_tar(path)
+        if command:
+            execute(" ".join(shlex.quote(arg) for arg in command + ["-f", os.path.abspath(path)]), dest)
+            return
+        with tarfile.open(path, "r|*") as tar:
+            # the data filter is in 3.12, and in the security releases of earlier versions
+            if getattr(tarfile, "data_filter", None):
+                tar.extractall(dest, filter="data")  # type: ignore[call-arg]
+            else:
+                tar.extractall(dest, members=self.__tar_members(tar, dest))
+
+    def __tar_members(self, tar: tarfile.TarFile, dest: str) -> Iterator[tarfile.TarInfo]:
+        # members are checked as they are streamed, after the links before them have been extracted
+        dest = os.path.realpath(dest)
+
+        def check(name: str, path: str) -> None:
+            if path != dest and not path.startswith(dest + os.sep):
+                raise ArchiveExtractor.UnsafeMemberError(name, dest)
+
+        for member in tar:
+            target = os.path.join(dest, member.name)
+            if member.issym() or member.islnk():
+                # an existing link at target is replaced, its parent must not be one
+                check(member.name, os.path.realpath(os.path.dirname(target)))
+                link = os.path.join(os.path.dirname(target) if member.issym() else dest, member.linkname)
+                check(member.name, os.path.realpath(link))
+            else:
+                check(member.name, os.path.realpath(target))
+            yield member
+
+    def extract_zip(self, path: str, dest: str) -> None:
+        with ZipFile(path, "r") as zip:
+            members = zip.infolist()
+        dirs: List[ZipInfo] = []
+        links: List[ZipInfo] = []
+        files: List[ZipInfo] = []
+        for member in members:
+            if member.is_dir():
+                dirs.append(member)
+            elif stat.S_ISLNK(member.external_attr >> 16):
+                links.append(member)
+            else:
+                files.append(member)
+
+        # zipfile creates the missing parent directory of each file, which fails when two threads create the same one
+        for parent in {os.path.dirname(ZipFile.target_path(member, dest)) for member in files}:
+            os.makedirs(parent, exist_ok=True)
+
+        local = threading.local()
+        handles: List[ZipFile] = []
+        lock = threading.Lock()
+
+        def extract(member: ZipInfo) -> None:
+            if not hasattr(local, "zip"):
+                local.zip = ZipFile(path, "r")
+                with lock:
+                    handles.append(local.zip)
+            local.zip.extract(member, dest)
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="unzip") as executor:
+                # largest first, so that threads finish together
+                for _ in executor.map(extract, sorted(files, key=lambda member: int(member.file_size), reverse=True)):
+                    pass
+        finally:
+            for handle in handles:
+                handle.close()
+
+        with ZipFile(path, "r") as zip:
+            for member in links + sorted(dirs, key=lambda member: str(member.filename), reverse=True):
+                zip.extract(member, dest)
+
+    def extract_rpm(self, path: str, dest: str) -> None:
+        os.makedirs(dest, exist_ok=True)
+        try:
+            RpmFile(path).extractall(dest)
+        except RpmFile.UnsupportedPayloadError as e:
+            logging.info(f"{e}, extracting with rpm2cpio and cpio")
+            self.__rpm2cpio(path, dest)
+
+    def __rpm2cpio(self, path: str, dest: str) -> None:
+        # the payload is piped from rpm2cpio to cpio, without an intermediate file
+        rpm2cpio = subprocess.Popen(["rpm2cpio", os.path.abspath(path)], stdout=subprocess.PIPE, cwd=dest)
+        try:
+            cpio = subprocess.Popen(["cpio", "-imd"], stdin=rpm2cpio.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT, cwd=dest)
+        finally:
+            # cpio has its own handle on the pipe, rpm2cpio stops if cpio does
+            rpm2cpio.stdout.close()
+        for process in [cpio, rpm2cpio]:
+            if process.wait():
+                raise subprocess.CalledProcessError(process.returncode, process.args)
+
+    def __native_tar(self, path: str) -> List[str]:
+        if not self.native or current_platform() == "windows" or not path.endswith((".gz", ".tgz")):
+            return None
+        tar = shutil.which("tar")
+        pigz = shutil.which("pigz")
+        if not tar or not pigz:
+            return None
+        # -p keeps permissions like tarfile does
+        return [tar, "-x", "-p", f"--use-compress-program={pigz}"]
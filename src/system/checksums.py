@@ -0,0 +1,26 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+from typing import Dict, List
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def file_digests(path: str, algorithms: List[str] = ["sha256", "sha512"]) -> Dict[str, str]:
+    """
+    Compute the hex digests of a file with several algorithms in a single pass over its content.
+    :param path: The path of the file.
+    :param algorithms: The hashlib algorithms, e.g. sha256.
+    :returns a dict of algorithm to hex digest.
+    """
+    hashes = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            for hash in hashes.values():
+                hash.update(chunk)
+    return {algorithm: hash.hexdigest() for algorithm, hash in hashes.items()}
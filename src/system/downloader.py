@@ -0,0 +1,161 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import logging
+import os
+import time
+import urllib.parse
+import urllib.request
+from typing import Any, Dict, List, Tuple
+
+import requests
+import urllib3
+
+
+class Downloader:
+    """
+    Downloads files over a pool of keep-alive HTTP connections, with a bounded number of concurrent downloads.
+    Failed downloads are retried with exponential backoff, and resume from the partial file with a range request.
+    A file that already exists is not downloaded again when it is identical to the remote file, based on its ETag or size.
+    """
+
+    # statuses worth retrying, any other error status fails the download
+    RETRY_STATUSES = {408, 429, 500, 502, 503, 504}
+
+    CHUNK_SIZE = 1024 * 1024
+
+    class DownloadError(Exception):
+        def __init__(self, url: str, message: str) -> None:
+            self.url = url
+            super().__init__(f"Unable to download {url}: {message}")
+
+    class RetryableError(Exception):
+        pass
+
+    def __init__(self, workers: int = 4, retries: int = 3, backoff: float = 1.0, timeout: float = 60) -> None:
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = requests.Session()
+        # sizes and ranges are compared with the stored bytes, the files must not be transfer encoded, e.g. with gzip
+        self.session.headers["Accept-Encoding"] = "identity"
+        adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def __enter__(self) -> 'Downloader':
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, exc_traceback: Any) -> None:
+        self.session.close()
+
+    def download_all(self, downloads: List[Tuple[str, str]]) -> None:
+        """
+        Download (url, dest) pairs concurrently, raising the first error once all downloads have finished.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="download") as executor:
+            futures = [executor.submit(self.download, url, dest) for url, dest in downloads]
+            concurrent.futures.wait(futures)
+        for future in futures:
+            future.result()
+
+    def download(self, url: str, dest: str) -> bool:
+        """
+        Download url into dest, returning False when dest was already identical to the remote file.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        if urllib.parse.urlparse(url).scheme not in ["http", "https"]:
+            # e.g. file:// urls of local distributions
+            urllib.request.urlretrieve(url, dest)
+            return True
+        for attempt in range(self.retries + 1):
+            try:
+                if os.path.isfile(dest) and self.__identical(url, dest):
+                    logging.info(f"Skipping {url}, {dest} is up to date")
+                    return False
+                self.__download(url, dest)
+                return True
+            except (requests.ConnectionError, requests.Timeout, urllib3.exceptions.HTTPError, Downloader.RetryableError) as e:
+                if attempt == self.retries:
+                    raise Downloader.DownloadError(url, str(e))
+                delay = self.backoff * 2 ** attempt
+                logging.warning(f"Error downloading {url} ({e}), retrying in {delay}s")
+                time.sleep(delay)
+        return True  # pragma: no cover
+
+    def __check(self, url: str, response: requests.Response) -> None:
+        if response.status_code in self.RETRY_STATUSES:
+            raise Downloader.RetryableError(f"HTTP {response.status_code}")
+        if response.status_code >= 400:
+            raise Downloader.DownloadError(url, f"HTTP {response.status_code}")
+
+    def __identical(self, url: str, dest: str) -> bool:
+        with self.session.head(url, timeout=self.timeout, allow_redirects=True) as response:
+            self.__check(url, response)
+            etag: str = response.headers.get("ETag", None)
+            if etag:
+                return etag == self.__read_etag(dest)
+            length = response.headers.get("Content-Length", None)
+            return length is not None and int(length) == os.path.getsize(dest)
+
+    def __download(self, url: str, dest: str) -> None:
+        partial = f"{dest}.part"
+        headers: Dict[str, str] = {}
+        offset = os.path.getsize(partial) if os.path.isfile(partial) else 0
+        etag = self.__read_etag(partial)
+        if offset and etag:
+            # If-Range makes the server send the whole file when it has changed since the partial download started
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = etag
+
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if headers and response.status_code not in [200, 206] and response.status_code not in self.RETRY_STATUSES:
+                # e.g. 416 when the partial file is already complete, the partial file cannot be resumed
+                logging.warning(f"Unable to resume {url} (HTTP {response.status_code}), downloading it again")
+                response.close()
+                os.remove(partial)
+                self.__write_etag(partial, None)
+                self.__download(url, dest)
+                return
+            self.__check(url, response)
+            etag = response.headers.get("ETag", None)
+            if response.status_code == 206:
+                logging.info(f"Resuming {url} from {offset} bytes")
+                mode = "ab"
+                expected = offset + int(response.headers["Content-Length"]) if "Content-Length" in response.headers else None
+            else:
+                mode = "wb"
+                expected = int(response.headers["Content-Length"]) if "Content-Length" in response.headers else None
+            self.__write_etag(partial, etag)
+            with open(partial, mode) as f:
+                # read the raw body, Content-Length and ranges are relative to the encoded content
+                for chunk in response.raw.stream(self.CHUNK_SIZE, decode_content=False):
+                    f.write(chunk)
+
+        size = os.path.getsize(partial)
+        if expected is not None and size != expected:
+            raise Downloader.RetryableError(f"incomplete download, {size} of {expected} bytes")
+
+        os.replace(partial, dest)
+        self.__write_etag(dest, etag)
+        self.__write_etag(partial, None)
+
+    def __read_etag(self, path: str) -> str:
+        try:
+            with open(f"{path}.etag") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def __write_etag(self, path: str, etag: str) -> None:
+        if etag:
+            with open(f"{path}.etag", "w") as f:
+                f.write(etag)
+        elif os.path.exists(f"{path}.etag"):
+            os.remove(f"{path}.etag")
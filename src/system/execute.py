@@ -5,9 +5,12 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import gzip
 import logging
+import os
 import subprocess
-from typing import Any, Tuple
+from collections import deque
+from typing import Any, Deque, Tuple
 
 
 def execute(command: str, dir: str, capture: bool = True, raise_on_failure: bool = True) -> Tuple[int, Any, Any]:
@@ -24,3 +27,27 @@ def execute(command: str, dir: str, capture: bool = True, raise_on_failure: bool
     if raise_on_failure:
         result.check_returncode()
     return result.returncode, result.stdout, result.stderr
+
+
+def execute_to_log(command: str, dir: str, log_path: str, tail: int = 100) -> None:
+    """
+    Execute a shell command inside a directory, streaming its combined stdout and stderr to a gzip-compressed log.
+    Output is read in bounded chunks and only the last lines are kept in memory, however much the command writes.
+    :param command: The shell command to execute.
+    :param dir: The full path to the directory that the command should be executed in.
+    :param log_path: The path of the compressed log, e.g. alerting.log.gz.
+    :param tail: The number of last lines of the log written to the console when the command fails.
+    """
+    logging.info(f'Executing "{command}" in {dir}, output in {log_path}')
+    os.makedirs(os.path.dirname(os.path.abspath(log_path)), exist_ok=True)
+    lines: Deque[bytes] = deque(maxlen=tail)
+    with gzip.open(log_path, "wb") as log, subprocess.Popen(command, cwd=dir, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT) as process:
+        for line in iter(lambda: process.stdout.readline(64 * 1024), b""):
+            log.write(line)
+            lines.append(line)
+        returncode = process.wait()
+    if returncode:
+        logging.error(f'"{command}" failed, last {len(lines)} line(s) of {log_path}:')
+        for line in lines:
+            logging.error(line.decode("utf-8", errors="replace").rstrip())
+        raise subprocess.CalledProcessError(returncode, command)
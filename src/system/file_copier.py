@@ -0,0 +1,105 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import logging
+import os
+import shutil
+import threading
+from typing import Callable, Dict, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore[assignment]
+
+
+class FileCopier:
+    """
+    Copies files with the cheapest method supported between the source and the destination filesystems.
+    Methods are tried in order: a hard link, a reflink (copy-on-write clone), copy_file_range, and finally a regular copy.
+    A method that is not supported is not tried again for the same pair of filesystems.
+    With move=True files are moved instead, for sources that are going to be discarded anyway.
+    """
+
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    COPY_FILE_RANGE = "copy_file_range"
+    COPY = "copy"
+    MOVE = "move"
+
+    METHODS = [HARDLINK, REFLINK, COPY_FILE_RANGE, COPY]
+
+    # errors that mean that a method is not supported between two filesystems, as opposed to the copy itself failing
+    UNSUPPORTED = {errno.EXDEV, errno.EPERM, errno.EACCES, errno.EMLINK, errno.EINVAL, errno.ENOSYS, errno.ENOTTY, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+    # ioctl request to clone a file, see ioctl_ficlone(2)
+    FICLONE = 0x40049409
+
+    def __init__(self, move: bool = False, methods: List[str] = METHODS) -> None:
+        self.move = move
+        self.methods = methods
+        self.filesystems: Dict[Tuple[int, int], int] = {}
+        self.lock = threading.Lock()
+        self.__copiers: Dict[str, Callable[[str, str], None]] = {
+            self.HARDLINK: self.__hardlink,
+            self.REFLINK: self.__reflink,
+            self.COPY_FILE_RANGE: self.__copy_file_range,
+            self.COPY: self.__copy,
+        }
+
+    def copy(self, src: str, dest: str) -> str:
+        """
+        Copy src to dest, overwriting dest, and return the method used.
+        """
+        if self.move:
+            shutil.move(src, dest)
+            return self.MOVE
+
+        filesystems = (os.stat(src).st_dev, os.stat(os.path.dirname(os.path.abspath(dest))).st_dev)
+        with self.lock:
+            first = self.filesystems.get(filesystems, 0)
+
+        # dest may be a hard link to another output, replace it instead of writing through the shared inode
+        if os.path.lexists(dest):
+            os.remove(dest)
+
+        for index in range(first, len(self.methods)):
+            method = self.methods[index]
+            try:
+                self.__copiers[method](src, dest)
+                return method
+            except OSError as e:
+                if method == self.COPY or e.errno not in self.UNSUPPORTED:
+                    raise
+                logging.debug(f"Unable to {method} {src} to {dest}: {e}")
+                with self.lock:
+                    self.filesystems[filesystems] = max(self.filesystems.get(filesystems, 0), index + 1)
+        raise ValueError(f"No method to copy {src} to {dest}")
+
+    def __hardlink(self, src: str, dest: str) -> None:
+        os.link(src, dest)
+
+    def __reflink(self, src: str, dest: str) -> None:
+        if not fcntl:  # pragma: no cover
+            raise OSError(errno.ENOSYS, "reflink is not supported")
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            fcntl.ioctl(fdest.fileno(), self.FICLONE, fsrc.fileno())
+
+    def __copy_file_range(self, src: str, dest: str) -> None:
+        if not hasattr(os, "copy_file_range"):  # pragma: no cover
+            raise OSError(errno.ENOSYS, "copy_file_range is not supported")
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdest:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdest.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+
+    def __copy(self, src: str, dest: str) -> None:
+        shutil.copyfile(src, dest)
@@ -0,0 +1,82 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import concurrent.futures
+import io
+import os
+import zlib
+from collections import deque
+from typing import Any, Deque
+
+"""
+This class is responsible for writing gzip files using all cores, like pigz.
+The data written is cut into blocks of a fixed size, each block is compressed on a pool of threads into a gzip member of
+its own, and the members are written in order. Concatenated gzip members are a valid gzip file, which gzip, tar and Python
+read as a whole. Block boundaries do not depend on the number of threads and members have no timestamp, so the same data
+is always compressed into the same bytes. Independent blocks compress slightly worse than a single stream.
+"""
+
+
+class ParallelGzipFile(io.BufferedIOBase):
+    BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, path: str, compresslevel: int = 9, workers: int = None) -> None:
+        super().__init__()
+        self.name = path
+        self.compresslevel = compresslevel
+        self.workers = workers or os.cpu_count() or 1
+        self.fileobj = open(path, "wb")
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="gzip")
+        self.pending: Deque[concurrent.futures.Future] = deque()
+        self.buffer = bytearray()
+        self.size = 0
+        self.members = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        # the position in the uncompressed data, like gzip.GzipFile
+        return self.size
+
+    def write(self, data: Any) -> int:
+        if self.closed:
+            raise ValueError("write to closed file")
+        data = memoryview(data).cast("B")
+        self.buffer += data
+        self.size += len(data)
+        while len(self.buffer) >= self.BLOCK_SIZE:
+            self.__submit(bytes(self.buffer[:self.BLOCK_SIZE]))
+            del self.buffer[:self.BLOCK_SIZE]
+        return len(data)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            if self.buffer or not self.members:
+                self.__submit(bytes(self.buffer))
+                self.buffer.clear()
+            while self.pending:
+                self.fileobj.write(self.pending.popleft().result())
+        finally:
+            self.executor.shutdown(cancel_futures=True)
+            self.fileobj.close()
+            super().close()
+
+    def __submit(self, block: bytes) -> None:
+        self.pending.append(self.executor.submit(self.compress, block, self.compresslevel))
+        self.members += 1
+        # bound memory, blocks are written in order as soon as those before them are
+        while len(self.pending) > 2 * self.workers or (self.pending and self.pending[0].done()):
+            self.fileobj.write(self.pending.popleft().result())
+
+    @classmethod
+    def compress(cls, block: bytes, compresslevel: int) -> bytes:
+        # zlib releases the GIL while compressing, and writes a gzip header without a timestamp
+        compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        return compressor.compress(block) + compressor.flush()
@@ -0,0 +1,194 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import bz2
+import gzip
+import logging
+import lzma
+import os
+import stat
+import struct
+from typing import IO, Any, Callable, Dict, List, Tuple, cast
+
+"""
+This class is responsible for extracting the files of an rpm package, like `rpm2cpio <rpm> | cpio -imd` does.
+It reads the lead and the headers of the package, then decompresses the cpio payload and unpacks it directly to disk in a
+single pass, without an intermediate cpio file. Members are never written through a symbolic link outside of the
+destination. Permissions, modification times, symbolic and hard links are kept,
+ownership is not. Payloads compressed with a compressor Python does not have, e.g. zstd, raise UnsupportedPayloadError.
+"""
+
+
+class RpmFile:
+    LEAD_MAGIC = b"\xed\xab\xee\xdb"
+    LEAD_SIZE = 96
+    HEADER_MAGIC = b"\x8e\xad\xe8\x01"
+    HEADER_INTRO = struct.Struct(">4s4xII")
+    HEADER_INDEX = struct.Struct(">iiii")
+    STRING_TYPE = 6
+    TAG_PAYLOAD_FORMAT = 1124
+    TAG_PAYLOAD_COMPRESSOR = 1125
+    CPIO_MAGICS = [b"070701", b"070702"]
+    CPIO_HEADER_SIZE = 110
+    CPIO_TRAILER = "TRAILER!!!"
+    DECOMPRESSORS: Dict[str, Callable[[IO[bytes]], IO[bytes]]] = {
+        "gzip": lambda f: cast(IO[bytes], gzip.GzipFile(fileobj=f, mode="rb")),
+        "bzip2": lambda f: bz2.BZ2File(f, "rb"),
+        "xz": lambda f: lzma.LZMAFile(f, "rb"),
+        "lzma": lambda f: lzma.LZMAFile(f, "rb"),
+    }
+    CHUNK_SIZE = 1024 * 1024
+
+    class InvalidRpmError(Exception):
+        def __init__(self, path: str, reason: str) -> None:
+            super().__init__(f"{os.path.basename(path)} {reason}")
+
+    class UnsupportedPayloadError(Exception):
+        def __init__(self, path: str, reason: str) -> None:
+            super().__init__(f"{os.path.basename(path)} {reason}")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            lead = f.read(self.LEAD_SIZE)
+            if len(lead) != self.LEAD_SIZE or not lead.startswith(self.LEAD_MAGIC):
+                raise RpmFile.InvalidRpmError(path, "is not an rpm package")
+            # the signature header is padded to 8 bytes, the header is not
+            signature_size = self.__skip_header(f)
+            f.seek((8 - signature_size % 8) % 8, os.SEEK_CUR)
+            self.tags = self.__read_header(f)
+            self.payload_offset = f.tell()
+
+    @property
+    def payload_format(self) -> str:
+        return self.tags.get(self.TAG_PAYLOAD_FORMAT, "cpio")
+
+    @property
+    def payload_compressor(self) -> str:
+        return self.tags.get(self.TAG_PAYLOAD_COMPRESSOR, "gzip")
+
+    def extractall(self, dest: str) -> None:
+        if self.payload_format != "cpio":
+            raise RpmFile.UnsupportedPayloadError(self.path, f"has a {self.payload_format} payload")
+        if self.payload_compressor not in self.DECOMPRESSORS:
+            raise RpmFile.UnsupportedPayloadError(self.path, f"has a payload compressed with {self.payload_compressor}")
+        with open(self.path, "rb") as f:
+            f.seek(self.payload_offset)
+            with self.DECOMPRESSORS[self.payload_compressor](f) as payload:
+                self.__extract_cpio(payload, dest)
+
+    def __skip_header(self, f: IO[bytes]) -> int:
+        magic, entries, data_size = self.__read_struct(f, self.HEADER_INTRO)
+        if magic != self.HEADER_MAGIC:
+            raise RpmFile.InvalidRpmError(self.path, "has an invalid header")
+        size: int = entries * self.HEADER_INDEX.size + data_size
+        f.seek(size, os.SEEK_CUR)
+        return self.HEADER_INTRO.size + size
+
+    def __read_header(self, f: IO[bytes]) -> Dict[int, str]:
+        magic, entries, data_size = self.__read_struct(f, self.HEADER_INTRO)
+        if magic != self.HEADER_MAGIC:
+            raise RpmFile.InvalidRpmError(self.path, "has an invalid header")
+        index = [self.__read_struct(f, self.HEADER_INDEX) for _ in range(entries)]
+        data = self.__read(f, data_size)
+        # only the string tags are needed, e.g. the payload compressor
+        return {tag: data[offset:data.index(b"\0", offset)].decode("utf-8") for tag, type, offset, count in index if type == self.STRING_TYPE}
+
+    def __extract_cpio(self, payload: IO[bytes], dest: str) -> None:
+        dirs: List[Tuple[str, int, int]] = []
+        links: Dict[Tuple[int, int, int], List[Tuple[str, int, int]]] = {}
+        first = True
+        while True:
+            header = self.__read(payload, self.CPIO_HEADER_SIZE)
+            if header[:6] not in self.CPIO_MAGICS:
+                if first:
+                    raise RpmFile.UnsupportedPayloadError(self.path, f"has a cpio payload in an unsupported format {header[:6]!r}")
+                raise RpmFile.InvalidRpmError(self.path, "has an invalid cpio payload")
+            first = False
+            ino, mode, uid, gid, nlink, mtime, size, devmajor, devminor, rdevmajor, rdevminor, name_size, check = [
+                int(header[i:i + 8], 16) for i in range(6, self.CPIO_HEADER_SIZE, 8)
+            ]
+            name = self.__read(payload, name_size)[:-1].decode("utf-8")
+            self.__read(payload, self.__padding(self.CPIO_HEADER_SIZE + name_size))
+            if name == self.CPIO_TRAILER:
+                break
+
+            # the permissions of a directory are set through a link, any other member replaces it
+            path = self.__target(dest, name, stat.S_ISDIR(mode))
+            if stat.S_ISDIR(mode):
+                os.makedirs(path, exist_ok=True)
+                dirs.append((path, mode, mtime))
+                continue
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if os.path.islink(path) or (os.path.lexists(path) and not os.path.isdir(path)):
+                os.remove(path)
+            if stat.S_ISLNK(mode):
+                os.symlink(self.__read(payload, size).decode("utf-8"), path)
+                if os.utime in os.supports_follow_symlinks:
+                    os.utime(path, (mtime, mtime), follow_symlinks=False)
+            elif stat.S_ISREG(mode):
+                # hard links share an inode, its data comes with the last of them
+                key = (devmajor, devminor, ino)
+                if nlink > 1 and size == 0:
+                    links.setdefault(key, []).append((path, mode, mtime))
+                    continue
+                self.__write(payload, path, size, mode, mtime)
+                for link, _, _ in links.pop(key, []):
+                    os.link(path, link)
+            else:
+                logging.warning(f"Skipping {name} in {os.path.basename(self.path)}, not a file, a directory or a link")
+                self.__read(payload, size)
+            self.__read(payload, self.__padding(size))
+
+        # hard links without data are empty files
+        for (path, mode, mtime), *others in links.values():
+            self.__write(payload, path, 0, mode, mtime)
+            for link, _, _ in others:
+                os.link(path, link)
+
+        # directories last, so that their permissions do not prevent extracting their files
+        for path, mode, mtime in reversed(dirs):
+            os.chmod(path, stat.S_IMODE(mode))
+            os.utime(path, (mtime, mtime))
+
+    def __write(self, payload: IO[bytes], path: str, size: int, mode: int, mtime: int) -> None:
+        with open(path, "wb") as f:
+            remaining = size
+            while remaining:
+                chunk = payload.read(min(remaining, self.CHUNK_SIZE))
+                if not chunk:
+                    raise RpmFile.InvalidRpmError(self.path, "has a truncated payload")
+                f.write(chunk)
+                remaining -= len(chunk)
+        os.chmod(path, stat.S_IMODE(mode))
+        os.utime(path, (mtime, mtime))
+
+    def __target(self, dest: str, name: str, follow: bool) -> str:
+        parts = [part for part in name.split("/") if part not in ["", "."]]
+        if ".." in parts:
+            raise RpmFile.InvalidRpmError(self.path, f"contains {name}, outside of the destination")
+        path = os.path.join(dest, *parts)
+        # the links extracted before a member must not take it outside of the destination
+        real_dest = os.path.realpath(dest)
+        real_path = os.path.realpath(path if follow or not parts else os.path.dirname(path))
+        if real_path != real_dest and not real_path.startswith(real_dest + os.sep):
+            raise RpmFile.InvalidRpmError(self.path, f"contains {name}, outside of the destination through a symbolic link")
+        return path
+
+    def __read_struct(self, f: IO[bytes], format: struct.Struct) -> Any:
+        return format.unpack(self.__read(f, format.size))
+
+    def __read(self, f: IO[bytes], size: int) -> bytes:
+        data = f.read(size)
+        if len(data) != size:
+            raise RpmFile.InvalidRpmError(self.path, "is truncated")
+        return data
+
+    @classmethod
+    def __padding(cls, size: int) -> int:
+        return (4 - size % 4) % 4
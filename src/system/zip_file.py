@@ -7,19 +7,120 @@
 
 # https://stackoverflow.com/questions/39296101/python-zipfile-removes-execute-permissions-from-binaries
 
+import concurrent.futures
 import os
+import stat
 import zipfile
+import zlib
+from collections import deque
+from typing import Deque, Iterable, List, Tuple, Union
 
 
 class ZipFile(zipfile.ZipFile):
+    CHUNK_SIZE = 1024 * 1024
+
+    class UnsafeMemberError(Exception):
+        def __init__(self, name: str, dest: str) -> None:
+            super().__init__(f"{name} would be extracted through a symbolic link outside of {dest}")
+
+    def extractall(self, path: Union[str, 'os.PathLike[str]'] = None, members: Iterable[Union[str, zipfile.ZipInfo]] = None, pwd: bytes = None) -> None:
+        # links last, so that members are not written through the links extracted before them
+        infos = [member if isinstance(member, zipfile.ZipInfo) else self.getinfo(member) for member in (members or self.infolist())]
+        links = [info for info in infos if stat.S_ISLNK(info.external_attr >> 16)]
+        super().extractall(path, [info for info in infos if info not in links] + links, pwd)
+
     def _extract_member(self, member: zipfile.ZipInfo, targetpath: str, pwd: str) -> str:
         if not isinstance(member, zipfile.ZipInfo):
             member = self.getinfo(member)
 
+        # a link extracted earlier, e.g. by a previous call to extract(), must not take a member outside of the destination
+        dest = os.path.realpath(targetpath or os.getcwd())
+        parent = os.path.realpath(os.path.dirname(self.target_path(member, dest)))
+        if parent != dest and not parent.startswith(dest + os.sep):
+            raise ZipFile.UnsafeMemberError(member.filename, dest)
+
         targetpath = super()._extract_member(member, targetpath, pwd)  # type: ignore[misc]
 
         attr = member.external_attr >> 16
-        if attr != 0:
+        if stat.S_ISLNK(attr):
+            # the content of a link is its target
+            with open(targetpath) as f:
+                target = f.read()
+            os.remove(targetpath)
+            os.symlink(target, targetpath)
+        elif attr != 0:
             os.chmod(targetpath, attr)
 
         return targetpath
+
+    @classmethod
+    def target_path(cls, member: zipfile.ZipInfo, dest: str) -> str:
+        """
+        Return the path a member is extracted to in dest, without the absolute, . and .. parts of its name, like zipfile does.
+        """
+        name = member.filename.replace("/", os.path.sep)
+        if os.path.altsep:
+            name = name.replace(os.path.altsep, os.path.sep)
+        parts = [part for part in os.path.splitdrive(name)[1].split(os.path.sep) if part not in ["", os.path.curdir, os.path.pardir]]
+        return os.path.normpath(os.path.join(dest, *parts))
+
+    def write_files(self, files: List[Tuple[str, str]], workers: int = None) -> None:
+        """
+        Write files by path and name in the zip, in order, deflating them on a pool of threads.
+        Each file is written with the same bytes as with write(), whatever the number of threads.
+        """
+        if self.compression != zipfile.ZIP_DEFLATED:
+            for path, arcname in files:
+                self.write(path, arcname)
+            return
+        workers = workers or os.cpu_count() or 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zip") as executor:
+            pending: Deque[concurrent.futures.Future] = deque()
+            for path, arcname in files:
+                pending.append(executor.submit(self.__deflate, path, arcname))
+                # bound memory, files are written in order as soon as those before them are
+                while len(pending) > 2 * workers or (pending and pending[0].done()):
+                    self.__write_deflated(*pending.popleft().result())
+            while pending:
+                self.__write_deflated(*pending.popleft().result())
+
+    def __deflate(self, path: str, arcname: str) -> Tuple[str, zipfile.ZipInfo, bytes]:
+        zinfo = zipfile.ZipInfo.from_file(path, arcname, strict_timestamps=self._strict_timestamps)  # type: ignore[attr-defined]
+        if zinfo.is_dir():
+            return path, zinfo, None
+        zinfo.compress_type = self.compression
+        zinfo._compresslevel = self.compresslevel  # type: ignore[attr-defined]
+        # as zipfile does, zlib releases the GIL while compressing
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION if self.compresslevel is None else self.compresslevel, zlib.DEFLATED, -15)
+        crc = 0
+        chunks = []
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                crc = zlib.crc32(chunk, crc)
+                chunks.append(compressor.compress(chunk))
+        chunks.append(compressor.flush())
+        data = b"".join(chunks)
+        zinfo.CRC = crc
+        zinfo.compress_size = len(data)
+        return path, zinfo, data
+
+    def __write_deflated(self, path: str, zinfo: zipfile.ZipInfo, data: bytes) -> None:
+        if data is None:
+            self.write(path, zinfo.filename)
+            return
+        # what write() does, with the data compressed beforehand
+        zip64 = self._allowZip64 and zinfo.file_size * 1.05 > zipfile.ZIP64_LIMIT  # type: ignore[attr-defined]
+        with self._lock:  # type: ignore[attr-defined]
+            if self._seekable:  # type: ignore[attr-defined]
+                self.fp.seek(self.start_dir)
+            zinfo.header_offset = self.fp.tell()
+            self._writecheck(zinfo)  # type: ignore[attr-defined]
+            self._didModify = True
+            self.fp.write(zinfo.FileHeader(zip64))
+            self.fp.write(data)
+            self.start_dir = self.fp.tell()
+            self.filelist.append(zinfo)
+            self.NameToInfo[zinfo.filename] = zinfo
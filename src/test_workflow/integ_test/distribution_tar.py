@@ -8,8 +8,8 @@
 import logging
 import os
 import subprocess
-import tarfile
 
+from system.archive_extractor import ArchiveExtractor
 from test_workflow.integ_test.distribution import Distribution
 
 
@@ -35,8 +35,7 @@ class DistributionTar(Distribution):
 
     def install(self, bundle_name: str) -> None:
         logging.info(f"Installing {bundle_name} in {self.install_dir}")
-        with tarfile.open(bundle_name, 'r:gz') as bundle_tar:
-            bundle_tar.extractall(self.work_dir)
+        ArchiveExtractor().extract_tar(bundle_name, self.work_dir)
 
     @property
     def start_cmd(self) -> str:
@@ -9,7 +9,7 @@ import logging
 import os
 import subprocess
 
-from system.zip_file import ZipFile
+from system.archive_extractor import ArchiveExtractor
 from test_workflow.integ_test.distribution import Distribution
 
 
@@ -35,8 +35,7 @@ class DistributionZip(Distribution):
 
     def install(self, bundle_name: str) -> None:
         logging.info(f"Installing {bundle_name} in {self.install_dir}")
-        with ZipFile(bundle_name, "r") as zip:
-            zip.extractall(self.work_dir)
+        ArchiveExtractor().extract_zip(bundle_name, self.work_dir)
 
     @property
     def start_cmd(self) -> str:
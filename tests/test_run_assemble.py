@@ -44,7 +44,7 @@ class TestRunAssemble(unittest.TestCase):
         mock_bundle.install_min.assert_called()
         mock_bundle.install_components.assert_called()
 
-        mock_bundle.package.assert_called_with(os.path.join("curdir", "tar", "dist", "opensearch"))
+        mock_bundle.package.assert_called_with(os.path.join("curdir", "tar", "dist", "opensearch"), None)
 
         mock_recorder.return_value.write_manifest.assert_has_calls([
             call("path"),
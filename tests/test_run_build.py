@@ -292,6 +292,231 @@ class TestRunBuild(unittest.TestCase):
             main()
         mock_logging_error.assert_called_with(f"Error building common-utils, retry with: run_build.py {self.NON_OPENSEARCH_MANIFEST} --component common-utils")
 
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_parallel(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        self.assertNotEqual(mock_builder.return_value.build.call_count, 0)
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.call_count)
+        self.assertEqual(mock_builder.return_value.export_artifacts.call_count, mock_builder.call_count)
+        self.assertEqual(mock_builder.call_args_list[0][0][0].name, "OpenSearch")
+        mock_recorder.return_value.sort_components.assert_called_once()
+        mock_recorder.return_value.write_manifest.assert_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", NON_OPENSEARCH_MANIFEST, "-p", "linux", "--continue-on-error", "--parallel", "2"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    @patch("run_build.logging.error")
+    def test_common_utils_failure_parallel(self, mock_logging_error: Mock, mock_temp: Mock, mock_recorder: Mock, mock_builder_from: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_builder = Mock()
+        mock_builder.build.side_effect = Exception("Error building")
+        mock_builder_from.return_value = mock_builder
+        with pytest.raises(Exception, match="Error building"):
+            main()
+        mock_logging_error.assert_any_call(f"Error building common-utils, retry with: run_build.py {self.NON_OPENSEARCH_MANIFEST} --component common-utils")
+        mock_recorder.return_value.write_manifest.assert_not_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--parallel", "4", "--cpus", "8", "--memory", "16"])
+    @patch("run_build.BuildResources")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_parallel_resources(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_resources: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_resources.Monitor.return_value.__enter__.return_value.peaks = {"OpenSearch": 1024}
+        main()
+        self.assertEqual(mock_resources.call_args[0][:2], (8, 16 * 1024 ** 3))
+        self.assertNotEqual(mock_resources.return_value.acquire.call_count, 0)
+        mock_recorder.return_value.metrics.record.assert_called_with("OpenSearch", "peak_rss", 1024)
+        mock_resources.History.return_value.update.assert_called_with({"OpenSearch": 1024})
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--resume"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_resume(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_recorder.return_value.resume.return_value = ["OpenSearch", "common-utils"]
+        main()
+        built = [call[0][0].name for call in mock_builder.call_args_list]
+        self.assertNotEqual(built, [])
+        self.assertNotIn("OpenSearch", built)
+        self.assertNotIn("common-utils", built)
+        self.assertEqual(mock_recorder.return_value.journal_component.call_count, len(built))
+        self.assertEqual(mock_recorder.return_value.resume.call_args[0][0].build.name, "OpenSearch")
+        mock_recorder.return_value.start_journal.assert_not_called()
+        mock_recorder.return_value.write_manifest.assert_called()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--distribution", "tar,rpm"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder")
+    @patch("run_build.TemporaryDirectory")
+    def test_main_distributions(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        cwd = os.getcwd()
+
+        def enter_work_dir() -> MagicMock:
+            # components are built with the work directory as the current directory
+            os.chdir(tempfile.gettempdir())
+            work_dir = MagicMock()
+            work_dir.name = tempfile.gettempdir()
+            return work_dir
+
+        mock_temp.return_value.__enter__.side_effect = enter_work_dir
+        tar_recorder, rpm_recorder = MagicMock(), MagicMock()
+        mock_recorder.side_effect = [tar_recorder, rpm_recorder]
+        mock_builder.return_value.distribution_supported = False
+        try:
+            main()
+        finally:
+            os.chdir(cwd)
+        tar_target, rpm_target = [call[0][0] for call in mock_recorder.call_args_list]
+        tar_recorder.start_journal.assert_called_once_with()
+        rpm_recorder.start_journal.assert_called_once_with()
+        self.assertEqual((tar_target.distribution, rpm_target.distribution), ("tar", "rpm"))
+        self.assertEqual(tar_target.build_id, rpm_target.build_id)
+        self.assertEqual(tar_target.output_dir, os.path.join(cwd, "tar", "builds", "opensearch"))
+        self.assertEqual(rpm_target.output_dir, os.path.join(cwd, "rpm", "builds", "opensearch"))
+        self.assertTrue(all(call[0][1] is tar_target for call in mock_builder.call_args_list))
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.call_count)
+        self.assertEqual(rpm_recorder.record_from.call_count, mock_builder.call_count)
+        rpm_recorder.record_from.assert_any_call(tar_recorder, "OpenSearch")
+        tar_recorder.write_manifest.assert_called_once()
+        rpm_recorder.write_manifest.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--workers", "worker-1:8788", "worker-2:8788"])
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_workers(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        workers = mock_builder.call_args[0][3]
+        self.assertEqual(workers.addresses, ["worker-1:8788", "worker-2:8788"])
+        self.assertTrue(all(call[0][3] is workers for call in mock_builder.call_args_list))
+        self.assertEqual(mock_builder.return_value.build.call_count, mock_builder.call_count)
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--gradle-daemons", "--gradle-user-home", "gradle"])
+    @patch("run_build.GradleDaemons")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_gradle_daemons(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_gradle_daemons: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        usage = {"builds": 3, "daemons_started": 0, "daemons_reused": 3}
+        mock_gradle_daemons.return_value.usage.return_value = usage
+        main()
+        mock_gradle_daemons.assert_called_with("gradle")
+        mock_gradle_daemons.return_value.__enter__.assert_called_once()
+        mock_gradle_daemons.return_value.__exit__.assert_called_once()
+        mock_gradle_daemons.return_value.usage.assert_called_with(mock_recorder.return_value.log_path.return_value)
+        self.assertEqual(mock_gradle_daemons.return_value.usage.call_count, mock_builder.return_value.build.call_count)
+        mock_recorder.return_value.metrics.record.assert_any_call("OpenSearch", "gradle", usage)
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--yarn-cache-dir", "yarn", "--yarn-cache-size", "5"])
+    @patch("run_build.YarnCache")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_yarn_cache(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_yarn_cache: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_yarn_cache.return_value.track.return_value.__enter__.return_value = {"hits": 10, "misses": 2}
+        main()
+        mock_yarn_cache.assert_called_with("yarn", 5 * 1024 ** 3)
+        mock_yarn_cache.return_value.__enter__.assert_called_once()
+        self.assertEqual(mock_yarn_cache.return_value.track.call_count, mock_builder.return_value.build.call_count)
+        mock_recorder.return_value.metrics.record.assert_any_call("OpenSearch", "yarn_cache", {"hits": 10, "misses": 2})
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--yarn-cache"])
+    @patch("run_build.YarnCache")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_yarn_cache_run(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_yarn_cache: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_yarn_cache.return_value.track.return_value.__enter__.return_value = {"hits": 0, "misses": 0}
+        main()
+        mock_yarn_cache.assert_called_with(os.path.join(tempfile.gettempdir(), "yarn-cache"))
+        self.assertNotIn("yarn_cache", [call[0][1] for call in mock_recorder.return_value.metrics.record.call_args_list])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--distribution", "tar,rpm", "--output-store", "store"])
+    @patch("run_build.BuildOutputStore")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_output_store(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_output_store: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        mock_builder.return_value.distribution_supported = False
+        main()
+        mock_output_store.assert_called_with("store")
+        self.assertEqual([call[0][3] for call in mock_recorder.call_args_list], [mock_output_store.return_value] * 2)
+        mock_output_store.return_value.gc.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--build-cache", "cache"])
+    @patch("run_build.BuildCache")
+    @patch("run_build.Builders.builder_from", return_value=MagicMock())
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_build_cache(self, mock_temp: Mock, mock_recorder: Mock, mock_builder: Mock, mock_build_cache: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        self.assertEqual(mock_build_cache.call_args[0][:2], ("cache", 50 * 1024 ** 3))
+        self.assertEqual(mock_builder.call_args[0][2], mock_build_cache.return_value)
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--plan", "--component", "common-utils", "job-scheduler"])
+    @patch("run_build.Builders.builder_from")
+    @patch("run_build.TemporaryDirectory")
+    @patch("logging.info")
+    def test_main_plan(self, mock_logging: Mock, mock_temp: Mock, mock_builder_from: Mock, *mocks: Any) -> None:
+        self.assertEqual(main(), 0)
+        mock_temp.assert_not_called()
+        mock_builder_from.assert_not_called()
+        mock_logging.assert_has_calls([
+            call("Building 2 component(s):"),
+            call("  common-utils: selected, depends on nothing"),
+            call("  job-scheduler: selected, depends on nothing"),
+        ])
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--component", "common-utils"])
+    @patch("run_build.Builders.builder_from")
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_metrics(self, mock_temp: Mock, mock_recorder: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        main()
+        mock_recorder.return_value.metrics.phase.assert_has_calls([
+            call("common-utils", "checkout"),
+            call("common-utils", "build"),
+            call("common-utils", "export"),
+            call("common-utils", "check"),
+        ], any_order=True)
+        mock_recorder.return_value.write_metrics.assert_called_once()
+
+    @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "-p", "linux", "--prefetch", "2"])
+    @patch("run_build.Builders.builder_from")
+    @patch("run_build.BuildRecorder", return_value=MagicMock())
+    @patch("run_build.TemporaryDirectory")
+    def test_main_prefetch(self, mock_temp: Mock, mock_recorder: Mock, mock_builder_from: Mock, *mocks: Any) -> None:
+        mock_temp.return_value.__enter__.return_value.name = tempfile.gettempdir()
+        builders = []
+
+        def builder_from(*args: Any) -> MagicMock:
+            builders.append(MagicMock())
+            return builders[-1]
+
+        mock_builder_from.side_effect = builder_from
+        main()
+        self.assertNotEqual(len(builders), 0)
+        for builder in builders:
+            builder.checkout.assert_called_once_with(tempfile.gettempdir())
+            builder.build.assert_called_once()
+            builder.export_artifacts.assert_called_once()
+        mock_recorder.return_value.write_manifest.assert_called()
+
     @patch("argparse._sys.argv", ["run_build.py", OPENSEARCH_MANIFEST, "--incremental"])
     @patch("os.path.exists")
     @patch("run_build.Builders.builder_from", return_value=MagicMock())
@@ -0,0 +1,38 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import unittest
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from run_build_worker import main
+
+
+class TestRunBuildWorker(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _capfd(self, capfd: Any) -> None:
+        self.capfd = capfd
+
+    @patch("argparse._sys.argv", ["run_build_worker.py", "--help"])
+    def test_usage(self) -> None:
+        with self.assertRaises(SystemExit):
+            main()
+
+        out, _ = self.capfd.readouterr()
+        self.assertTrue(out.startswith("usage:"))
+
+    @patch("argparse._sys.argv", ["run_build_worker.py", "--host", "0.0.0.0", "--port", "9000", "--maven-local", "m2"])
+    @patch("run_build_worker.BuildWorker")
+    def test_main(self, mock_worker: Mock) -> None:
+        mock_worker.return_value.serve_forever.side_effect = KeyboardInterrupt
+
+        self.assertEqual(main(), 0)
+
+        mock_worker.assert_called_with("0.0.0.0", 9000, "m2")
+        mock_worker.return_value.close.assert_called()
@@ -53,3 +53,19 @@ class TestAssembleArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--base-url", "url"])
     def test_base_url(self) -> None:
         self.assertEqual(AssembleArgs().base_url, "url")
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST])
+    def test_fast_plugin_install_default(self) -> None:
+        self.assertFalse(AssembleArgs().fast_plugin_install)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--fast-plugin-install"])
+    def test_fast_plugin_install(self) -> None:
+        self.assertTrue(AssembleArgs().fast_plugin_install)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST])
+    def test_compression_level_default(self) -> None:
+        self.assertIsNone(AssembleArgs().compression_level)
+
+    @patch("argparse._sys.argv", [ASSEMBLE_PY, OPENSEARCH_MANIFEST, "--compression-level", "1"])
+    def test_compression_level(self) -> None:
+        self.assertEqual(AssembleArgs().compression_level, 1)
@@ -27,18 +27,16 @@ class TestBundleLinuxRpm(unittest.TestCase):
         self.bundle_linux_rpm_qualifier = BundleLinuxRpm('opensearch', self.package_path, 'opensearch-2.0.0-alpha1')
         self.manifest_rpm_qualifier = BuildManifest.from_path(os.path.join(os.path.dirname(__file__), "data/opensearch-build-rpm-2.0.0-alpha1.yml"))
 
-    @patch("builtins.open")
+    @patch("assemble_workflow.bundle_linux_rpm.ArchiveExtractor")
     @patch("shutil.move")
     @patch("shutil.copy2")
     @patch("subprocess.check_call")
-    def test_extract_rpm(self, check_call_mock: Mock, shutil_copy2_mock: Mock, shutil_move_mock: Mock, builtins_open: Mock) -> None:
+    def test_extract_rpm(self, check_call_mock: Mock, shutil_copy2_mock: Mock, shutil_move_mock: Mock, archive_extractor_mock: Mock) -> None:
 
         self.bundle_linux_rpm.extract(self.artifacts_path)
-        args_list = check_call_mock.call_args_list
 
-        self.assertEqual(check_call_mock.call_count, 2)
-        self.assertEqual(['rpm2cpio', self.package_path], args_list[0][0][0])
-        self.assertEqual(['cpio', '-imdv'], args_list[1][0][0])
+        archive_extractor_mock.return_value.extract_rpm.assert_called_once_with(self.package_path, self.artifacts_path)
+        self.assertEqual(check_call_mock.call_count, 0)
         self.assertEqual(shutil_copy2_mock.call_count, 0)
         self.assertEqual(shutil_move_mock.call_count, 1)
         self.assertEqual(os.environ['OPENSEARCH_PATH_CONF'], os.path.join(self.artifacts_path, 'etc', 'opensearch'))
@@ -11,6 +11,7 @@ import zipfile
 from unittest.mock import MagicMock, Mock, call, patch
 
 from assemble_workflow.bundle_opensearch import BundleOpenSearch
+from assemble_workflow.opensearch_plugin_installer import OpenSearchPluginInstaller
 from manifests.build_manifest import BuildManifest
 from paths.script_finder import ScriptFinder
 from system.os import current_platform
@@ -173,6 +174,27 @@ class TestBundleOpenSearch(unittest.TestCase):
         bundle.install_components()
         self.assertEqual(bundle_install_plugin.call_count, 12)
 
+    @patch.object(OpenSearchPluginInstaller, "install", return_value=["job-scheduler", "alerting"])
+    @patch.object(BundleOpenSearch, "install_plugin")
+    def test_bundle_install_components_fast_plugin_install(self, bundle_install_plugin: Mock, installer_install: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle_recorder = MagicMock()
+        bundle = BundleOpenSearch(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder, fast_plugin_install=True)
+
+        bundle.install_components()
+
+        plugin_zips = installer_install.call_args[0][0]
+        self.assertEqual(len(plugin_zips), 11)
+        self.assertNotIn("performance-analyzer", plugin_zips)
+        self.assertEqual(plugin_zips["job-scheduler"], os.path.join(artifacts_path, "plugins", "opensearch-job-scheduler-1.1.0.0.zip"))
+        self.assertEqual(bundle_install_plugin.call_count, 10)
+        self.assertNotIn(call(bundle.components["job-scheduler"]), bundle_install_plugin.call_args_list)
+        bundle_recorder.record_component.assert_has_calls([
+            call(bundle.components["job-scheduler"], "plugins/opensearch-job-scheduler-1.1.0.0.zip"),
+            call(bundle.components["alerting"], "plugins/opensearch-alerting-1.1.0.0.zip"),
+        ])
+
     @patch("os.path.isfile", return_value=True)
     def test_bundle_install_plugin(self, path_isfile: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
@@ -227,15 +249,29 @@ class TestBundleOpenSearch(unittest.TestCase):
             MagicMock(package_name="opensearch.tar"),
         )
 
-        with patch("tarfile.open") as mock_tarfile_open:
+        with patch("assemble_workflow.dist.ParallelGzipFile") as mock_gzip_file, patch("tarfile.open") as mock_tarfile_open:
             mock_tarfile_add = MagicMock()
             mock_tarfile_open.return_value.__enter__.return_value.add = mock_tarfile_add
             with patch("shutil.copyfile") as mock_copyfile:
                 bundle.package(os.path.dirname(__file__))
-                mock_tarfile_open.assert_called_with("opensearch.tar", "w:gz")
+                mock_gzip_file.assert_called_with("opensearch.tar", 9)
+                mock_tarfile_open.assert_called_with(fileobj=mock_gzip_file.return_value.__enter__.return_value, mode="w")
                 mock_tarfile_add.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.1.0"), arcname="opensearch-1.1.0")
                 self.assertEqual(mock_copyfile.call_count, 1)
 
+    def test_bundle_package_tar_compression_level(self) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-linux-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle = BundleOpenSearch(
+            BuildManifest.from_path(manifest_path),
+            artifacts_path,
+            MagicMock(package_name="opensearch.tar"),
+        )
+
+        with patch("assemble_workflow.dist.ParallelGzipFile") as mock_gzip_file, patch("tarfile.open"), patch("shutil.copyfile"):
+            bundle.package(os.path.dirname(__file__), 1)
+            mock_gzip_file.assert_called_with("opensearch.tar", 1)
+
     def test_bundle_package_zip(self) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data", "opensearch-build-windows-1.3.0.yml")
         artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
@@ -246,10 +282,12 @@ class TestBundleOpenSearch(unittest.TestCase):
         )
 
         with patch("assemble_workflow.dist.ZipFile") as mock_zipfile_open:
-            mock_zipfile_write = MagicMock()
-            mock_zipfile_open.return_value.__enter__.return_value.write = mock_zipfile_write
+            mock_zipfile_write_files = MagicMock()
+            mock_zipfile_open.return_value.__enter__.return_value.write_files = mock_zipfile_write_files
             with patch("shutil.copyfile") as mock_copyfile:
                 bundle.package(os.path.dirname(__file__))
-                mock_zipfile_open.assert_called_with("opensearch.zip", "w", zipfile.ZIP_DEFLATED)
-                mock_zipfile_write.assert_called_with(os.path.join(bundle.tmp_dir.name, "opensearch-1.3.0", "opensearch.txt"), os.path.join("opensearch-1.3.0", "opensearch.txt"))
+                mock_zipfile_open.assert_called_with("opensearch.zip", "w", zipfile.ZIP_DEFLATED, compresslevel=None)
+                mock_zipfile_write_files.assert_called_with([
+                    (os.path.join(bundle.tmp_dir.name, "opensearch-1.3.0", "opensearch.txt"), os.path.join("opensearch-1.3.0", "opensearch.txt")),
+                ])
                 self.assertEqual(mock_copyfile.call_count, 1)
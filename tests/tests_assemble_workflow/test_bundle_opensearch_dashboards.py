@@ -10,6 +10,7 @@ import unittest
 from unittest.mock import MagicMock, Mock, call, patch
 
 from assemble_workflow.bundle_opensearch_dashboards import BundleOpenSearchDashboards
+from assemble_workflow.opensearch_dashboards_plugin_installer import OpenSearchDashboardsPluginInstaller
 from manifests.build_manifest import BuildManifest
 from paths.script_finder import ScriptFinder
 from system.os import current_platform
@@ -59,6 +60,20 @@ class TestBundleOpenSearchDashboards(unittest.TestCase):
                 ]
             )
 
+    @patch.object(OpenSearchDashboardsPluginInstaller, "install", return_value=["alertingDashboards"])
+    @patch.object(BundleOpenSearchDashboards, "install_plugin")
+    def test_bundle_install_components_fast_plugin_install(self, bundle_install_plugin: Mock, installer_install: Mock) -> None:
+        manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-dashboards-build-1.1.0.yml")
+        artifacts_path = os.path.join(os.path.dirname(__file__), "data", "artifacts")
+        bundle_recorder = MagicMock()
+        bundle = BundleOpenSearchDashboards(BuildManifest.from_path(manifest_path), artifacts_path, bundle_recorder, fast_plugin_install=True)
+
+        bundle.install_components()
+
+        installer_install.assert_called_once_with({"alertingDashboards": os.path.join(artifacts_path, "plugins", "alertingDashboards-1.1.0.zip")})
+        bundle_install_plugin.assert_not_called()
+        bundle_recorder.record_component.assert_called_with(bundle.components["alertingDashboards"], "plugins/alertingDashboards-1.1.0.zip")
+
     @patch("os.path.isfile", return_value=True)
     def test_bundle_install_plugin(self, path_isfile: Mock) -> None:
         manifest_path = os.path.join(os.path.dirname(__file__), "data/opensearch-dashboards-build-1.1.0.yml")
@@ -38,7 +38,7 @@ class TestBundles(unittest.TestCase):
     def test_bundle_opensearch_invalid(self) -> None:
         manifest = BuildManifest(
             {
-                "schema-version": "1.2",
+                "schema-version": "1.3",
                 "build": {
                     "name": "invalid",
                     "platform": "linux",
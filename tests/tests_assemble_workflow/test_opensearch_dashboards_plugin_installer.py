@@ -0,0 +1,99 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import stat
+import tempfile
+import unittest
+from typing import Any, Dict
+from zipfile import ZipFile, ZipInfo
+
+from assemble_workflow.opensearch_dashboards_plugin_installer import OpenSearchDashboardsPluginInstaller
+
+
+class TestOpenSearchDashboardsPluginInstaller(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.tmp_dir.name, "opensearch-dashboards-1.1.0")
+        os.makedirs(os.path.join(self.archive_path, "plugins"))
+        self.installer = OpenSearchDashboardsPluginInstaller(self.archive_path, "1.1.0")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __plugin_zip(self, id: str, manifest: Dict[str, Any] = {}, folder: str = None) -> str:
+        path = os.path.join(self.tmp_dir.name, f"{id}.zip")
+        archive_dir = f"opensearch-dashboards/{folder or id}"
+        with ZipFile(path, "w") as zip:
+            # a regular file without permissions, as zipped by some tools
+            manifest_info = ZipInfo(f"{archive_dir}/opensearch_dashboards.json")
+            manifest_info.external_attr = stat.S_IFREG << 16
+            zip.writestr(manifest_info, json.dumps({"id": id, "version": "1.1.0.0", "opensearchDashboardsVersion": "1.1.0", **manifest}))
+            zip.writestr(f"{archive_dir}/target/public/{id}.plugin.js", "")
+            zip.writestr(f"{archive_dir}/README.md", "")
+            executable = ZipInfo(f"{archive_dir}/bin/{id}")
+            executable.external_attr = 0o755 << 16
+            zip.writestr(executable, "#!/bin/sh")
+        return path
+
+    def test_install(self) -> None:
+        plugin_zips = {
+            "alertingDashboards": self.__plugin_zip("alertingDashboards", folder="alerting-dashboards-plugin"),
+            "reportsDashboards": self.__plugin_zip("reportsDashboards", {"opensearchDashboardsVersion": None}),
+        }
+        self.assertEqual(self.installer.install(plugin_zips), ["alertingDashboards", "reportsDashboards"])
+        plugins_dir = os.path.join(self.archive_path, "plugins")
+        self.assertEqual(sorted(os.listdir(plugins_dir)), ["alertingDashboards", "reportsDashboards"])
+        plugin_dir = os.path.join(plugins_dir, "alertingDashboards")
+        self.assertEqual(sorted(os.listdir(plugin_dir)), ["README.md", "bin", "opensearch_dashboards.json", "target"])
+        self.assertTrue(os.path.isfile(os.path.join(plugin_dir, "target", "public", "alertingDashboards.plugin.js")))
+        self.assertEqual(stat.S_IMODE(os.stat(plugin_dir).st_mode), 0o755)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(plugin_dir, "opensearch_dashboards.json")).st_mode), 0o644)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(plugin_dir, "README.md")).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(plugin_dir, "bin", "alertingDashboards")).st_mode), 0o755)
+
+    def test_install_leaves_unsupported_plugins(self) -> None:
+        invalid_zip = os.path.join(self.tmp_dir.name, "invalid.zip")
+        with ZipFile(invalid_zip, "w") as zip:
+            zip.writestr("opensearch-dashboards/invalid/opensearch_dashboards.json", "{")
+        plugin_zips = {
+            "alertingDashboards": self.__plugin_zip("alertingDashboards"),
+            "reportsDashboards": self.__plugin_zip("reportsDashboards", {"opensearchDashboardsVersion": "1.0.0"}),
+            "notebooksDashboards": self.__plugin_zip("notebooksDashboards", {"id": None}),
+            "invalid": invalid_zip,
+        }
+        self.assertEqual(self.installer.install(plugin_zips), ["alertingDashboards"])
+
+    def test_version_from_package_json(self) -> None:
+        with open(os.path.join(self.archive_path, "package.json"), "w") as f:
+            json.dump({"name": "opensearch-dashboards", "version": "1.1.0"}, f)
+        installer = OpenSearchDashboardsPluginInstaller(self.archive_path, "1.1.0-SNAPSHOT")
+        self.assertEqual(installer.version, "1.1.0")
+        self.assertEqual(installer.folder(self.__plugin_zip("alertingDashboards")), "alertingDashboards")
+
+    def test_manifest_version(self) -> None:
+        plugin_zip = self.__plugin_zip("alertingDashboards", {"opensearchDashboardsVersion": "1.1.1"})
+        with self.assertRaises(OpenSearchDashboardsPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.manifest(plugin_zip)
+        self.assertEqual(str(ctx.exception), "alertingDashboards.zip was built for OpenSearch Dashboards 1.1.1, not 1.1.0")
+
+    def test_manifest_missing(self) -> None:
+        plugin_zip = os.path.join(self.tmp_dir.name, "empty.zip")
+        with ZipFile(plugin_zip, "w") as zip:
+            zip.writestr("opensearch_dashboards.json", "{}")
+        with self.assertRaises(OpenSearchDashboardsPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.manifest(plugin_zip)
+        self.assertEqual(str(ctx.exception), "empty.zip contains 0 plugins")
+
+    def test_manifest_outside_plugin_directory(self) -> None:
+        plugin_zip = self.__plugin_zip("alertingDashboards")
+        with ZipFile(plugin_zip, "a") as zip:
+            zip.writestr("opensearch-dashboards/alertingDashboards/../../evil.js", "")
+        with self.assertRaises(OpenSearchDashboardsPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.manifest(plugin_zip)
+        self.assertEqual(str(ctx.exception), "alertingDashboards.zip contains opensearch-dashboards/alertingDashboards/../../evil.js, outside of the plugin directory")
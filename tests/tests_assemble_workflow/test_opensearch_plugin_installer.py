@@ -0,0 +1,134 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import stat
+import tempfile
+import unittest
+from typing import Dict
+from unittest.mock import patch
+from zipfile import ZipFile
+
+from assemble_workflow.opensearch_plugin_installer import OpenSearchPluginInstaller
+
+
+class TestOpenSearchPluginInstaller(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive_path = os.path.join(self.tmp_dir.name, "opensearch-1.1.0")
+        os.makedirs(os.path.join(self.archive_path, "plugins"))
+        os.makedirs(os.path.join(self.archive_path, "modules", "transport-netty4"))
+        self.installer = OpenSearchPluginInstaller(self.archive_path, "1.1.0-SNAPSHOT")
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def __plugin_zip(self, name: str, descriptor: Dict[str, str] = {}, files: Dict[str, str] = {}) -> str:
+        properties = {
+            "description": f"The {name} plugin.",
+            "version": "1.1.0.0",
+            "name": name,
+            "classname": f"org.opensearch.{name}.Plugin",
+            "java.version": "11",
+            "opensearch.version": "1.1.0",
+            **descriptor,
+        }
+        path = os.path.join(self.tmp_dir.name, f"{name}.zip")
+        with ZipFile(path, "w") as zip:
+            header = "# comment\ndescription: multi-line \\\n  description\n"
+            content = header + "".join(f"{key}={value}\n" for key, value in properties.items() if value is not None)
+            zip.writestr("plugin-descriptor.properties", content.encode("ISO-8859-1"))
+            zip.writestr(f"{name}.jar", "jar")
+            for file_name, content in files.items():
+                zip.writestr(file_name, content)
+        return path
+
+    def test_install(self) -> None:
+        plugin_zips = {
+            "job-scheduler": self.__plugin_zip("opensearch-job-scheduler", files={"lib/dep.jar": "dep"}),
+            "alerting": self.__plugin_zip("opensearch-alerting", {"extended.plugins": "opensearch-job-scheduler"}),
+        }
+        self.assertEqual(self.installer.install(plugin_zips), ["job-scheduler", "alerting"])
+        plugins_dir = os.path.join(self.archive_path, "plugins")
+        self.assertEqual(sorted(os.listdir(plugins_dir)), ["opensearch-alerting", "opensearch-job-scheduler"])
+        plugin_dir = os.path.join(plugins_dir, "opensearch-job-scheduler")
+        self.assertEqual(sorted(os.listdir(plugin_dir)), ["lib", "opensearch-job-scheduler.jar", "plugin-descriptor.properties"])
+        self.assertEqual(stat.S_IMODE(os.stat(plugin_dir).st_mode), 0o755)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(plugin_dir, "lib")).st_mode), 0o755)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(plugin_dir, "lib", "dep.jar")).st_mode), 0o644)
+
+    def test_install_custom_folder(self) -> None:
+        plugin_zips = {"security": self.__plugin_zip("opensearch-security", {"custom.foldername": "security"})}
+        self.assertEqual(self.installer.install(plugin_zips), ["security"])
+        self.assertEqual(os.listdir(os.path.join(self.archive_path, "plugins")), ["security"])
+
+    def test_install_leaves_unsupported_plugins(self) -> None:
+        plugin_zips = {
+            "security": self.__plugin_zip("opensearch-security", files={"plugin-security.policy": "grant {};"}),
+            "performance-analyzer": self.__plugin_zip("opensearch-performance-analyzer", files={"bin/performance-analyzer-agent": "#!/bin/sh"}),
+            "sql": self.__plugin_zip("opensearch-sql", {"opensearch.version": "1.0.0"}),
+            "knn": self.__plugin_zip("opensearch-knn", {"classname": None}),
+            "netty": self.__plugin_zip("transport-netty4"),
+            "alerting": self.__plugin_zip("opensearch-alerting", {"extended.plugins": "opensearch-job-scheduler"}),
+            "job-scheduler": self.__plugin_zip("opensearch-job-scheduler"),
+            "job-scheduler-copy": self.__plugin_zip("opensearch-job-scheduler"),
+        }
+        self.assertEqual(self.installer.install(plugin_zips), ["alerting", "job-scheduler"])
+
+    def test_install_leaves_plugins_extending_unsupported_plugins(self) -> None:
+        plugin_zips = {
+            "job-scheduler": self.__plugin_zip("opensearch-job-scheduler", files={"config/job-scheduler.yml": ""}),
+            "alerting": self.__plugin_zip("opensearch-alerting", {"extended.plugins": "opensearch-job-scheduler"}),
+            "index-management": self.__plugin_zip("opensearch-index-management", {"extended.plugins": "opensearch-alerting"}),
+        }
+        self.assertEqual(self.installer.install(plugin_zips), [])
+        self.assertEqual(os.listdir(os.path.join(self.archive_path, "plugins")), [])
+
+    def test_install_existing_plugin(self) -> None:
+        os.makedirs(os.path.join(self.archive_path, "plugins", "opensearch-job-scheduler"))
+        plugin_zips = {
+            "job-scheduler": self.__plugin_zip("opensearch-job-scheduler"),
+            "alerting": self.__plugin_zip("opensearch-alerting", {"extended.plugins": "opensearch-job-scheduler"}),
+        }
+        self.assertEqual(self.installer.install(plugin_zips), ["alerting"])
+
+    def test_install_error_cleans_up(self) -> None:
+        plugin_zip = self.__plugin_zip("opensearch-job-scheduler")
+        with patch("os.rename", side_effect=OSError("rename failed")):
+            with self.assertRaises(OSError):
+                self.installer.install({"job-scheduler": plugin_zip})
+        self.assertEqual(os.listdir(os.path.join(self.archive_path, "plugins")), [])
+
+    def test_descriptor(self) -> None:
+        descriptor = self.installer.descriptor(self.__plugin_zip("opensearch-job-scheduler", {"extended.plugins": ""}))
+        self.assertEqual(descriptor.get_value("name"), "opensearch-job-scheduler")
+        self.assertEqual(descriptor.get_value("opensearch.version"), "1.1.0")
+        self.assertEqual(descriptor.get_value("extended.plugins"), "")
+
+    def test_descriptor_iso_8859_1(self) -> None:
+        descriptor = self.installer.descriptor(self.__plugin_zip("opensearch-job-scheduler", {"description": "Planificación de tareas"}))
+        self.assertEqual(descriptor.get_value("description"), "Planificación de tareas")
+
+    def test_descriptor_outside_plugin_directory(self) -> None:
+        plugin_zip = self.__plugin_zip("opensearch-job-scheduler", files={"../evil.jar": ""})
+        with self.assertRaises(OpenSearchPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.descriptor(plugin_zip)
+        self.assertEqual(str(ctx.exception), "opensearch-job-scheduler.zip contains ../evil.jar, outside of the plugin directory")
+
+    def test_descriptor_missing(self) -> None:
+        plugin_zip = os.path.join(self.tmp_dir.name, "empty.zip")
+        with ZipFile(plugin_zip, "w") as zip:
+            zip.writestr("empty.jar", "")
+        with self.assertRaises(OpenSearchPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.descriptor(plugin_zip)
+        self.assertEqual(str(ctx.exception), "empty.zip does not contain plugin-descriptor.properties")
+
+    def test_descriptor_version(self) -> None:
+        plugin_zip = self.__plugin_zip("opensearch-job-scheduler", {"opensearch.version": "1.1.1"})
+        with self.assertRaises(OpenSearchPluginInstaller.UnsupportedPluginError) as ctx:
+            self.installer.descriptor(plugin_zip)
+        self.assertEqual(str(ctx.exception), "opensearch-job-scheduler.zip was built for OpenSearch 1.1.1, not 1.1.0")
@@ -11,6 +11,7 @@ import unittest
 from unittest.mock import patch
 
 from build_workflow.build_args import BuildArgs
+from build_workflow.build_incremental import BuildIncremental
 
 
 class TestBuildArgs(unittest.TestCase):
@@ -103,6 +104,22 @@ class TestBuildArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--distribution", "rpm"])
     def test_distribution(self) -> None:
         self.assertEqual(BuildArgs().distribution, "rpm")
+        self.assertEqual(BuildArgs().distributions, ["rpm"])
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--distribution", "tar,rpm,deb"])
+    def test_distributions(self) -> None:
+        self.assertEqual(BuildArgs().distribution, "tar")
+        self.assertEqual(BuildArgs().distributions, ["tar", "rpm", "deb"])
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--distribution", "tar,exe"])
+    def test_distributions_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--distribution", "tar,rpm", "--incremental"])
+    def test_distributions_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
 
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--component", "xyz"])
     def test_script_path(self) -> None:
@@ -129,3 +146,161 @@ class TestBuildArgs(unittest.TestCase):
     @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
     def test_manifest_no_lock(self) -> None:
         self.assertIsNone(BuildArgs().ref_manifest)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_parallel_default(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 1)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4"])
+    def test_parallel(self) -> None:
+        self.assertEqual(BuildArgs().parallel, 4)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "0"])
+    def test_parallel_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_build_cache_default(self) -> None:
+        self.assertIsNone(BuildArgs().build_cache)
+        self.assertEqual(BuildArgs().build_cache_size, 50)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--build-cache", "cache", "--build-cache-size", "10"])
+    def test_build_cache(self) -> None:
+        self.assertEqual(BuildArgs().build_cache, "cache")
+        self.assertEqual(BuildArgs().build_cache_size, 10)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_prefetch_default(self) -> None:
+        self.assertEqual(BuildArgs().prefetch, 0)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--prefetch", "2"])
+    def test_prefetch(self) -> None:
+        self.assertEqual(BuildArgs().prefetch, 2)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--prefetch", "-1"])
+    def test_prefetch_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_move_artifacts_default(self) -> None:
+        self.assertFalse(BuildArgs().move_artifacts)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--move-artifacts"])
+    def test_move_artifacts(self) -> None:
+        self.assertTrue(BuildArgs().move_artifacts)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--move-artifacts", "--keep"])
+    def test_move_artifacts_keep(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_plan_default(self) -> None:
+        self.assertFalse(BuildArgs().plan)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--plan"])
+    def test_plan(self) -> None:
+        self.assertTrue(BuildArgs().plan)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental"])
+    def test_path_filter_default(self) -> None:
+        self.assertIsNone(BuildArgs().path_filter)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental", "--path-filter"])
+    def test_path_filter(self) -> None:
+        self.assertEqual(BuildArgs().path_filter, BuildIncremental.IGNORE_PATHS)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--incremental", "--path-filter", "*.md", "docs/*"])
+    def test_path_filter_globs(self) -> None:
+        self.assertEqual(BuildArgs().path_filter, ["*.md", "docs/*"])
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--path-filter"])
+    def test_path_filter_not_incremental(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_resume_default(self) -> None:
+        self.assertFalse(BuildArgs().resume)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--resume"])
+    def test_resume(self) -> None:
+        self.assertTrue(BuildArgs().resume)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_resources_default(self) -> None:
+        self.assertIsNone(BuildArgs().cpus)
+        self.assertIsNone(BuildArgs().memory)
+        self.assertTrue(BuildArgs().resource_history.endswith("build-resources.json"))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4", "--cpus", "8", "--memory", "24", "--resource-history", "history.json"])
+    def test_resources(self) -> None:
+        self.assertEqual(BuildArgs().cpus, 8)
+        self.assertEqual(BuildArgs().memory, 24)
+        self.assertEqual(BuildArgs().resource_history, "history.json")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "4", "--memory", "0"])
+    def test_memory_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--cpus", "8"])
+    def test_cpus_without_parallel(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--parallel", "1", "--memory", "24"])
+    def test_memory_without_parallel(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_workers_default(self) -> None:
+        self.assertIsNone(BuildArgs().workers)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--workers", "worker-1:8788", "10.0.0.2:8788"])
+    def test_workers(self) -> None:
+        self.assertEqual(BuildArgs().workers, ["worker-1:8788", "10.0.0.2:8788"])
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--workers", "worker-1"])
+    def test_workers_invalid(self) -> None:
+        with self.assertRaises(SystemExit):
+            BuildArgs()
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_gradle_daemons_default(self) -> None:
+        self.assertFalse(BuildArgs().gradle_daemons)
+        self.assertTrue(BuildArgs().gradle_user_home.endswith(os.path.join(".opensearch-build", "gradle")))
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--gradle-daemons", "--gradle-user-home", "gradle"])
+    def test_gradle_daemons(self) -> None:
+        self.assertTrue(BuildArgs().gradle_daemons)
+        self.assertEqual(BuildArgs().gradle_user_home, "gradle")
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_yarn_cache_default(self) -> None:
+        self.assertFalse(BuildArgs().yarn_cache)
+        self.assertIsNone(BuildArgs().yarn_cache_dir)
+        self.assertEqual(BuildArgs().yarn_cache_size, 20)
+
+    @patch("argparse._sys.argv", [BUILD_PY, "--yarn-cache", OPENSEARCH_MANIFEST])
+    def test_yarn_cache_run(self) -> None:
+        self.assertTrue(BuildArgs().yarn_cache)
+        self.assertIsNone(BuildArgs().yarn_cache_dir)
+        self.assertEqual(BuildArgs().manifest.name, self.OPENSEARCH_MANIFEST)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--yarn-cache-dir", "yarn", "--yarn-cache-size", "5"])
+    def test_yarn_cache_dir(self) -> None:
+        self.assertTrue(BuildArgs().yarn_cache)
+        self.assertEqual(BuildArgs().yarn_cache_dir, "yarn")
+        self.assertEqual(BuildArgs().yarn_cache_size, 5)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST])
+    def test_output_store_default(self) -> None:
+        self.assertIsNone(BuildArgs().output_store)
+
+    @patch("argparse._sys.argv", [BUILD_PY, OPENSEARCH_MANIFEST, "--output-store", "store"])
+    def test_output_store(self) -> None:
+        self.assertEqual(BuildArgs().output_store, "store")
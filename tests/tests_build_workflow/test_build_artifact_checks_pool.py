@@ -0,0 +1,58 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_checks_pool import BuildArtifactChecksPool
+from build_workflow.build_target import BuildTarget
+from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
+
+
+class TestBuildArtifactChecksPool(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = BuildArtifactChecksPool(BuildTarget(name="OpenSearch", version="1.3.0", architecture="x64"), 2)
+
+    def test_unchecked_type(self) -> None:
+        self.pool.submit("common-utils", "libs", "file.jar")
+        self.pool.wait("common-utils")
+        self.assertEqual(self.pool.checked, 0)
+
+    def test_checks_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=10)
+        with patch.object(BuildArtifactOpenSearchCheckMaven, "check", side_effect=lambda path: barrier.wait()):
+            self.pool.submit("OpenSearch", "maven", "first.jar")
+            self.pool.submit("OpenSearch", "maven", "second.jar")
+            self.pool.wait("OpenSearch")
+        self.assertEqual(self.pool.checked, 2)
+
+    def test_wait_per_component(self) -> None:
+        def check(path: str) -> None:
+            raise BuildArtifactCheck.BuildArtifactInvalidError(path, "invalid")
+
+        with patch.object(BuildArtifactOpenSearchCheckMaven, "check", side_effect=check):
+            self.pool.submit("OpenSearch", "maven", "invalid.jar")
+            self.pool.wait("common-utils")
+            with self.assertRaises(BuildArtifactChecksPool.BuildArtifactChecksFailedError) as ctx:
+                self.pool.wait("OpenSearch")
+        self.assertEqual(ctx.exception.component_name, "OpenSearch")
+        self.assertEqual(len(ctx.exception.errors), 1)
+        self.assertEqual(ctx.exception.paths, ["invalid.jar"])
+
+    @patch("logging.info")
+    def test_log_summary(self, mock_logging_info: MagicMock) -> None:
+        self.pool.log_summary()
+        mock_logging_info.assert_not_called()
+
+        with patch.object(BuildArtifactOpenSearchCheckMaven, "check"):
+            self.pool.submit("OpenSearch", "maven", "valid.jar")
+            self.pool.wait("OpenSearch")
+        self.pool.log_summary()
+        self.assertIn("Checked 1 artifact(s) in", mock_logging_info.call_args[0][0])
+        self.assertIn("0 invalid", mock_logging_info.call_args[0][0])
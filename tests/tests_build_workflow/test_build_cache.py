@@ -0,0 +1,146 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_cache import BuildCache
+from build_workflow.build_target import BuildTarget
+from manifests.input_manifest import InputManifest
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildCache(unittest.TestCase):
+    MANIFEST = InputManifest({
+        "schema-version": "1.2",
+        "build": {"name": "OpenSearch", "version": "2.12.0"},
+        "components": [
+            {"name": "OpenSearch", "repository": "https://github.com/opensearch-project/OpenSearch.git", "ref": "main"},
+            {"name": "common-utils", "repository": "https://github.com/opensearch-project/common-utils.git", "ref": "main"},
+            {"name": "job-scheduler", "repository": "https://github.com/opensearch-project/job-scheduler.git", "ref": "main"},
+            {"name": "alerting", "repository": "https://github.com/opensearch-project/alerting.git", "ref": "main", "depends_on": ["common-utils"]},
+            {"name": "notifications", "repository": "https://github.com/opensearch-project/notifications.git", "ref": "main", "depends_on": ["alerting"]},
+        ],
+    })
+
+    COMMIT_IDS = {"OpenSearch": "sha-os", "common-utils": "sha-cu", "job-scheduler": "sha-js", "alerting": "sha-al", "notifications": "sha-no"}
+
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.cache = BuildCache(os.path.join(self.temp_dir.name, "cache"), 1024, self.MANIFEST)
+        self.target = BuildTarget(name="OpenSearch", version="2.12.0", platform="linux", architecture="x64", distribution="tar", snapshot=False)
+        self.build_script = os.path.join(self.temp_dir.name, "build.sh")
+        with open(self.build_script, "w") as f:
+            f.write("./gradlew assemble")
+        self.build_recorder = MagicMock()
+        self.build_recorder.commit_id.side_effect = lambda name: self.COMMIT_IDS.get(name, None)
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def __artifacts(self, name: str, content: str) -> str:
+        path = os.path.join(self.temp_dir.name, name)
+        os.makedirs(os.path.join(path, "plugins"))
+        with open(os.path.join(path, "plugins", "plugin.zip"), "w") as f:
+            f.write(content)
+        return path
+
+    def __key(self, name: str = "alerting", commit_id: str = "sha-al") -> str:
+        return self.cache.key(name, commit_id, self.build_script, self.target, self.build_recorder)
+
+    def test_dependencies(self) -> None:
+        self.assertEqual(self.cache.dependencies["OpenSearch"], [])
+        self.assertEqual(self.cache.dependencies["job-scheduler"], ["OpenSearch"])
+        self.assertEqual(self.cache.dependencies["notifications"], ["OpenSearch", "alerting", "common-utils"])
+
+    def test_key_is_stable(self) -> None:
+        self.assertEqual(self.__key(), self.__key())
+
+    def test_key_changes_with_inputs(self) -> None:
+        key = self.__key()
+        self.assertNotEqual(key, self.__key(commit_id="sha-other"))
+
+        self.COMMIT_IDS["common-utils"] = "sha-cu-2"
+        try:
+            self.assertNotEqual(key, self.__key())
+        finally:
+            self.COMMIT_IDS["common-utils"] = "sha-cu"
+
+        self.target.snapshot = True
+        self.assertNotEqual(key, self.__key())
+        self.target.snapshot = False
+
+        self.target.patches = ["2.11.1"]
+        self.assertNotEqual(key, self.__key())
+        self.target.patches = []
+
+        with open(self.build_script, "a") as f:
+            f.write(" --info")
+        self.assertNotEqual(key, self.__key())
+
+    def test_key_unknown_dependency(self) -> None:
+        self.build_recorder.commit_id.side_effect = lambda name: None
+        self.assertIsNone(self.__key())
+
+    def test_restore_miss(self) -> None:
+        self.assertFalse(self.cache.restore(self.__key(), os.path.join(self.temp_dir.name, "dest")))
+
+    def test_store_and_restore(self) -> None:
+        key = self.__key()
+        self.cache.store(key, self.__artifacts("src", "content"))
+
+        dest = os.path.join(self.temp_dir.name, "dest")
+        self.assertTrue(self.cache.restore(key, dest))
+        with open(os.path.join(dest, "plugins", "plugin.zip")) as f:
+            self.assertEqual(f.read(), "content")
+
+    def test_restore_incomplete_entry(self) -> None:
+        key = self.__key()
+        self.cache.store(key, self.__artifacts("src", "content"))
+        # as left by an eviction in progress
+        os.remove(os.path.join(self.cache.entry_path(key), "artifacts", "plugins", "plugin.zip"))
+
+        dest = os.path.join(self.temp_dir.name, "dest")
+        self.assertFalse(self.cache.restore(key, dest))
+        self.assertFalse(os.path.exists(dest))
+        self.assertFalse(os.path.exists(self.cache.entry_path(key)))
+
+    def test_restore_holds_lock(self) -> None:
+        key = self.__key()
+        self.cache.store(key, self.__artifacts("src", "content"))
+        with patch("build_workflow.build_cache.FileLock") as mock_file_lock:
+            self.assertTrue(self.cache.restore(key, os.path.join(self.temp_dir.name, "dest")))
+        mock_file_lock.assert_called_once_with(os.path.join(self.cache.path, ".lock"))
+
+    def test_store_existing_entry(self) -> None:
+        key = self.__key()
+        self.cache.store(key, self.__artifacts("src1", "first"))
+        self.cache.store(key, self.__artifacts("src2", "second"))
+
+        dest = os.path.join(self.temp_dir.name, "dest")
+        self.cache.restore(key, dest)
+        with open(os.path.join(dest, "plugins", "plugin.zip")) as f:
+            self.assertEqual(f.read(), "first")
+
+    def test_evict_least_recently_used(self) -> None:
+        self.cache.max_size = 1000
+        first = self.__key(commit_id="sha-1")
+        second = self.__key(commit_id="sha-2")
+        third = self.__key(commit_id="sha-3")
+
+        self.cache.store(first, self.__artifacts("src1", "x" * 400))
+        self.cache.store(second, self.__artifacts("src2", "x" * 400))
+        old = time.time() - 60
+        os.utime(self.cache.entry_path(first), (old, old))
+        os.utime(self.cache.entry_path(second), (old - 60, old - 60))
+        self.cache.store(third, self.__artifacts("src3", "x" * 400))
+
+        self.assertTrue(os.path.isdir(self.cache.entry_path(first)))
+        self.assertFalse(os.path.isdir(self.cache.entry_path(second)))
+        self.assertTrue(os.path.isdir(self.cache.entry_path(third)))
@@ -6,8 +6,9 @@
 # compatible open source license.
 
 import os
+import subprocess
 import unittest
-from typing import List
+from typing import Any, Dict, List
 from unittest.mock import MagicMock, patch
 
 from build_workflow.build_incremental import BuildIncremental
@@ -50,7 +51,7 @@ class TestBuildIncremental(unittest.TestCase):
                                                'repository': 'https://github.com/opensearch-project/OpenSearch.git',
                                                'ref': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6',
                                                'checks': ['gradle:publish', 'gradle:properties:version']}]}
-        build_manifest_data = {'schema-version': '1.2',
+        build_manifest_data = {'schema-version': '1.3',
                                'build': {'name': 'OpenSearch', 'version': '2.12.0', 'platform': 'linux',
                                          'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
                                'components': [{'name': 'OpenSearch',
@@ -75,7 +76,7 @@ class TestBuildIncremental(unittest.TestCase):
                                                'repository': 'https://github.com/opensearch-project/OpenSearch.git',
                                                'ref': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6',
                                                'checks': ['gradle:publish', 'gradle:properties:version']}]}
-        build_manifest_data = {'schema-version': '1.2',
+        build_manifest_data = {'schema-version': '1.3',
                                'build': {'name': 'OpenSearch', 'version': '2.12.0', 'platform': 'linux',
                                          'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
                                'components': [{'name': 'OpenSearch',
@@ -100,7 +101,7 @@ class TestBuildIncremental(unittest.TestCase):
                                                'repository': 'https://github.com/opensearch-project/OpenSearch.git',
                                                'ref': '91a93dacb84eae4f09decbabe54771585d42b570',
                                                'checks': ['gradle:publish', 'gradle:properties:version']}]}
-        build_manifest_data = {'schema-version': '1.2',
+        build_manifest_data = {'schema-version': '1.3',
                                'build': {'name': 'OpenSearch', 'version': '3.1.0-alpha1', 'platform': 'linux',
                                          'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
                                'components': [{'name': 'OpenSearch',
@@ -125,7 +126,7 @@ class TestBuildIncremental(unittest.TestCase):
                                                'repository': 'https://github.com/opensearch-project/OpenSearch.git',
                                                'ref': '91a93dacb84eae4f09decbabe54771585d42b570',
                                                'checks': ['gradle:publish', 'gradle:properties:version']}]}
-        build_manifest_data = {'schema-version': '1.2',
+        build_manifest_data = {'schema-version': '1.3',
                                'build': {'name': 'OpenSearch', 'version': '3.0.0-alpha1', 'platform': 'linux',
                                          'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
                                'components': [{'name': 'OpenSearch',
@@ -165,6 +166,60 @@ class TestBuildIncremental(unittest.TestCase):
         self.assertTrue("security-analytics" in diff_list)
         self.assertTrue("performance-analyzer" in diff_list)
 
+    @patch("os.path.exists")
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("build_workflow.build_incremental.GitRepository.changed_paths")
+    def test_commits_diff_path_filter(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, mock_path_exists: MagicMock) -> None:
+        mock_path_exists.return_value = True
+        stable_mock_input_manifest.return_value = self.INPUT_MANIFEST
+        mock_build_manifest.return_value = self.BUILD_MANIFEST
+
+        def changed_paths(url: str, from_commit: str, to_commit: str) -> List[str]:
+            if url.endswith("/security.git"):
+                return ["src/main/java/org/opensearch/security/OpenSearchSecurityPlugin.java", "README.md"]
+            if url.endswith("/geospatial.git"):
+                raise subprocess.CalledProcessError(128, "git fetch")
+            return ["release-notes/opensearch.release-notes-3.1.0.0.md", "src/test/java/FooTests.java", ".github/workflows/ci.yml"]
+
+        mock_changed_paths.side_effect = changed_paths
+        buildIncremental = BuildIncremental(self.INPUT_MANIFEST, "tar", "linux", BuildIncremental.IGNORE_PATHS)
+        diff_list = buildIncremental.commits_diff(self.INPUT_MANIFEST)
+
+        self.assertEqual(len(diff_list), 7)
+        self.assertNotIn("ml-commons", diff_list)
+        self.assertNotIn("opensearch-observability", diff_list)
+        self.assertIn("geospatial", diff_list)
+        self.assertIn("security", diff_list)
+        self.assertEqual(mock_changed_paths.call_count, 4)
+        ml_commons = self.BUILD_MANIFEST.components["ml-commons"]
+        mock_changed_paths.assert_any_call(ml_commons.repository, ml_commons.commit_id, self.INPUT_MANIFEST.components["ml-commons"].ref)  # type: ignore[attr-defined]
+
+    @patch("os.path.exists")
+    @patch("manifests.build_manifest.BuildManifest.from_path")
+    @patch("manifests.input_manifest.InputManifest.stable")
+    @patch("build_workflow.build_incremental.GitRepository.changed_paths", return_value=["build.gradle"])
+    def test_commits_diff_path_filter_component(self, mock_changed_paths: MagicMock, stable_mock_input_manifest: MagicMock, mock_build_manifest: MagicMock, mock_path_exists: MagicMock) -> None:
+        mock_path_exists.return_value = True
+        component: Dict[str, Any] = {'name': 'OpenSearch', 'repository': 'https://github.com/opensearch-project/OpenSearch.git', 'ref': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6'}
+        input_manifest_data = {'schema-version': '1.2', 'build': {'name': 'OpenSearch', 'version': '2.12.0'}, 'components': [component]}
+        build_manifest_data = {'schema-version': '1.3',
+                               'build': {'name': 'OpenSearch', 'version': '2.12.0', 'platform': 'linux',
+                                         'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
+                               'components': [{'name': 'OpenSearch',
+                                               'repository': 'https://github.com/opensearch-project/OpenSearch.git',
+                                               'ref': '2.x', 'commit_id': 'c85e75cb4db7946d7d4dfd0e7317c3f684e6345d',
+                                               'version': '2.12.0.0'}]}
+        mock_build_manifest.return_value = BuildManifest(build_manifest_data)
+
+        stable_mock_input_manifest.return_value = InputManifest(input_manifest_data)
+        self.assertEqual(BuildIncremental(self.INPUT_MANIFEST, "tar", "linux", ["*.md"]).commits_diff(self.INPUT_MANIFEST), ["OpenSearch"])
+
+        component["ignore_paths"] = ["build.gradle"]
+        stable_mock_input_manifest.return_value = InputManifest(input_manifest_data)
+        self.assertEqual(BuildIncremental(self.INPUT_MANIFEST, "tar", "linux", ["*.md"]).commits_diff(self.INPUT_MANIFEST), [])
+        mock_changed_paths.assert_called_with(component["repository"], "c85e75cb4db7946d7d4dfd0e7317c3f684e6345d", component["ref"])
+
     @patch("os.path.exists")
     @patch("manifests.build_manifest.BuildManifest.from_path")
     @patch("manifests.input.input_manifest_1_1.InputManifest_1_1.stable")
@@ -214,7 +269,7 @@ class TestBuildIncremental(unittest.TestCase):
                                                'repository': 'https://github.com/opensearch-project/OpenSearch.git',
                                                'ref': '05c2befd7d01fab4aef4f0d3d6722d2da240b2c6',
                                                'checks': ['gradle:publish', 'gradle:properties:version']}]}
-        build_manifest_data = {'schema-version': '1.2',
+        build_manifest_data = {'schema-version': '1.3',
                                'build': {'name': 'OpenSearch', 'version': '2.11.0', 'platform': 'linux',
                                          'architecture': 'x64', 'id': 'b2b848e29077488ca7e8c37501b36c87'},
                                'components': [{'name': 'OpenSearch',
@@ -294,6 +349,15 @@ class TestBuildIncremental(unittest.TestCase):
         self.assertEqual(len(rebuild_list_geo), 1)
         self.assertTrue("geospatial" in rebuild_list_js)
 
+    def test_rebuild_plugins_reasons(self) -> None:
+        buildIncremental = BuildIncremental(self.INPUT_MANIFEST, "tar", "linux")
+        buildIncremental.reasons["common-utils"] = "commit changed"
+        rebuild_list = buildIncremental.rebuild_plugins(["common-utils"], self.INPUT_MANIFEST)
+        self.assertEqual(rebuild_list[0], "common-utils")
+        self.assertEqual(buildIncremental.reasons["common-utils"], "commit changed")
+        self.assertEqual(buildIncremental.reasons["sql"], "depends on common-utils")
+        self.assertNotIn("geospatial", buildIncremental.reasons)
+
     def test_rebuild_plugins_with_dashboards(self) -> None:
         buildIncrementDashboards = BuildIncremental(self.INPUT_MANIFEST_DASHBOARDS, "tar", "linux")
         diff_list = ["observabilityDashboards"]
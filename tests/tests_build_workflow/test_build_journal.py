@@ -0,0 +1,77 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import unittest
+
+from build_workflow.build_journal import BuildJournal
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildJournal(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.output_dir = os.path.join(self.temp_dir.name, "builds")
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def __journal(self, version: str = "1.3.0") -> BuildJournal:
+        return BuildJournal(BuildTarget(build_id="1", output_dir=self.output_dir, name="OpenSearch", version=version, platform="linux", architecture="x64"))
+
+    def test_append_and_read(self) -> None:
+        journal = self.__journal()
+        journal.append({"name": "OpenSearch", "artifacts": {"dist": ["dist/opensearch-min-1.3.0-linux-x64.tar.gz"]}})
+        journal.append({"name": "common-utils", "artifacts": {}})
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["OpenSearch", "common-utils"])
+
+    def test_new_build_starts_new_journal(self) -> None:
+        self.__journal().append({"name": "OpenSearch"})
+        self.__journal().append({"name": "common-utils"})
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["common-utils"])
+
+    def test_resumed_build_continues_journal(self) -> None:
+        self.__journal().append({"name": "OpenSearch"})
+        journal = self.__journal()
+        self.assertEqual(len(journal.read()), 1)
+        journal.append({"name": "common-utils"})
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["OpenSearch", "common-utils"])
+
+    def test_start(self) -> None:
+        self.__journal().append({"name": "OpenSearch"})
+        journal = self.__journal()
+        journal.start()
+        self.assertEqual(self.__journal().read(), [])
+        journal.append({"name": "common-utils"})
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["common-utils"])
+
+    def test_remove(self) -> None:
+        journal = self.__journal()
+        journal.remove()
+        journal.append({"name": "OpenSearch"})
+        journal.remove()
+        self.assertFalse(os.path.exists(journal.path))
+        journal.append({"name": "common-utils"})
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["common-utils"])
+
+    def test_read_missing(self) -> None:
+        self.assertEqual(self.__journal().read(), [])
+
+    def test_read_partially_written(self) -> None:
+        journal = self.__journal()
+        journal.append({"name": "OpenSearch"})
+        with open(journal.path, "a") as f:
+            f.write('{"component": {"name": "common-')
+        self.assertEqual([component["name"] for component in self.__journal().read()], ["OpenSearch"])
+        with open(journal.path) as f:
+            self.assertEqual([json.loads(line) for line in f][1:], [{"component": {"name": "OpenSearch"}}])
+
+    def test_read_different_build(self) -> None:
+        self.__journal().append({"name": "OpenSearch"})
+        self.assertEqual(self.__journal("2.0.0").read(), [])
@@ -0,0 +1,90 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from build_workflow.build_metrics import BuildMetrics
+from build_workflow.build_target import BuildTarget
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildMetrics(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.target = BuildTarget(
+            build_id="1",
+            output_dir=self.temp_dir.name,
+            name="OpenSearch",
+            version="1.3.0",
+            platform="linux",
+            architecture="x64",
+            snapshot=False,
+        )
+        self.metrics = BuildMetrics(self.target)
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def test_phase(self) -> None:
+        with self.metrics.phase("OpenSearch", "build"):
+            subprocess.check_call([sys.executable, "-c", "sum(range(2000000))"])
+        phase = self.metrics.components["OpenSearch"]["phases"]["build"]
+        self.assertGreater(phase["wall"], 0)
+        self.assertGreater(phase["cpu"], 0)
+        self.assertEqual(self.metrics.components["OpenSearch"]["status"], "success")
+
+    def test_phase_failed(self) -> None:
+        with self.assertRaises(ValueError):
+            with self.metrics.phase("alerting", "checkout"):
+                raise ValueError("checkout failed")
+        self.assertEqual(self.metrics.components["alerting"]["status"], "failed")
+        self.assertIn("checkout", self.metrics.components["alerting"]["phases"])
+
+    def test_write_and_durations(self) -> None:
+        with self.metrics.phase("OpenSearch", "build"):
+            pass
+        with self.metrics.phase("OpenSearch", "export"):
+            pass
+        self.metrics.record("OpenSearch", "cache", "hit")
+        path = self.metrics.write()
+
+        self.assertEqual(path, os.path.join(self.temp_dir.name, "build-metrics.json"))
+        self.assertFalse(os.path.exists(f"{path}.tmp"))
+        with open(path) as f:
+            data = json.load(f)
+        self.assertEqual(data["build"]["name"], "OpenSearch")
+        self.assertEqual(data["components"][0]["name"], "OpenSearch")
+        self.assertEqual(data["components"][0]["cache"], "hit")
+        self.assertEqual(sorted(data["components"][0]["phases"].keys()), ["build", "export"])
+        self.assertEqual(list(BuildMetrics.durations(path).keys()), ["OpenSearch"])
+
+    def test_durations_missing(self) -> None:
+        self.assertEqual(BuildMetrics.durations(os.path.join(self.temp_dir.name, "missing.json")), {})
+
+    def test_durations_invalid(self) -> None:
+        path = os.path.join(self.temp_dir.name, "build-metrics.json")
+        with open(path, "w") as f:
+            f.write('{"components": [{"name": "OpenSearch", "pha')
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(BuildMetrics.durations(path), {})
+
+    def test_summary_sorted(self) -> None:
+        self.metrics.components = {
+            "common-utils": {"name": "common-utils", "status": "success", "phases": {"build": {"wall": 60.0, "cpu": 100.0}}},
+            "OpenSearch": {"name": "OpenSearch", "status": "success", "phases": {"checkout": {"wall": 5.0, "cpu": 1.0}, "build": {"wall": 600.0, "cpu": 2000.0}}},
+        }
+        summary = self.metrics.summary
+        self.assertTrue(summary[0].startswith("Component"))
+        self.assertTrue(summary[1].startswith("OpenSearch"))
+        self.assertIn("605.0s", summary[1])
+        self.assertTrue(summary[2].startswith("common-utils"))
+        self.assertIn("-", summary[2].split())
+        self.assertTrue(summary[3].startswith("Built 2 component(s) in"))
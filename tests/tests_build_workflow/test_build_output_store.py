@@ -0,0 +1,99 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from build_workflow.build_output_store import BuildOutputStore
+from system.file_copier import FileCopier
+
+
+class TestBuildOutputStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.output_store = BuildOutputStore(os.path.join(self.temp_dir.name, "store"))
+        self.file_copier = FileCopier(methods=[FileCopier.COPY])
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def __artifact(self, name: str, content: str) -> str:
+        path = os.path.join(self.temp_dir.name, "work", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def __output(self, build: str, name: str) -> str:
+        path = os.path.join(self.temp_dir.name, build, "builds", "opensearch", name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    def test_digest(self) -> None:
+        self.assertEqual(BuildOutputStore.digest(self.__artifact("a.jar", "jar")), hashlib.sha256(b"jar").hexdigest())
+
+    def test_store(self) -> None:
+        dest = self.__output("tar", "a.jar")
+        self.assertFalse(self.output_store.store(self.__artifact("a.jar", "jar"), dest, self.file_copier))
+        blob = self.output_store.blob_path(hashlib.sha256(b"jar").hexdigest())
+        self.assertTrue(os.path.samefile(blob, dest))
+        self.assertEqual(os.stat(blob).st_nlink, 2)
+
+    def test_store_deduplicates(self) -> None:
+        first, second = self.__output("tar", "a.jar"), self.__output("rpm", "a.jar")
+        self.output_store.store(self.__artifact("a.jar", "jar"), first, self.file_copier)
+        self.assertTrue(self.output_store.store(self.__artifact("b.jar", "jar"), second, self.file_copier))
+        self.assertTrue(os.path.samefile(first, second))
+        self.assertEqual((self.output_store.stored, self.output_store.deduplicated, self.output_store.saved), (2, 1, 3))
+
+    def test_store_overwrites(self) -> None:
+        dest = self.__output("tar", "a.jar")
+        self.output_store.store(self.__artifact("a.jar", "jar"), dest, self.file_copier)
+        self.output_store.store(self.__artifact("a.jar", "new jar"), dest, self.file_copier)
+        with open(dest) as f:
+            self.assertEqual(f.read(), "new jar")
+
+    def test_store_overwrites_keeps_blob(self) -> None:
+        previous, dest = self.__output("previous", "a.jar"), self.__output("tar", "a.jar")
+        self.output_store.store(self.__artifact("a.jar", "jar"), previous, self.file_copier)
+        os.link(previous, dest)
+        self.assertFalse(self.output_store.store(self.__artifact("a.jar", "new jar"), dest, self.file_copier))
+        with open(previous) as f:
+            self.assertEqual(f.read(), "jar")
+        with open(self.output_store.blob_path(hashlib.sha256(b"jar").hexdigest())) as f:
+            self.assertEqual(f.read(), "jar")
+        self.assertTrue(os.path.samefile(self.output_store.blob_path(hashlib.sha256(b"new jar").hexdigest()), dest))
+
+    def test_store_collected_blob(self) -> None:
+        first, second = self.__output("tar", "a.jar"), self.__output("rpm", "a.jar")
+        self.output_store.store(self.__artifact("a.jar", "jar"), first, self.file_copier)
+        os.unlink(self.output_store.blob_path(hashlib.sha256(b"jar").hexdigest()))
+        self.assertFalse(self.output_store.store(self.__artifact("b.jar", "jar"), second, self.file_copier))
+        self.assertTrue(os.path.samefile(self.output_store.blob_path(hashlib.sha256(b"jar").hexdigest()), second))
+
+    def test_store_other_file_system(self) -> None:
+        dest = self.__output("tar", "a.jar")
+        with patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link")):
+            self.assertFalse(self.output_store.store(self.__artifact("a.jar", "jar"), dest, self.file_copier))
+        with open(dest) as f:
+            self.assertEqual(f.read(), "jar")
+
+    def test_gc(self) -> None:
+        self.output_store.store(self.__artifact("a.jar", "jar"), self.__output("tar", "a.jar"), self.file_copier)
+        self.output_store.store(self.__artifact("b.jar", "other jar"), self.__output("tar", "b.jar"), self.file_copier)
+        self.output_store.store(self.__artifact("a.jar", "jar"), self.__output("rpm", "a.jar"), self.file_copier)
+        self.assertEqual(self.output_store.gc(), 0)
+
+        shutil.rmtree(os.path.join(self.temp_dir.name, "tar"))
+        self.assertEqual(self.output_store.gc(), 1)
+        self.assertTrue(os.path.isfile(self.output_store.blob_path(hashlib.sha256(b"jar").hexdigest())))
+        self.assertFalse(os.path.isfile(self.output_store.blob_path(hashlib.sha256(b"other jar").hexdigest())))
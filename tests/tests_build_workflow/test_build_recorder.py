@@ -5,17 +5,23 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import hashlib
 import os
 import unittest
 from unittest.mock import MagicMock, Mock, patch
 
 import yaml
 
+from build_workflow.build_artifact_check import BuildArtifactCheck
+from build_workflow.build_artifact_checks_pool import BuildArtifactChecksPool
+from build_workflow.build_output_store import BuildOutputStore
 from build_workflow.build_recorder import BuildRecorder
 from build_workflow.build_target import BuildTarget
 from build_workflow.opensearch.build_artifact_check_maven import BuildArtifactOpenSearchCheckMaven
 from build_workflow.opensearch.build_artifact_check_plugin import BuildArtifactOpenSearchCheckPlugin
 from manifests.build_manifest import BuildManifest
+from manifests.input_manifest import InputComponentFromSource
+from system.checksums import file_digests
 from system.temporary_directory import TemporaryDirectory
 
 
@@ -63,7 +69,7 @@ class TestBuildRecorder(unittest.TestCase):
             )
         )
 
-    @patch("shutil.copyfile")
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
     def test_record_component_and_artifact(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
         recorder = self.__mock(snapshot=False)
@@ -96,20 +102,21 @@ class TestBuildRecorder(unittest.TestCase):
                     {
                         "artifacts": {"libs": ["../file1.jar", "../file2.jar"]},
                         "commit_id": "3913d7097934cbfe1fdcf919347f22a597d00b76",
+                        "digests": {"../file1.jar": file_digests(__file__), "../file2.jar": file_digests(__file__)},
                         "name": "common-utils",
                         "ref": "main",
                         "repository": "https://github.com/opensearch-project/common-utils",
                         "version": "1.3.0.0",
                     }
                 ],
-                "schema-version": "1.2",
+                "schema-version": "1.3",
             },
         )
 
         mock_copyfile.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
     def test_record_artifact(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
         recorder = self.__mock(snapshot=False)
@@ -129,34 +136,91 @@ class TestBuildRecorder(unittest.TestCase):
         mock_makedirs.assert_called_with(output_dir, exist_ok=True)
         mock_copyfile.assert_called_with(__file__, os.path.join(output_dir, "file1.jar"))
 
-    @patch("shutil.copyfile")
+    @patch("build_workflow.build_recorder.file_digests", return_value={"sha256": "sha256", "sha512": "sha512"})
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
-    def test_record_artifact_check_plugin(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_plugin(self, mock_makedirs: Mock, mock_copyfile: Mock, mock_file_digests: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component("security", MagicMock())
 
         with patch.object(BuildArtifactOpenSearchCheckPlugin, "check") as mock_check:
             recorder.record_artifact("security", "plugins", "../file1.zip", "invalid.file")
+            recorder.check_artifacts("security")
 
-        mock_check.assert_called_with("invalid.file")
+        mock_check.assert_called_with(os.path.join("output_dir", "../file1.zip"))
         mock_copyfile.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("build_workflow.build_recorder.file_digests", return_value={"sha256": "sha256", "sha512": "sha512"})
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
-    def test_record_artifact_check_maven(self, mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+    def test_record_artifact_check_maven(self, mock_makedirs: Mock, mock_copyfile: Mock, mock_file_digests: Mock) -> None:
         recorder = self.__mock(snapshot=False)
 
         recorder.record_component("security", MagicMock())
 
         with patch.object(BuildArtifactOpenSearchCheckMaven, "check") as mock_check:
             recorder.record_artifact("security", "maven", "../file1.zip", "valid.jar")
+            recorder.check_artifacts("security")
 
-        mock_check.assert_called_with("valid.jar")
+        mock_check.assert_called_with(os.path.join("output_dir", "../file1.zip"))
         mock_copyfile.assert_called()
         mock_makedirs.assert_called()
 
+    @patch("build_workflow.build_recorder.file_digests", return_value={"sha256": "sha256", "sha512": "sha512"})
+    @patch("system.file_copier.FileCopier.copy")
+    @patch("os.makedirs")
+    def test_check_artifacts_reports_all_failures(self, mock_makedirs: Mock, mock_copyfile: Mock, mock_file_digests: Mock) -> None:
+        recorder = self.__mock(snapshot=False)
+
+        recorder.record_component("security", MagicMock())
+
+        def check(path: str) -> None:
+            if "invalid" in path:
+                raise BuildArtifactCheck.BuildArtifactInvalidError(path, "invalid")
+
+        with patch.object(BuildArtifactOpenSearchCheckMaven, "check", side_effect=check):
+            recorder.record_artifact("security", "maven", "invalid-1.jar", "invalid-1.jar")
+            recorder.record_artifact("security", "maven", "valid.jar", "valid.jar")
+            recorder.record_artifact("security", "maven", "invalid-2.jar", "invalid-2.jar")
+            with self.assertRaises(BuildArtifactChecksPool.BuildArtifactChecksFailedError) as ctx:
+                recorder.check_artifacts("security")
+
+        self.assertEqual(len(ctx.exception.errors), 2)
+        self.assertIn("invalid-1.jar", str(ctx.exception))
+        self.assertIn("invalid-2.jar", str(ctx.exception))
+        self.assertEqual(recorder.artifact_checks.checked, 3)
+        self.assertEqual(recorder.artifact_checks.failed, 2)
+        self.assertEqual(recorder.build_manifest.components_hash["security"]["artifacts"], {"maven": ["valid.jar"]})
+
+        # failures are only reported once
+        recorder.check_artifacts("security")
+
+    def test_check_artifacts_removes_invalid_artifacts(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            recorder = BuildRecorder(BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", architecture="x64", snapshot=False))
+            recorder.record_component("security", MagicMock(url="https://github.com/opensearch-project/security.git", ref="main", sha="sha"))
+            for name in ["invalid.jar", "valid.jar"]:
+                with open(os.path.join(work_dir.name, name), "w") as f:
+                    f.write(name)
+
+            def check(path: str) -> None:
+                if "invalid" in path:
+                    raise BuildArtifactCheck.BuildArtifactInvalidError(path, "invalid")
+
+            with patch.object(BuildArtifactOpenSearchCheckMaven, "check", side_effect=check):
+                recorder.record_artifact("security", "maven", "maven/invalid.jar", os.path.join(work_dir.name, "invalid.jar"))
+                recorder.record_artifact("security", "maven", "maven/valid.jar", os.path.join(work_dir.name, "valid.jar"))
+                with self.assertRaises(BuildArtifactChecksPool.BuildArtifactChecksFailedError):
+                    recorder.check_artifacts("security")
+
+            component = recorder.get_manifest().components["security"]
+            self.assertEqual(component.artifacts, {"maven": ["maven/valid.jar"]})
+            self.assertEqual(list(component.digests.keys()), ["maven/valid.jar"])
+            self.assertFalse(os.path.exists(os.path.join(work_dir.name, "output", "maven", "invalid.jar")))
+            self.assertTrue(os.path.exists(os.path.join(work_dir.name, "output", "maven", "valid.jar")))
+
     def test_get_manifest(self) -> None:
         manifest = self.__mock(snapshot=False).get_manifest()
         self.assertIs(type(manifest), BuildManifest)
@@ -171,7 +235,7 @@ class TestBuildRecorder(unittest.TestCase):
                     "name": "OpenSearch",
                     "version": "1.3.0",
                 },
-                "schema-version": "1.2",
+                "schema-version": "1.3",
             },
         )
 
@@ -189,7 +253,7 @@ class TestBuildRecorder(unittest.TestCase):
                     "name": "OpenSearch",
                     "version": "1.3.0",
                 },
-                "schema-version": "1.2",
+                "schema-version": "1.3",
             },
         )
 
@@ -204,11 +268,111 @@ class TestBuildRecorder(unittest.TestCase):
             with open(manifest_path) as f:
                 self.assertEqual(yaml.safe_load(f), data)
 
-    @patch("shutil.copyfile")
+    def test_write_manifest_removes_journal(self) -> None:
+        with TemporaryDirectory() as dest_dir:
+            mock = self.__mock(snapshot=False)
+            mock.target.output_dir = dest_dir.name
+            mock.start_journal()
+            self.assertTrue(os.path.isfile(mock.journal.path))
+            mock.write_manifest()
+            self.assertFalse(os.path.exists(mock.journal.path))
+
+    def test_record_log(self) -> None:
+        recorder = self.__mock(snapshot=False)
+        recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils", ref="main", sha="3913d7097934cbfe1fdcf919347f22a597d00b76"))
+        log_path = recorder.log_path("common-utils")
+        self.assertEqual(log_path, os.path.join(recorder.target.output_dir, "logs", "common-utils.log.gz"))
+        recorder.record_log("common-utils", log_path)
+        component = recorder.get_manifest().to_dict()["components"][0]
+        self.assertEqual(component["log"], os.path.join("logs", "common-utils.log.gz"))
+
+    def test_record_from(self) -> None:
+        with TemporaryDirectory() as tar_dir, TemporaryDirectory() as rpm_dir:
+            recorder = self.__mock(snapshot=False)
+            recorder.target.output_dir = tar_dir.name
+            recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils", ref="main", sha="3913d7097934cbfe1fdcf919347f22a597d00b76"))
+            recorder.record_artifact("common-utils", "maven", os.path.join("maven", "common-utils.jar"), __file__)
+            os.makedirs(os.path.join(tar_dir.name, "logs"))
+            open(recorder.log_path("common-utils"), "w").close()
+            recorder.record_log("common-utils", recorder.log_path("common-utils"))
+
+            rpm_recorder = self.__mock_distribution(snapshot=False)
+            rpm_recorder.target.output_dir = rpm_dir.name
+            rpm_recorder.record_from(recorder, "common-utils")
+            self.assertTrue(os.path.isfile(os.path.join(rpm_dir.name, "maven", "common-utils.jar")))
+            self.assertTrue(os.path.isfile(os.path.join(rpm_dir.name, "logs", "common-utils.log.gz")))
+            self.assertTrue(os.path.isfile(os.path.join(tar_dir.name, "maven", "common-utils.jar")))
+            manifest = rpm_recorder.get_manifest().to_dict()
+            self.assertEqual(manifest["build"]["distribution"], "rpm")
+            self.assertEqual(manifest["components"], recorder.get_manifest().to_dict()["components"])
+
+    def __journal(self, output_dir: str) -> None:
+        recorder = self.__mock(snapshot=False)
+        recorder.target.output_dir = output_dir
+        recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils", ref="main", sha="3913d7097934cbfe1fdcf919347f22a597d00b76"))
+        recorder.build_manifest.append_artifact("common-utils", "maven", "maven/common-utils.jar")
+        recorder.journal_component("common-utils")
+        recorder.journal_component("unknown")
+
+    def __input_manifest(self, ref: str = "main") -> MagicMock:
+        component = InputComponentFromSource({"name": "common-utils", "repository": "https://github.com/opensearch-project/common-utils", "ref": ref})
+        return MagicMock(components={"common-utils": component})
+
+    @patch("build_workflow.build_recorder.GitStableRefs.resolve")
+    def test_journal_and_resume(self, mock_resolve: Mock) -> None:
+        mock_resolve.return_value = {("https://github.com/opensearch-project/common-utils", "main"): ["3913d7097934cbfe1fdcf919347f22a597d00b76", "refs/heads/main"]}
+        with TemporaryDirectory() as dest_dir:
+            self.__journal(dest_dir.name)
+
+            resumed = self.__mock(snapshot=False)
+            resumed.target.output_dir = dest_dir.name
+            self.assertEqual(resumed.resume(self.__input_manifest()), ["common-utils"])
+            component = resumed.get_manifest().to_dict()["components"][0]
+            self.assertEqual(component["commit_id"], "3913d7097934cbfe1fdcf919347f22a597d00b76")
+            self.assertEqual(component["artifacts"], {"maven": ["maven/common-utils.jar"]})
+
+    @patch("build_workflow.build_recorder.GitStableRefs.resolve")
+    def test_resume_skips_changed_components(self, mock_resolve: Mock) -> None:
+        with TemporaryDirectory() as dest_dir:
+            self.__journal(dest_dir.name)
+            resumed = self.__mock(snapshot=False)
+            resumed.target.output_dir = dest_dir.name
+
+            # the branch moved since the component was built
+            mock_resolve.return_value = {("https://github.com/opensearch-project/common-utils", "main"): ["0" * 40, "refs/heads/main"]}
+            self.assertEqual(resumed.resume(self.__input_manifest()), [])
+
+            # the input manifest builds another ref
+            mock_resolve.return_value = {("https://github.com/opensearch-project/common-utils", "2.x"): ["3913d7097934cbfe1fdcf919347f22a597d00b76", "refs/heads/2.x"]}
+            self.assertEqual(resumed.resume(self.__input_manifest("2.x")), [])
+
+            # the component was removed from the input manifest
+            self.assertEqual(resumed.resume(MagicMock(components={})), [])
+            self.assertEqual(resumed.build_manifest.components_hash, {})
+
+    def test_start_journal(self) -> None:
+        with TemporaryDirectory() as dest_dir:
+            self.__journal(dest_dir.name)
+            recorder = self.__mock(snapshot=False)
+            recorder.target.output_dir = dest_dir.name
+            recorder.start_journal()
+            self.assertEqual(recorder.journal.read(), [])
+
+    def test_write_metrics(self) -> None:
+        with TemporaryDirectory() as dest_dir:
+            mock = self.__mock(snapshot=False)
+            mock.target.output_dir = dest_dir.name
+            with mock.metrics.phase("OpenSearch", "build"):
+                pass
+            mock.write_metrics()
+            self.assertTrue(os.path.isfile(os.path.join(dest_dir.name, "build-metrics.json")))
+
+    @patch("build_workflow.build_recorder.file_digests", return_value={"sha256": "sha256", "sha512": "sha512"})
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
     @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
     def test_record_artifact_check_plugin_version_properties(self, mock_plugin_check: Mock, mock_makedirs: Mock,
-                                                             mock_copyfile: Mock) -> None:
+                                                             mock_copyfile: Mock, mock_file_digests: Mock) -> None:
         mock = self.__mock(snapshot=False)
         mock.record_component(
             "security",
@@ -219,6 +383,7 @@ class TestBuildRecorder(unittest.TestCase):
             ),
         )
         mock.record_artifact("security", "plugins", "../file1.zip", "valid-1.3.0.0.zip")
+        mock.check_artifacts("security")
         manifest_dict = mock.get_manifest().to_dict()
         self.assertEqual(manifest_dict["build"]["version"], "1.3.0")
         self.assertEqual(manifest_dict["components"][0]["version"], "1.3.0.0")
@@ -226,11 +391,12 @@ class TestBuildRecorder(unittest.TestCase):
         mock_copyfile.assert_called()
         mock_makedirs.assert_called()
 
-    @patch("shutil.copyfile")
+    @patch("build_workflow.build_recorder.file_digests", return_value={"sha256": "sha256", "sha512": "sha512"})
+    @patch("system.file_copier.FileCopier.copy")
     @patch("os.makedirs")
     @patch.object(BuildArtifactOpenSearchCheckPlugin, "check")
     def test_record_artifact_check_plugin_version_properties_snapshot(self, mock_plugin_check: Mock,
-                                                                      mock_makedirs: Mock, mock_copyfile: Mock) -> None:
+                                                                      mock_makedirs: Mock, mock_copyfile: Mock, mock_file_digests: Mock) -> None:
         mock = self.__mock(snapshot=True)
         mock.record_component(
             "security",
@@ -241,6 +407,7 @@ class TestBuildRecorder(unittest.TestCase):
             ),
         )
         mock.record_artifact("security", "plugins", "../file1.zip", "valid-1.3.0.0-SNAPSHOT.zip")
+        mock.check_artifacts("security")
         manifest_dict = mock.get_manifest().to_dict()
         self.assertEqual(manifest_dict["build"]["version"], "1.3.0-SNAPSHOT")
         self.assertEqual(manifest_dict["components"][0]["version"], "1.3.0.0-SNAPSHOT")
@@ -280,3 +447,101 @@ class TestBuildRecorder(unittest.TestCase):
                          "8776900f2f26312b4d3a08e4343f3e3f7bdde536")
         self.assertEqual(mock.build_manifest.components_hash.get("security").get("commit_id"),
                          "e3c8902dea26fd20f56a6f144042b2623f652e3e")
+
+    def test_sort_components(self) -> None:
+        recorder = self.__mock(snapshot=False)
+
+        for name in ["security", "OpenSearch", "common-utils"]:
+            recorder.record_component(
+                name,
+                MagicMock(
+                    url=f"https://github.com/opensearch-project/{name}.git",
+                    ref="main",
+                    sha="3913d7097934cbfe1fdcf919347f22a597d00b76",
+                ),
+            )
+
+        recorder.sort_components(["OpenSearch", "common-utils", "security"])
+
+        self.assertEqual(
+            [component["name"] for component in recorder.get_manifest().to_dict()["components"]],
+            ["OpenSearch", "common-utils", "security"],
+        )
+
+    def test_sort_components_keeps_unknown_components_last(self) -> None:
+        mock = self.__mock_with_manifest(snapshot=False)
+        names = list(mock.build_manifest.components_hash.keys())
+
+        mock.sort_components(["security"])
+
+        self.assertEqual(list(mock.build_manifest.components_hash.keys()), ["security"] + [name for name in names if name != "security"])
+
+    def test_record_artifact_links_on_same_filesystem(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            artifact = os.path.join(work_dir.name, "artifact.jar")
+            with open(artifact, "w") as f:
+                f.write("jar")
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+            )
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            recorder.record_artifact("common-utils", "libs", "libs/artifact.jar", artifact)
+
+            self.assertTrue(os.path.samefile(artifact, os.path.join(work_dir.name, "output", "libs", "artifact.jar")))
+
+    def test_record_artifact_move(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            artifact = os.path.join(work_dir.name, "artifact.jar")
+            with open(artifact, "w") as f:
+                f.write("jar")
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64"),
+                move_artifacts=True,
+            )
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            recorder.record_artifact("common-utils", "libs", "libs/artifact.jar", artifact)
+
+            self.assertFalse(os.path.exists(artifact))
+            self.assertTrue(os.path.isfile(os.path.join(work_dir.name, "output", "libs", "artifact.jar")))
+
+    def test_record_artifact_output_store(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            output_store = BuildOutputStore(os.path.join(work_dir.name, "store"))
+            recorders = []
+            for build in ["1", "2"]:
+                artifact = os.path.join(work_dir.name, build, "artifact.jar")
+                os.makedirs(os.path.dirname(artifact))
+                with open(artifact, "w") as f:
+                    f.write("jar")
+                recorder = BuildRecorder(
+                    BuildTarget(build_id=build, output_dir=os.path.join(work_dir.name, "output", build), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64"),
+                    output_store=output_store,
+                )
+                recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+                recorder.record_artifact("common-utils", "libs", "libs/artifact.jar", artifact)
+                recorders.append(recorder)
+
+            blob = output_store.blob_path(BuildOutputStore.digest(os.path.join(work_dir.name, "1", "artifact.jar")))
+            self.assertTrue(os.path.samefile(blob, os.path.join(work_dir.name, "output", "1", "libs", "artifact.jar")))
+            self.assertTrue(os.path.samefile(blob, os.path.join(work_dir.name, "output", "2", "libs", "artifact.jar")))
+            self.assertEqual(output_store.deduplicated, 1)
+
+    def test_record_artifact_digests(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            artifact = os.path.join(work_dir.name, "artifact.jar")
+            with open(artifact, "wb") as f:
+                f.write(b"jar")
+            recorder = BuildRecorder(
+                BuildTarget(build_id="1", output_dir=os.path.join(work_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+            )
+            recorder.record_component("common-utils", MagicMock(url="url", ref="main", sha="sha"))
+            recorder.record_artifact("common-utils", "libs", "libs/artifact.jar", artifact)
+
+            component = recorder.get_manifest().components["common-utils"]
+            self.assertEqual(component.digests, {"libs/artifact.jar": {"sha256": hashlib.sha256(b"jar").hexdigest(), "sha512": hashlib.sha512(b"jar").hexdigest()}})
+
+    def test_get_manifest_upgrades_existing_manifest(self) -> None:
+        mock = self.__mock_with_manifest(snapshot=False)
+        manifest = mock.get_manifest()
+        self.assertIs(type(manifest), BuildManifest)
+        self.assertEqual(manifest.version, "1.3")
@@ -0,0 +1,123 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from typing import Any, List
+from unittest.mock import MagicMock, patch
+
+import psutil
+
+from build_workflow.build_resources import BuildResources
+from manifests.input_manifest import InputComponent
+from system.temporary_directory import TemporaryDirectory
+
+GB = 1024 ** 3
+
+
+class TestBuildResources(unittest.TestCase):
+    def __component(self, name: str, resources: Any = None) -> InputComponent:
+        return InputComponent._from({"name": name, "repository": f"https://github.com/opensearch-project/{name}.git", "ref": "main", "resources": resources})
+
+    def test_cost_default(self) -> None:
+        self.assertEqual(BuildResources().cost(self.__component("alerting")), BuildResources.Cost(1, 4 * GB))
+
+    def test_cost_from_manifest(self) -> None:
+        resources = BuildResources()
+        self.assertEqual(resources.cost(self.__component("OpenSearch", {"cpus": 4, "memory": 8})), BuildResources.Cost(4, 8 * GB))
+        self.assertEqual(resources.cost(self.__component("OpenSearch", {"cpus": 2})), BuildResources.Cost(2, 4 * GB))
+
+    def test_cost_from_history(self) -> None:
+        history = MagicMock()
+        history.peak_rss.return_value = 2 * GB
+        resources = BuildResources(history=history)
+        self.assertEqual(resources.cost(self.__component("alerting")), BuildResources.Cost(1, int(2.5 * GB)))
+        self.assertEqual(resources.cost(self.__component("alerting", {"memory": 1})), BuildResources.Cost(1, GB))
+
+    @patch("build_workflow.build_resources.psutil.virtual_memory")
+    def test_acquire_cpus(self, mock_virtual_memory: MagicMock) -> None:
+        mock_virtual_memory.return_value.available = 64 * GB
+        resources = BuildResources(cpus=4)
+        self.assertTrue(resources.acquire(self.__component("OpenSearch", {"cpus": 3})))
+        self.assertFalse(resources.acquire(self.__component("alerting", {"cpus": 2})))
+        self.assertTrue(resources.acquire(self.__component("common-utils", {"cpus": 1})))
+        resources.release(self.__component("OpenSearch", {"cpus": 3}))
+        self.assertTrue(resources.acquire(self.__component("alerting", {"cpus": 2})))
+        self.assertEqual(resources.used_cpus, 3)
+        self.assertEqual(resources.running, 2)
+
+    @patch("build_workflow.build_resources.psutil.virtual_memory")
+    def test_acquire_memory(self, mock_virtual_memory: MagicMock) -> None:
+        mock_virtual_memory.return_value.available = 64 * GB
+        resources = BuildResources(memory=10 * GB)
+        self.assertTrue(resources.acquire(self.__component("OpenSearch", {"memory": 8})))
+        self.assertFalse(resources.acquire(self.__component("alerting")))
+        self.assertTrue(resources.acquire(self.__component("common-utils", {"memory": 2})))
+
+    @patch("build_workflow.build_resources.psutil.virtual_memory")
+    def test_acquire_over_budget_runs_alone(self, mock_virtual_memory: MagicMock) -> None:
+        mock_virtual_memory.return_value.available = GB
+        resources = BuildResources(cpus=2, memory=4 * GB)
+        self.assertTrue(resources.acquire(self.__component("OpenSearch", {"cpus": 8, "memory": 16})))
+        resources.release(self.__component("OpenSearch", {"cpus": 8, "memory": 16}))
+        self.assertEqual((resources.used_cpus, resources.used_memory, resources.running), (0, 0, 0))
+
+    @patch("build_workflow.build_resources.psutil.virtual_memory")
+    def test_acquire_waits_for_available_memory(self, mock_virtual_memory: MagicMock) -> None:
+        mock_virtual_memory.return_value.available = 3 * GB
+        resources = BuildResources(cpus=8)
+        self.assertTrue(resources.acquire(self.__component("OpenSearch", {"memory": 2})))
+        self.assertFalse(resources.acquire(self.__component("alerting", {"memory": 4})))
+        mock_virtual_memory.return_value.available = 5 * GB
+        self.assertTrue(resources.acquire(self.__component("alerting", {"memory": 4})))
+
+    def test_history(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "history", "build-resources.json")
+            history = BuildResources.History(path)
+            self.assertIsNone(history.peak_rss("alerting"))
+            history.update({"alerting": 2 * GB})
+            BuildResources.History(path).update({"OpenSearch": 6 * GB})
+            history.update({"alerting": 3 * GB})
+            self.assertEqual(history.peak_rss("alerting"), 3 * GB)
+            self.assertEqual(BuildResources.History(path).peak_rss("OpenSearch"), 6 * GB)
+
+    @patch("build_workflow.build_resources.psutil.Process")
+    def test_monitor_sample(self, mock_process: MagicMock) -> None:
+        with TemporaryDirectory() as work_dir:
+            def process(rss: int, cwd: str = None, children: List[Any] = []) -> MagicMock:
+                return MagicMock(cwd=MagicMock(return_value=cwd), children=MagicMock(return_value=children), memory_info=MagicMock(return_value=MagicMock(rss=rss)))
+
+            alerting = os.path.realpath(os.path.join(work_dir.name, "alerting"))
+            daemon = process(4 * GB)
+            gradle = process(GB, children=[daemon])
+            script = process(GB, os.path.join(alerting, "build"), [gradle, daemon])
+            mock_process.return_value.children.return_value = [
+                script,
+                process(8 * GB, alerting + "-2", [process(8 * GB)]),
+            ]
+            monitor = BuildResources.Monitor({"alerting": alerting, "OpenSearch": os.path.join(work_dir.name, "OpenSearch")})
+            monitor.sample()
+            self.assertEqual(monitor.peaks, {"alerting": 6 * GB})
+
+            # the daemon outlives the build script that started it
+            script.memory_info.side_effect = psutil.NoSuchProcess(1)
+            gradle.memory_info.side_effect = psutil.NoSuchProcess(2)
+            daemon.memory_info.return_value = MagicMock(rss=7 * GB)
+            mock_process.return_value.children.return_value = []
+            monitor.sample()
+            self.assertEqual(monitor.peaks, {"alerting": 7 * GB})
+            self.assertEqual(list(monitor.processes.values()), ["alerting"])
+
+    @patch("build_workflow.build_resources.psutil.Process")
+    def test_monitor_sample_skips_vanished_processes(self, mock_process: MagicMock) -> None:
+        with TemporaryDirectory() as work_dir:
+            vanished = MagicMock(cwd=MagicMock(side_effect=psutil.NoSuchProcess(1)))
+            mock_process.return_value.children.return_value = [vanished]
+            monitor = BuildResources.Monitor({"alerting": os.path.join(work_dir.name, "alerting")})
+            monitor.sample()
+            self.assertEqual(monitor.peaks, {})
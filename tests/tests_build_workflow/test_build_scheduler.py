@@ -0,0 +1,120 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from typing import Dict, List
+from unittest.mock import MagicMock
+
+from build_workflow.build_scheduler import BuildScheduler
+from manifests.input_manifest import InputComponent
+
+
+class TestBuildScheduler(unittest.TestCase):
+    def __component(self, name: str, depends_on: List[str] = None) -> InputComponent:
+        return InputComponent._from({"name": name, "repository": f"https://github.com/opensearch-project/{name}.git", "ref": "main", "depends_on": depends_on})
+
+    def __components(self) -> List[InputComponent]:
+        return [
+            self.__component("OpenSearch"),
+            self.__component("common-utils"),
+            self.__component("job-scheduler"),
+            self.__component("alerting", ["common-utils"]),
+            self.__component("index-management", ["common-utils", "job-scheduler"]),
+            self.__component("security"),
+        ]
+
+    def test_dependencies(self) -> None:
+        scheduler = BuildScheduler(self.__components(), 4, "OpenSearch")
+        self.assertEqual(scheduler.dependencies["OpenSearch"], set())
+        self.assertEqual(scheduler.dependencies["security"], {"OpenSearch"})
+        self.assertEqual(scheduler.dependencies["index-management"], {"OpenSearch", "common-utils", "job-scheduler"})
+        self.assertEqual(scheduler.dependents["common-utils"], ["alerting", "index-management"])
+
+    def test_dependencies_outside_of_build_are_ignored(self) -> None:
+        scheduler = BuildScheduler([self.__component("alerting", ["common-utils"])], 2, "OpenSearch")
+        self.assertEqual(scheduler.dependencies["alerting"], set())
+
+    def test_run_respects_dependencies(self) -> None:
+        built: List[str] = []
+        lock = threading.Lock()
+
+        def build(component: InputComponent) -> None:
+            with lock:
+                for dependency in component.depends_on or ["OpenSearch"]:
+                    if component.name != "OpenSearch":
+                        self.assertIn(dependency, built)
+                built.append(component.name)
+
+        skipped = BuildScheduler(self.__components(), 3, "OpenSearch").run(build, MagicMock(return_value=False))
+        self.assertEqual(skipped, [])
+        self.assertEqual(built[0], "OpenSearch")
+        self.assertEqual(sorted(built), sorted(component.name for component in self.__components()))
+
+    def test_run_concurrently(self) -> None:
+        barrier = threading.Barrier(3, timeout=10)
+
+        def build(component: InputComponent) -> None:
+            if component.name in ["common-utils", "job-scheduler", "security"]:
+                barrier.wait()
+
+        BuildScheduler(self.__components(), 3, "OpenSearch").run(build, MagicMock(return_value=False))
+
+    def test_run_sequential_order(self) -> None:
+        built: List[str] = []
+        BuildScheduler(self.__components(), 1, "OpenSearch").run(lambda component: built.append(component.name), MagicMock())
+        self.assertEqual(built, ["OpenSearch", "common-utils", "job-scheduler", "alerting", "index-management", "security"])
+
+    def test_run_longest_chain_first(self) -> None:
+        built: List[str] = []
+        durations: Dict[str, float] = {"OpenSearch": 600, "common-utils": 10, "job-scheduler": 10, "alerting": 10, "index-management": 500, "security": 300}
+        BuildScheduler(self.__components(), 1, "OpenSearch", durations).run(lambda component: built.append(component.name), MagicMock())
+        self.assertEqual(built, ["OpenSearch", "common-utils", "job-scheduler", "index-management", "security", "alerting"])
+
+    def test_run_error_raises(self) -> None:
+        built: List[str] = []
+
+        def build(component: InputComponent) -> None:
+            if component.name == "common-utils":
+                raise ValueError("common-utils failed")
+            built.append(component.name)
+
+        on_error = MagicMock(return_value=False)
+        with self.assertRaises(ValueError) as ctx:
+            BuildScheduler(self.__components(), 1, "OpenSearch").run(build, on_error)
+
+        self.assertEqual(str(ctx.exception), "common-utils failed")
+        self.assertEqual(on_error.call_args[0][0].name, "common-utils")
+        self.assertEqual(built, ["OpenSearch"])
+
+    def test_run_error_continues_and_skips_dependents(self) -> None:
+        built: List[str] = []
+
+        def build(component: InputComponent) -> None:
+            if component.name == "common-utils":
+                raise ValueError("common-utils failed")
+            built.append(component.name)
+
+        skipped = BuildScheduler(self.__components(), 2, "OpenSearch").run(build, MagicMock(return_value=True))
+
+        self.assertEqual(skipped, ["alerting", "index-management"])
+        self.assertEqual(sorted(built), ["OpenSearch", "job-scheduler", "security"])
+
+    def test_run_circular_dependency(self) -> None:
+        components = [self.__component("a", ["b"]), self.__component("b", ["a"])]
+        with self.assertRaises(ValueError) as ctx:
+            BuildScheduler(components, 2).run(MagicMock(), MagicMock())
+        self.assertEqual(str(ctx.exception), "Circular dependency between components: a, b")
+
+    def test_run_within_resources(self) -> None:
+        resources = MagicMock()
+        resources.acquire.side_effect = lambda component: component.name != "security" or resources.release.call_count > 0
+        built: List[str] = []
+
+        BuildScheduler(self.__components(), 4, "OpenSearch", resources=resources).run(lambda component: built.append(component.name), MagicMock(return_value=False))
+        self.assertEqual(sorted(built), sorted(component.name for component in self.__components()))
+        self.assertEqual(resources.release.call_count, len(built))
@@ -0,0 +1,134 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from build_workflow.build_recorder import BuildRecorder
+from build_workflow.build_target import BuildTarget
+from build_workflow.build_worker import BuildWorker
+from build_workflow.build_worker_connection import BuildWorkerConnection
+from build_workflow.build_workers import BuildWorkers
+from build_workflow.builder_on_worker import BuilderOnWorker
+from manifests.input_manifest import InputComponentFromSource
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestBuildWorker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.maven_local = os.path.join(self.temp_dir.name, "m2")
+        self.worker = BuildWorker(maven_local=self.maven_local)
+        self.thread = threading.Thread(target=self.worker.serve_forever, daemon=True)
+        self.thread.start()
+        self.target = BuildTarget(build_id="1", output_dir=os.path.join(self.temp_dir.name, "output"), name="OpenSearch", version="1.3.0", platform="linux", architecture="x64")
+        self.recorder = BuildRecorder(self.target)
+        self.component = InputComponentFromSource({"name": "alerting", "repository": "https://github.com/opensearch-project/alerting.git", "ref": "main"})
+
+    def tearDown(self) -> None:
+        self.worker.close()
+        self.thread.join()
+        self.temp_dir.__exit__(None, None, None)
+
+    def __build(self) -> BuilderOnWorker:
+        builder = BuilderOnWorker(self.component, self.target, BuildWorkers([self.worker.address]))
+        builder.checkout(os.path.join(self.temp_dir.name, "work"))
+        builder.build(self.recorder)
+        builder.export_artifacts(self.recorder)
+        return builder
+
+    @staticmethod
+    def __local_build(builder: MagicMock) -> MagicMock:
+        def build(recorder: BuildRecorder) -> None:
+            recorder.record_component("alerting", MagicMock(url="https://github.com/opensearch-project/alerting.git", ref="main", sha="3913d7097934cbfe1fdcf919347f22a597d00b76"))
+            log_path = recorder.log_path("alerting")
+            os.makedirs(os.path.dirname(log_path))
+            with open(log_path, "w") as f:
+                f.write("BUILD SUCCESSFUL")
+            recorder.record_log("alerting", log_path)
+
+        def export_artifacts(recorder: BuildRecorder) -> None:
+            artifact_file = os.path.join(recorder.target.output_dir, "alerting.jar")
+            with open(artifact_file, "wb") as f:
+                f.write(os.urandom(3 * BuildWorkerConnection.CHUNK + 1))
+            recorder.record_artifact("alerting", "libs", "libs/alerting.jar", artifact_file)
+
+        builder.return_value.build.side_effect = build
+        builder.return_value.export_artifacts.side_effect = export_artifacts
+        return builder
+
+    @patch("build_workflow.build_worker.BuilderFromSource")
+    def test_build(self, mock_builder: MagicMock) -> None:
+        self.__local_build(mock_builder)
+        builder = self.__build()
+
+        self.assertEqual(mock_builder.call_args[0][0].name, "alerting")
+        self.assertEqual(mock_builder.call_args[0][1].build_id, "1")
+        self.assertEqual(mock_builder.call_args[0][1].version, "1.3.0")
+        self.assertEqual(builder.artifacts, [("libs", "libs/alerting.jar", os.path.join(self.temp_dir.name, "work", "alerting", "builds", "libs", "alerting.jar"))])
+        self.assertEqual(os.path.getsize(os.path.join(self.target.output_dir, "libs", "alerting.jar")), 3 * BuildWorkerConnection.CHUNK + 1)
+        with open(os.path.join(self.target.output_dir, "logs", "alerting.log.gz")) as f:
+            self.assertEqual(f.read(), "BUILD SUCCESSFUL")
+        component = self.recorder.get_manifest().to_dict()["components"][0]
+        self.assertEqual(component["commit_id"], "3913d7097934cbfe1fdcf919347f22a597d00b76")
+        self.assertEqual(component["artifacts"], {"libs": ["libs/alerting.jar"]})
+        self.assertEqual(component["log"], os.path.join("logs", "alerting.log.gz"))
+
+    @patch("build_workflow.build_worker.BuilderFromSource")
+    def test_build_sends_maven_artifacts(self, mock_builder: MagicMock) -> None:
+        self.__local_build(mock_builder)
+        self.recorder.record_component("common-utils", MagicMock(url="https://github.com/opensearch-project/common-utils.git", ref="main", sha="sha"))
+        maven_file = os.path.join(self.temp_dir.name, "common-utils.jar")
+        with open(maven_file, "w") as f:
+            f.write("common-utils")
+        self.recorder.record_artifact("common-utils", "maven", "maven/org/opensearch/common-utils.jar", maven_file)
+
+        with patch.object(BuildWorkerConnection, "send_file", autospec=True, side_effect=BuildWorkerConnection.send_file) as mock_send_file:
+            self.__build()
+            self.assertEqual(mock_send_file.call_args_list[0][0][1], {"type": "file", "path": "maven/org/opensearch/common-utils.jar"})
+            with open(os.path.join(self.maven_local, "org", "opensearch", "common-utils.jar")) as f:
+                self.assertEqual(f.read(), "common-utils")
+
+            # the worker has it now
+            self.__build()
+            self.assertEqual(len([call for call in mock_send_file.call_args_list if call[0][1]["type"] == "file"]), 1)
+
+            # a rebuild with the same size is sent again
+            with open(maven_file, "w") as f:
+                f.write("common-util2")
+            self.recorder.record_artifact("common-utils", "maven", "maven/org/opensearch/common-utils.jar", maven_file)
+            self.__build()
+            self.assertEqual(len([call for call in mock_send_file.call_args_list if call[0][1]["type"] == "file"]), 2)
+            with open(os.path.join(self.maven_local, "org", "opensearch", "common-utils.jar")) as f:
+                self.assertEqual(f.read(), "common-util2")
+
+    @patch("build_workflow.builder_on_worker.BuildWorkerConnection.connect")
+    def test_build_only_sends_offered_maven_artifacts(self, mock_connect: MagicMock) -> None:
+        with open(os.path.join(self.temp_dir.name, "secret"), "w") as f:
+            f.write("secret")
+        mock_connect.return_value.receive.return_value = {"type": "maven", "missing": ["../secret"]}
+        with self.assertRaises(BuilderOnWorker.BuildError) as ctx:
+            self.__build()
+        self.assertEqual(str(ctx.exception), f"Error building alerting on {self.worker.address}: ../secret was not offered to the worker")
+        self.assertEqual(mock_connect.return_value.send.call_args[0][0]["maven"], {})
+        mock_connect.return_value.send_file.assert_not_called()
+        mock_connect.return_value.close.assert_called_once_with()
+
+    @patch("build_workflow.build_worker.BuilderFromSource")
+    def test_build_error(self, mock_builder: MagicMock) -> None:
+        mock_builder.return_value.build.side_effect = ValueError("Build failed")
+        with self.assertRaises(BuilderOnWorker.BuildError) as ctx:
+            self.__build()
+        self.assertEqual(str(ctx.exception), f"Error building alerting on {self.worker.address}: Build failed")
+
+    def test_connection_path(self) -> None:
+        self.assertEqual(BuildWorkerConnection.path("/builds", "maven/org/opensearch/common-utils.jar"), "/builds/maven/org/opensearch/common-utils.jar")
+        for path in ["../etc/passwd", "/etc/passwd", "maven/../../etc/passwd"]:
+            with self.assertRaises(ValueError):
+                BuildWorkerConnection.path("/builds", path)
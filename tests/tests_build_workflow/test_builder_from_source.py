@@ -14,6 +14,7 @@ from build_workflow.build_target import BuildTarget
 from build_workflow.builder_from_source import BuilderFromSource
 from manifests.input_manifest import InputComponentFromSource
 from paths.script_finder import ScriptFinder
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestBuilderFromSource(unittest.TestCase):
@@ -85,10 +86,22 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_log(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir")
+        build_recorder = MagicMock()
+        build_recorder.log_path.return_value = "builds/logs/sample_component.log.gz"
+        self.builder.checkout("dir")
+        self.builder.build(build_recorder)
+        build_recorder.log_path.assert_called_with("sample_component")
+        self.assertEqual(mock_git_repo.return_value.execute.call_args[1], {"log": "builds/logs/sample_component.log.gz"})
+        build_recorder.record_log.assert_called_with("sample_component", "builds/logs/sample_component.log.gz")
+
     @patch("build_workflow.builder_from_source.GitRepository")
     def test_build_distribution(self, mock_git_repo: Mock) -> None:
         mock_git_repo.return_value = MagicMock(working_directory="dir")
@@ -107,10 +120,28 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("OpenSearch", mock_git_repo.return_value)
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_for_target(self, mock_git_repo: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            mock_git_repo.return_value = MagicMock(working_directory=work_dir.name)
+            stale_artifact = os.path.join(work_dir.name, "builds", "dist", "opensearch-min-1.3.0-linux-x64.tar.gz")
+            os.makedirs(os.path.dirname(stale_artifact))
+            open(stale_artifact, "w").close()
+            self.builder_distribution.checkout("dir")
+
+            builder = self.builder_distribution.for_target(self.builder_distribution_support.target)
+            self.assertTrue(builder.distribution_supported)
+            self.assertIs(builder.git_repo, mock_git_repo.return_value)
+            builder.build(MagicMock())
+            self.assertEqual(mock_git_repo.call_count, 1)
+            self.assertIn("-d rpm", mock_git_repo.return_value.execute.call_args[0][0])
+            self.assertFalse(os.path.exists(stale_artifact))
+
     @patch("build_workflow.builder_from_source.GitRepository")
     def test_build_distribution_support(self, mock_git_repo: Mock) -> None:
         mock_git_repo.return_value = MagicMock(working_directory="dir")
@@ -128,7 +159,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s false",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
 
@@ -150,7 +182,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("sample_component", self.builder.git_repo)
 
@@ -174,7 +207,8 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("sample_component", self.builder.git_repo)
 
@@ -198,10 +232,66 @@ class TestBuilderFromSource(unittest.TestCase):
                     "-s true",
                     "-o builds",
                 ]
-            )
+            ),
+            log=build_recorder.log_path.return_value,
         )
         build_recorder.record_component.assert_called_with("not_found_component", mock_git_repo.return_value)
 
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_hit(self, mock_git_repo: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        build_cache = MagicMock()
+        build_cache.key.return_value = "key"
+        build_cache.restore.return_value = True
+        build_recorder = MagicMock()
+        builder = BuilderFromSource(self.builder.component, self.builder.target, build_cache)
+        builder.checkout("dir")
+        builder.build(build_recorder)
+        build_cache.key.assert_called_with(
+            "sample_component",
+            "sha",
+            os.path.realpath(os.path.join(ScriptFinder.component_scripts_path, "sample_component", "build.sh")),
+            self.builder.target,
+            build_recorder,
+        )
+        build_cache.restore.assert_called_with("key", os.path.join("dir", "builds"))
+        build_cache.store.assert_not_called()
+        mock_git_repo.return_value.execute.assert_not_called()
+        build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
+
+    @patch("os.path.isdir", return_value=True)
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_miss(self, mock_git_repo: Mock, *mocks: Any) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        build_cache = MagicMock()
+        build_cache.key.return_value = "key"
+        build_cache.restore.return_value = False
+        build_recorder = MagicMock()
+        builder = BuilderFromSource(self.builder.component, self.builder.target, build_cache)
+        builder.checkout("dir")
+        builder.build(build_recorder)
+        mock_git_repo.return_value.execute.assert_called_once()
+        build_cache.store.assert_called_with("key", os.path.join("dir", "builds"))
+        build_recorder.record_component.assert_called_with("sample_component", mock_git_repo.return_value)
+
+    @patch("build_workflow.builder_from_source.FileLock")
+    @patch("shutil.copytree")
+    @patch("os.path.isdir", return_value=True)
+    @patch("build_workflow.builder_from_source.GitRepository")
+    def test_build_cache_hit_publishes_to_maven_local(self, mock_git_repo: Mock, mock_isdir: Mock, mock_copytree: Mock, mock_file_lock: Mock) -> None:
+        mock_git_repo.return_value = MagicMock(working_directory="dir", sha="sha")
+        build_cache = MagicMock()
+        build_cache.restore.return_value = True
+        builder = BuilderFromSource(self.builder.component, self.builder.target, build_cache)
+        builder.checkout("dir")
+        builder.build(MagicMock())
+        mock_copytree.assert_called_with(
+            os.path.join("dir", "builds", "maven"),
+            os.path.join(os.path.expanduser("~"), ".m2", "repository"),
+            dirs_exist_ok=True,
+        )
+        mock_file_lock.assert_called_with(os.path.join(os.path.expanduser("~"), ".m2", "repository") + ".lock")
+
     def mock_os_walk(self, artifact_path: str) -> List[Any]:
         if artifact_path.endswith(os.path.join("dir", "builds", "core-plugins")):
             return [["core-plugins", [], ["plugin1.zip"]]]
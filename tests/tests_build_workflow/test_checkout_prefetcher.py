@@ -0,0 +1,66 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import threading
+import unittest
+from typing import Any, List
+from unittest.mock import MagicMock
+
+from build_workflow.checkout_prefetcher import CheckoutPrefetcher
+
+
+class TestCheckoutPrefetcher(unittest.TestCase):
+    def __builders(self, count: int) -> List[Any]:
+        builders = []
+        for index in range(count):
+            builder = MagicMock()
+            builder.component.name = f"component-{index}"
+            builders.append(builder)
+        return builders
+
+    def test_checkout_without_prefetch(self) -> None:
+        builders = self.__builders(3)
+        with CheckoutPrefetcher(builders, "dir") as prefetcher:
+            prefetcher.checkout(builders[0])
+        builders[0].checkout.assert_called_once_with("dir")
+        builders[1].checkout.assert_not_called()
+        builders[2].checkout.assert_not_called()
+
+    def test_checkout_prefetches_upcoming(self) -> None:
+        builders = self.__builders(4)
+        with CheckoutPrefetcher(builders, "dir", 2) as prefetcher:
+            prefetcher.checkout(builders[0])
+        builders[0].checkout.assert_called_once_with("dir")
+        builders[1].checkout.assert_called_once_with("dir")
+        builders[2].checkout.assert_called_once_with("dir")
+        builders[3].checkout.assert_not_called()
+
+    def test_checkout_once(self) -> None:
+        builders = self.__builders(3)
+        with CheckoutPrefetcher(builders, "dir", 2) as prefetcher:
+            for builder in builders:
+                prefetcher.checkout(builder)
+        for builder in builders:
+            builder.checkout.assert_called_once_with("dir")
+
+    def test_checkout_overlaps_with_build(self) -> None:
+        builders = self.__builders(2)
+        prefetched = threading.Event()
+        builders[1].checkout.side_effect = lambda work_dir: prefetched.set()
+
+        with CheckoutPrefetcher(builders, "dir", 1) as prefetcher:
+            prefetcher.checkout(builders[0])
+            self.assertTrue(prefetched.wait(10))
+
+    def test_checkout_error(self) -> None:
+        builders = self.__builders(2)
+        builders[1].checkout.side_effect = ValueError("checkout failed")
+
+        with CheckoutPrefetcher(builders, "dir", 1) as prefetcher:
+            prefetcher.checkout(builders[0])
+            with self.assertRaises(ValueError):
+                prefetcher.checkout(builders[1])
@@ -0,0 +1,82 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import unittest
+from typing import Dict, List
+
+from build_workflow.build_plan import BuildPlan
+from build_workflow.component_graph import ComponentGraph
+from manifests.input_manifest import InputComponent, InputManifest
+
+
+class TestComponentGraph(unittest.TestCase):
+    INPUT_MANIFEST = InputManifest.from_path(os.path.join(os.path.dirname(__file__), "data", "opensearch-input-2.12.0.yml"))
+
+    def __component(self, name: str, depends_on: List[str] = None) -> InputComponent:
+        return InputComponent._from({"name": name, "repository": f"https://github.com/opensearch-project/{name}.git", "ref": "main", "depends_on": depends_on})
+
+    def __graph(self) -> ComponentGraph:
+        return ComponentGraph([
+            self.__component("OpenSearch"),
+            self.__component("notifications", ["alerting"]),
+            self.__component("common-utils"),
+            self.__component("job-scheduler"),
+            self.__component("alerting", ["common-utils", "unknown"]),
+            self.__component("index-management", ["common-utils", "job-scheduler"]),
+        ], "OpenSearch")
+
+    def test_adjacency(self) -> None:
+        graph = self.__graph()
+        self.assertEqual(graph.dependencies["OpenSearch"], [])
+        self.assertEqual(graph.dependencies["alerting"], ["OpenSearch", "common-utils"])
+        self.assertEqual(graph.dependents["common-utils"], ["alerting", "index-management"])
+        self.assertEqual(graph.dependents["OpenSearch"], ["notifications", "common-utils", "job-scheduler", "alerting", "index-management"])
+
+    def test_transitive_closure(self) -> None:
+        graph = self.__graph()
+        self.assertEqual(graph.transitive_dependencies["notifications"], ["OpenSearch", "common-utils", "alerting"])
+        self.assertEqual(graph.transitive_dependents["common-utils"], ["notifications", "alerting", "index-management"])
+        self.assertEqual(graph.dependents_of(["job-scheduler", "alerting"]), ["notifications", "job-scheduler", "alerting", "index-management"])
+
+    def test_topological_order(self) -> None:
+        self.assertEqual(
+            self.__graph().topological_order(),
+            ["OpenSearch", "common-utils", "job-scheduler", "alerting", "notifications", "index-management"]
+        )
+
+    def test_circular_dependency(self) -> None:
+        graph = ComponentGraph([self.__component("a", ["b"]), self.__component("b", ["a"]), self.__component("c", ["b"]), self.__component("d")])
+        with self.assertRaises(ComponentGraph.CircularDependencyError) as ctx:
+            graph.topological_order()
+        self.assertEqual(ctx.exception.components, ["a", "b", "c"])
+        self.assertEqual(str(ctx.exception), "Circular dependency between components: a, b, c")
+
+    def test_critical_path(self) -> None:
+        durations: Dict[str, float] = {"OpenSearch": 600, "common-utils": 60, "job-scheduler": 120, "alerting": 300, "index-management": 200, "notifications": 100}
+        self.assertEqual(self.__graph().critical_path(durations), (["OpenSearch", "common-utils", "alerting", "notifications"], 1060))
+        self.assertEqual(self.__graph().critical_path({}), (["OpenSearch"], 0))
+
+    def test_subgraph(self) -> None:
+        graph = self.__graph().subgraph(["alerting", "notifications"])
+        self.assertEqual(graph.names, ["notifications", "alerting"])
+        self.assertEqual(graph.dependencies["alerting"], [])
+        self.assertEqual(graph.topological_order(), ["alerting", "notifications"])
+
+    def test_from_manifest(self) -> None:
+        graph = ComponentGraph.from_manifest(self.INPUT_MANIFEST)
+        self.assertEqual(graph.core, "OpenSearch")
+        self.assertEqual(graph.topological_order()[0], "OpenSearch")
+        self.assertEqual(graph.transitive_dependencies["sql"], ["OpenSearch", "common-utils", "ml-commons"])
+
+    def test_plan(self) -> None:
+        plan = BuildPlan(self.__graph().subgraph(["alerting", "notifications"]), {"alerting": "commit changed"})
+        self.assertEqual(plan.lines, [
+            "Building 2 component(s):",
+            "  alerting: commit changed, depends on nothing",
+            "  notifications: selected, depends on alerting",
+        ])
@@ -0,0 +1,90 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from build_workflow.gradle_daemons import GradleDaemons
+
+
+class TestGradleDaemons(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.gradle_user_home = os.path.join(self.temp_dir.name, "gradle")
+        self.gradle_daemons = GradleDaemons(self.gradle_user_home)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def __daemon_log(self, pid: int) -> None:
+        daemon_dir = os.path.join(self.gradle_user_home, "daemon", "8.5")
+        os.makedirs(daemon_dir, exist_ok=True)
+        open(os.path.join(daemon_dir, f"daemon-{pid}.out.log"), "w").close()
+
+    def __daemon(self) -> subprocess.Popen:
+        return subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)", "GradleDaemon"])
+
+    @patch.dict(os.environ, {"GRADLE_USER_HOME": "/home/user/.gradle"})
+    def test_env(self) -> None:
+        with self.gradle_daemons:
+            self.assertEqual(os.environ["GRADLE_USER_HOME"], self.gradle_user_home)
+            self.assertEqual(os.environ["OPENSEARCH_BUILD_GRADLE_DAEMON"], "--daemon")
+        self.assertEqual(os.environ["GRADLE_USER_HOME"], "/home/user/.gradle")
+        self.assertNotIn("OPENSEARCH_BUILD_GRADLE_DAEMON", os.environ)
+
+    def test_properties(self) -> None:
+        os.makedirs(self.gradle_user_home)
+        with open(os.path.join(self.gradle_user_home, "gradle.properties"), "w") as f:
+            f.write("systemProp.http.proxyHost=proxy\norg.gradle.daemon=false\n")
+        with self.gradle_daemons:
+            pass
+        with open(os.path.join(self.gradle_user_home, "gradle.properties")) as f:
+            self.assertEqual(f.read().splitlines(), ["systemProp.http.proxyHost=proxy", "org.gradle.daemon=true", "org.gradle.daemon.idletimeout=900000"])
+
+    def test_pids(self) -> None:
+        self.assertEqual(self.gradle_daemons.pids(), set())
+        self.__daemon_log(1234)
+        self.__daemon_log(5678)
+        self.assertEqual(self.gradle_daemons.pids(), {1234, 5678})
+
+    def test_stops_daemons_started_by_the_build(self) -> None:
+        before, during, other = self.__daemon(), self.__daemon(), subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        try:
+            self.__daemon_log(before.pid)
+            with self.gradle_daemons:
+                self.__daemon_log(during.pid)
+                self.__daemon_log(other.pid)
+            self.assertIsNotNone(during.poll())
+            self.assertIsNone(before.poll())
+            self.assertIsNone(other.poll())
+        finally:
+            for process in [before, during, other]:
+                process.kill()
+                process.wait()
+
+    def test_usage(self) -> None:
+        log_path = os.path.join(self.temp_dir.name, "alerting.log.gz")
+        with gzip.open(log_path, "wt") as f:
+            f.write("Starting a Gradle Daemon (subsequent builds will be faster)\n> Task :assemble\nBUILD SUCCESSFUL in 40s\n")
+            f.write("> Task :publishToMavenLocal\nBUILD SUCCESSFUL in 3s\n")
+            f.write("> Task :publishPluginZipPublicationToZipStagingRepository\nBUILD SUCCESSFUL in 2s\n")
+        self.assertEqual(self.gradle_daemons.usage(log_path), {"builds": 3, "daemons_started": 1, "daemons_reused": 2})
+        self.assertEqual(self.gradle_daemons.totals, {"builds": 3, "daemons_started": 1, "daemons_reused": 2})
+
+    def test_usage_single_use_daemon(self) -> None:
+        log_path = os.path.join(self.temp_dir.name, "OpenSearch.log.gz")
+        with gzip.open(log_path, "wt") as f:
+            f.write("To honour the JVM settings for this build a single-use Daemon process will be forked.\nBUILD FAILED in 1m\n")
+        self.assertEqual(self.gradle_daemons.usage(log_path), {"builds": 1, "daemons_started": 1, "daemons_reused": 0})
+
+    def test_usage_no_log(self) -> None:
+        self.assertIsNone(self.gradle_daemons.usage(os.path.join(self.temp_dir.name, "missing.log.gz")))
@@ -0,0 +1,90 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+from build_workflow.yarn_cache import YarnCache
+
+
+class TestYarnCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.yarn_cache = YarnCache(self.temp_dir.name)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def __package(self, name: str, size: int = 1, age: int = 0) -> str:
+        entry = os.path.join(self.temp_dir.name, "yarn", "v6", f"npm-{name.replace('/', '-')}-1.0.0-abcdef-integrity")
+        package_dir = os.path.join(entry, "node_modules", name)
+        os.makedirs(package_dir)
+        with open(os.path.join(package_dir, ".yarn-metadata.json"), "w") as f:
+            f.write("{}")
+        with open(os.path.join(package_dir, "index.js"), "wb") as f:
+            f.write(b"x" * size)
+        mtime = time.time() - age
+        os.utime(entry, (mtime, mtime))
+        return os.path.join(package_dir, ".yarn-metadata.json")
+
+    @patch.dict(os.environ, {"npm_config_cache": "/home/user/.npm"})
+    def test_env(self) -> None:
+        with self.yarn_cache:
+            self.assertEqual(os.environ["YARN_CACHE_FOLDER"], os.path.join(os.path.realpath(self.temp_dir.name), "yarn"))
+            self.assertEqual(os.environ["npm_config_cache"], os.path.join(os.path.realpath(self.temp_dir.name), "npm"))
+            self.assertTrue(os.path.isdir(os.environ["YARN_CACHE_FOLDER"]))
+        self.assertEqual(os.environ["npm_config_cache"], "/home/user/.npm")
+        self.assertNotIn("YARN_CACHE_FOLDER", os.environ)
+
+    def test_entries(self) -> None:
+        self.__package("lodash")
+        self.__package("@babel/core")
+        os.makedirs(os.path.join(self.temp_dir.name, "yarn", "v6", ".tmp"))
+        os.makedirs(os.path.join(self.temp_dir.name, "yarn", "v6", "npm-react-1.0.0-abcdef-integrity"))
+        self.assertEqual(
+            sorted(os.path.basename(entry) for entry in self.yarn_cache.entries()),
+            ["npm-@babel-core-1.0.0-abcdef-integrity", "npm-lodash-1.0.0-abcdef-integrity"],
+        )
+
+    def test_track(self) -> None:
+        lodash = self.__package("lodash")
+        self.__package("react")
+        with self.yarn_cache.track() as stats:
+            # yarn reads the metadata of a cached package it uses
+            self.assertEqual(os.stat(lodash).st_atime, 0)
+            os.utime(lodash, (time.time(), os.path.getmtime(lodash)))
+            self.__package("@babel/core")
+        self.assertEqual(stats, {"hits": 1, "misses": 1})
+
+        with self.yarn_cache.track() as stats:
+            pass
+        self.assertEqual(stats, {"hits": 0, "misses": 0})
+
+    def test_evict(self) -> None:
+        self.__package("lodash", size=100, age=30)
+        self.__package("react", size=100, age=10)
+        self.__package("@babel/core", size=100, age=20)
+        YarnCache(self.temp_dir.name, 250).evict()
+        self.assertEqual(
+            sorted(os.path.basename(entry) for entry in self.yarn_cache.entries()),
+            ["npm-@babel-core-1.0.0-abcdef-integrity", "npm-react-1.0.0-abcdef-integrity"],
+        )
+
+    def test_exit_evicts(self) -> None:
+        self.__package("lodash", size=100)
+        with YarnCache(self.temp_dir.name, 10):
+            pass
+        self.assertEqual(self.yarn_cache.entries(), {})
+
+    def test_run_scoped_does_not_evict(self) -> None:
+        self.__package("lodash", size=100)
+        with self.yarn_cache:
+            pass
+        self.assertEqual(len(self.yarn_cache.entries()), 1)
@@ -0,0 +1,79 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import subprocess
+import unittest
+from unittest.mock import patch
+
+from git.git_cache import GitCache
+from git.git_repository import GitRepository
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestGitCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.origin = os.path.join(self.temp_dir.name, "origin")
+        self.cache_root = os.path.join(self.temp_dir.name, "cache")
+        os.makedirs(self.origin)
+        self.__git("init -b main")
+        self.sha = self.__commit("README.md", "first")
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def __git(self, command: str) -> str:
+        return subprocess.check_output(
+            f"git -c user.name=test -c user.email=test@opensearch.org {command}",
+            cwd=self.origin,
+            shell=True,
+        ).decode().strip()
+
+    def __commit(self, file_name: str, content: str) -> str:
+        with open(os.path.join(self.origin, file_name), "w") as f:
+            f.write(content)
+        self.__git(f"add {file_name}")
+        self.__git(f'commit -m "{content}"')
+        return self.__git("rev-parse HEAD")
+
+    def test_from_env(self) -> None:
+        with patch.dict(os.environ, {GitCache.ENV: self.cache_root}):
+            self.assertEqual(GitCache.from_env().root, os.path.realpath(self.cache_root))
+
+    def test_from_env_disabled(self) -> None:
+        with patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(GitCache.from_env())
+
+    def test_mirror_path(self) -> None:
+        cache = GitCache(self.cache_root)
+        path = cache.mirror_path("https://github.com/opensearch-project/OpenSearch.git")
+        self.assertEqual(os.path.dirname(path), os.path.realpath(self.cache_root))
+        self.assertTrue(os.path.basename(path).startswith("OpenSearch-"))
+        self.assertEqual(path, cache.mirror_path("https://github.com/opensearch-project/OpenSearch"))
+        self.assertNotEqual(path, cache.mirror_path("https://github.com/opensearch-project/OpenSearch-Dashboards.git"))
+
+    def test_fetch(self) -> None:
+        cache = GitCache(self.cache_root)
+        self.assertEqual(cache.fetch(self.origin, "main"), self.sha)
+        self.assertTrue(os.path.isdir(cache.objects_path(self.origin)))
+
+        sha = self.__commit("README.md", "second")
+        self.assertEqual(cache.fetch(self.origin, "main"), sha)
+        self.assertEqual(cache.fetch(self.origin, self.sha), self.sha)
+
+    def test_fetch_annotated_tag(self) -> None:
+        self.__git('tag -a 1.0.0 -m "1.0.0"')
+        self.assertEqual(GitCache(self.cache_root).fetch(self.origin, "tags/1.0.0"), self.sha)
+
+    def test_checkout_with_cache(self) -> None:
+        with patch.dict(os.environ, {GitCache.ENV: self.cache_root}):
+            with GitRepository(self.origin, "main") as repo:
+                self.assertEqual(repo.sha, self.sha)
+                self.assertTrue(os.path.isfile(os.path.join(repo.dir, "README.md")))
+                with open(os.path.join(repo.dir, ".git", "objects", "info", "alternates")) as f:
+                    self.assertEqual(f.read().strip(), GitCache(self.cache_root).objects_path(self.origin))
@@ -5,6 +5,7 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import gzip
 import os
 import subprocess
 import unittest
@@ -36,6 +37,12 @@ class TestGitRepository(unittest.TestCase):
         self.repo.execute("echo $PWD > created.txt")
         self.assertTrue(os.path.isfile(os.path.join(self.repo.dir, "created.txt")))
 
+    def test_execute_log(self) -> None:
+        log_path = os.path.join(self.repo.dir, "logs", "build.log.gz")
+        self.repo.execute("echo $PWD", log=log_path)
+        with gzip.open(log_path, "rt") as f:
+            self.assertEqual(f.read().strip(), self.repo.dir)
+
     @patch('subprocess.check_call', return_value=0)
     def test_execute_in_subdir(self, mock_check_call: Mock) -> None:
         subdir = os.path.join(self.repo.dir, "ISSUE_TEMPLATE")
@@ -124,3 +131,30 @@ class TestGitRepositoryClassMethods(unittest.TestCase):
         ref, name = GitRepository.stable_ref("https://github.com/opensearch-project/OpenSearch", "sha")
         self.assertEqual(ref, "sha")
         self.assertEqual(name, "sha")
+
+    @patch("subprocess.check_output", return_value="sha3\trefs/heads/feature/1.0\nsha1\trefs/heads/main\nsha2\trefs/tags/1.0\n".encode())
+    def test_stable_refs(self, mock_output: Mock) -> None:
+        refs = GitRepository.stable_refs("https://github.com/opensearch-project/OpenSearch", ["main", "1.0", "refs/heads/feature/1.0", "sha"])
+        mock_output.assert_called_once_with("git ls-remote https://github.com/opensearch-project/OpenSearch main 1.0 refs/heads/feature/1.0 sha", shell=True)
+        self.assertEqual(refs, {
+            "main": ["sha1", "refs/heads/main"],
+            "1.0": ["sha3", "refs/heads/feature/1.0"],
+            "refs/heads/feature/1.0": ["sha3", "refs/heads/feature/1.0"],
+            "sha": ["sha", "sha"],
+        })
+
+    def test_changed_paths(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            def commit(path: str) -> str:
+                os.makedirs(os.path.dirname(os.path.join(work_dir.name, path)), exist_ok=True)
+                with open(os.path.join(work_dir.name, path), "a") as f:
+                    f.write(path)
+                subprocess.check_call(f"git add . && git -c user.name=test -c user.email=test@example.com commit -q -m {path}", cwd=work_dir.name, shell=True)
+                return subprocess.check_output("git rev-parse HEAD", cwd=work_dir.name, shell=True).decode().strip()
+
+            subprocess.check_call("git init -q", cwd=work_dir.name, shell=True)
+            first = commit("README.md")
+            commit("release-notes/release-notes-1.0.md")
+            last = commit("src/main/Plugin.java")
+            paths = GitRepository.changed_paths(f"file://{work_dir.name}", first, last)
+            self.assertEqual(paths, ["release-notes/release-notes-1.0.md", "src/main/Plugin.java"])
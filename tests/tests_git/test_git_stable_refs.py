@@ -0,0 +1,67 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import json
+import os
+import time
+import unittest
+from typing import Dict, List
+from unittest.mock import MagicMock, patch
+
+from git.git_stable_refs import GitStableRefs
+from system.temporary_directory import TemporaryDirectory
+
+
+def stable_refs(url: str, refs: List[str]) -> Dict[str, List[str]]:
+    return {ref: [f"{url}-{ref}-sha", f"refs/heads/{ref}"] for ref in refs}
+
+
+@patch("git.git_repository.GitRepository.stable_refs", side_effect=stable_refs)
+@patch("git.git_repository.GitRepository.stable_ref", side_effect=lambda url, ref: stable_refs(url, [ref])[ref])
+class TestGitStableRefs(unittest.TestCase):
+    COMMIT_ID = "3913d7097934cbfe1fdcf919347f22a597d00b76"
+
+    def setUp(self) -> None:
+        GitStableRefs.clear()
+        self.temp_dir = TemporaryDirectory()
+        self.cache_path = os.path.join(self.temp_dir.name, "refs.json")
+
+    def tearDown(self) -> None:
+        GitStableRefs.clear()
+        self.temp_dir.__exit__(None, None, None)
+
+    def test_resolve_one_ls_remote_per_repository(self, mock_stable_ref: MagicMock, mock_stable_refs: MagicMock) -> None:
+        results = GitStableRefs.resolve([("a", "main"), ("a", "2.x"), ("b", "main"), ("a", "main")])
+        self.assertEqual(results[("a", "2.x")], ["a-2.x-sha", "refs/heads/2.x"])
+        self.assertEqual(results[("b", "main")], ["b-main-sha", "refs/heads/main"])
+        mock_stable_refs.assert_called_once_with("a", ["main", "2.x"])
+        mock_stable_ref.assert_called_once_with("b", "main")
+
+    def test_resolve_memoized(self, mock_stable_ref: MagicMock, mock_stable_refs: MagicMock) -> None:
+        GitStableRefs.resolve([("a", "main")])
+        self.assertEqual(GitStableRefs.stable_ref("a", "main"), ["a-main-sha", "refs/heads/main"])
+        mock_stable_ref.assert_called_once()
+
+    def test_resolve_commit_id(self, mock_stable_ref: MagicMock, mock_stable_refs: MagicMock) -> None:
+        self.assertEqual(GitStableRefs.stable_ref("a", self.COMMIT_ID), [self.COMMIT_ID, self.COMMIT_ID])
+        mock_stable_ref.assert_not_called()
+
+    def test_resolve_disk_cache(self, mock_stable_ref: MagicMock, mock_stable_refs: MagicMock) -> None:
+        with patch.dict(os.environ, {GitStableRefs.ENV: self.cache_path}):
+            GitStableRefs.resolve([("a", "main")])
+            GitStableRefs.clear()
+            self.assertEqual(GitStableRefs.stable_ref("a", "main"), ["a-main-sha", "refs/heads/main"])
+        mock_stable_ref.assert_called_once()
+        with open(self.cache_path) as f:
+            self.assertEqual(list(json.load(f).keys()), ["a\tmain"])
+
+    def test_resolve_disk_cache_expired(self, mock_stable_ref: MagicMock, mock_stable_refs: MagicMock) -> None:
+        with open(self.cache_path, "w") as f:
+            json.dump({"a\tmain": {"result": ["old-sha", "refs/heads/main"], "time": time.time() - 600}}, f)
+        with patch.dict(os.environ, {GitStableRefs.ENV: self.cache_path, GitStableRefs.ENV_TTL: "60"}):
+            self.assertEqual(GitStableRefs.stable_ref("a", "main"), ["a-main-sha", "refs/heads/main"])
+        mock_stable_ref.assert_called_once()
@@ -11,6 +11,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import yaml
 
+from manifests.build.build_manifest_1_2 import BuildManifest_1_2
 from manifests.build_manifest import BuildComponent, BuildManifest
 
 
@@ -93,6 +94,31 @@ class TestBuildManifest(unittest.TestCase):
             self.assertEqual(version, manifest.version)
             self.assertIsNotNone(any(manifest.components))
 
+    def test_digests(self) -> None:
+        path = os.path.join(self.data_path, "build", "opensearch-build-schema-version-1.3.yml")
+        manifest = BuildManifest.from_path(path)
+        digests = manifest.components["job-scheduler"].digests["plugins/opensearch-job-scheduler-2.12.0.0.zip"]
+        self.assertEqual(digests["sha256"], "1c8e2a8f2f3b6d6e8e0f4a1b2c3d4e5f60718293a4b5c6d7e8f9a0b1c2d3e4f5")
+        self.assertEqual(len(digests["sha512"]), 128)
+        with open(path) as f:
+            self.assertEqual(yaml.safe_load(f), manifest.to_dict())
+
+    def test_digests_invalid(self) -> None:
+        data = BuildManifest.from_path(os.path.join(self.data_path, "build", "opensearch-build-schema-version-1.3.yml")).to_dict()
+        data["components"][0]["digests"]["dist/opensearch-min-2.12.0-linux-x64.tar.gz"] = "sha256"
+        with self.assertRaises(ValueError):
+            BuildManifest(data)
+
+    def test_log_added_in_1_3(self) -> None:
+        with open(os.path.join(self.data_path, "build", "opensearch-build-schema-version-1.2.yml")) as f:
+            data = yaml.safe_load(f)
+        BuildManifest_1_2(data)
+        data["components"][0]["log"] = "logs/OpenSearch.log.gz"
+        with self.assertRaises(ValueError):
+            BuildManifest_1_2(data)
+        data["schema-version"] = "1.3"
+        self.assertEqual(BuildManifest(data).components["OpenSearch"].log, "logs/OpenSearch.log.gz")
+
     def test_select(self) -> None:
         path = os.path.join(self.data_path, "build", "opensearch-build-schema-version-1.2.yml")
         manifest = BuildManifest.from_path(path)
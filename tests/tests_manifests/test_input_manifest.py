@@ -12,6 +12,7 @@ from unittest.mock import Mock, patch
 
 import yaml
 
+from git.git_stable_refs import GitStableRefs
 from manifests.input.input_manifest_1_0 import Check_1_0, InputComponentFromDist_1_0, InputComponentFromSource_1_0
 from manifests.input.input_manifest_1_1 import Check_1_1, InputComponentFromSource_1_1, InputManifest_1_1
 from manifests.input_manifest import InputComponent, InputComponentFromDist, InputComponentFromSource, InputManifest
@@ -22,6 +23,7 @@ class TestInputManifest(unittest.TestCase):
     def setUp(self) -> None:
         self.maxDiff = None
         self.manifests_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "..", "..", "manifests"))
+        GitStableRefs.clear()
 
     def test_1_1_1_dist(self) -> None:
         data_path = os.path.realpath(os.path.join(os.path.dirname(__file__), "data"))
@@ -308,6 +310,25 @@ class TestInputManifest(unittest.TestCase):
 
         self.assertEqual(formatted_manifest, written_manifest)
 
+    def test_1_2_resources(self) -> None:
+        manifest = InputManifest({
+            "schema-version": "1.2",
+            "build": {"name": "OpenSearch", "version": "3.1.0"},
+            "ci": {"image": {"linux": {"tar": {"name": "opensearchstaging/ci-runner:ci-runner-al2-opensearch-build-v1"}}}},
+            "components": [
+                {"name": "OpenSearch", "ref": "main", "repository": "https://github.com/opensearch-project/OpenSearch.git", "resources": {"cpus": 4, "memory": 8},
+                 "ignore_paths": ["release-notes/*"]},
+                {"name": "common-utils", "ref": "main", "repository": "https://github.com/opensearch-project/common-utils.git"},
+            ]
+        })
+        opensearch_component: InputComponentFromSource = manifest.components["OpenSearch"]  # type: ignore[assignment]
+        common_utils_component: InputComponentFromSource = manifest.components["common-utils"]  # type: ignore[assignment]
+        self.assertEqual(opensearch_component.resources, {"cpus": 4, "memory": 8})
+        self.assertIsNone(common_utils_component.resources)
+        self.assertEqual(opensearch_component.ignore_paths, ["release-notes/*"])
+        self.assertEqual(manifest.to_dict()["components"][0]["resources"], {"cpus": 4, "memory": 8})
+        self.assertNotIn("resources", manifest.to_dict()["components"][1])
+
     def test_to_file_formatted_schema_version_1_1(self) -> None:
         data_path = os.path.join(os.path.dirname(__file__), "data")
         manifest = InputManifest_1_1({
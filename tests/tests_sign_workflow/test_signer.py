@@ -6,7 +6,6 @@
 # compatible open source license.
 
 
-import os
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, patch
@@ -45,16 +44,16 @@ class TestSigner(unittest.TestCase):
         signer.sign_artifact("the-jar.zip", Path("/path"), ".sig")
         signer.generate_signature_and_verify.assert_called_with("the-jar.zip", Path("/path"), ".sig")
 
+    @patch("os.remove")
     @patch("sign_workflow.signer.GitRepository")
-    def test_remove_existing_signature_found(self, mock_repo: Mock) -> None:
+    def test_remove_existing_signature_found(self, mock_repo: Mock, mock_os_remove: Mock) -> None:
         signer = self.DummySigner(False)
-        os.remove = MagicMock()
         signer.__remove_existing_signature__("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
-        os.remove.assert_called_with("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
+        mock_os_remove.assert_called_with("tests/tests_sign_workflow/data/signature/tar_dummy_artifact_1.0.0.tar.gz.sig")
 
+    @patch("os.remove")
     @patch("sign_workflow.signer.GitRepository")
-    def test_remove_existing_signature_not_found(self, mock_repo: Mock) -> None:
+    def test_remove_existing_signature_not_found(self, mock_repo: Mock, mock_os_remove: Mock) -> None:
         signer = self.DummySigner(False)
-        os.remove = MagicMock()
         signer.__remove_existing_signature__("tests/tests_sign_workflow/data/signature/not_found.tar.gz.sig")
-        os.remove.assert_not_called()
+        mock_os_remove.assert_not_called()
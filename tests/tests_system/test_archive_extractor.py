@@ -0,0 +1,183 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import io
+import os
+import shutil
+import stat
+import subprocess
+import tarfile
+import unittest
+import zipfile
+from unittest.mock import MagicMock, patch
+
+from system.archive_extractor import ArchiveExtractor
+from system.os import current_platform
+from system.rpm_file import RpmFile
+from system.temporary_directory import TemporaryDirectory
+from system.zip_file import ZipFile
+
+
+class TestArchiveExtractor(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.dist_dir = os.path.join(self.tmp.name, "opensearch-1.3.0")
+        os.makedirs(os.path.join(self.dist_dir, "bin"))
+        os.makedirs(os.path.join(self.dist_dir, "config"))
+        with open(os.path.join(self.dist_dir, "bin", "opensearch"), "w") as f:
+            f.write("#!/bin/sh")
+        os.chmod(os.path.join(self.dist_dir, "bin", "opensearch"), 0o755)
+        with open(os.path.join(self.dist_dir, "config", "opensearch.yml"), "w") as f:
+            f.write("cluster.name: opensearch\n" * 1000)
+        os.chmod(os.path.join(self.dist_dir, "config", "opensearch.yml"), 0o640)
+        os.symlink("bin/opensearch", os.path.join(self.dist_dir, "opensearch"))
+        self.dest = os.path.join(self.tmp.name, "dest")
+
+    def tearDown(self) -> None:
+        self.tmp.__exit__(None, None, None)
+
+    def __assert_extracted(self) -> None:
+        dist_dir = os.path.join(self.dest, "opensearch-1.3.0")
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(dist_dir, "bin", "opensearch")).st_mode), 0o755)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(dist_dir, "config", "opensearch.yml")).st_mode), 0o640)
+        with open(os.path.join(dist_dir, "config", "opensearch.yml")) as f:
+            self.assertEqual(f.read(), "cluster.name: opensearch\n" * 1000)
+        self.assertTrue(os.path.islink(os.path.join(dist_dir, "opensearch")))
+        self.assertEqual(os.readlink(os.path.join(dist_dir, "opensearch")), "bin/opensearch")
+
+    def __tar(self) -> str:
+        path = os.path.join(self.tmp.name, "opensearch-1.3.0.tar.gz")
+        with tarfile.open(path, "w:gz") as tar:
+            tar.add(self.dist_dir, arcname="opensearch-1.3.0")
+        return path
+
+    def __zip(self) -> str:
+        path = os.path.join(self.tmp.name, "opensearch-1.3.0.zip")
+        with ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zip:
+            zip.write(self.dist_dir, "opensearch-1.3.0")
+            zip.write(os.path.join(self.dist_dir, "bin"), "opensearch-1.3.0/bin")
+            zip.write(os.path.join(self.dist_dir, "bin", "opensearch"), "opensearch-1.3.0/bin/opensearch")
+            zip.write(os.path.join(self.dist_dir, "config", "opensearch.yml"), "opensearch-1.3.0/config/opensearch.yml")
+            link = zipfile.ZipInfo("opensearch-1.3.0/opensearch")
+            link.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zip.writestr(link, "bin/opensearch")
+        return path
+
+    def test_extract_tar(self) -> None:
+        ArchiveExtractor(native=False).extract_tar(self.__tar(), self.dest)
+        self.__assert_extracted()
+
+    @unittest.skipUnless(shutil.which("tar") and shutil.which("pigz") and current_platform() != "windows", "requires tar and pigz")
+    def test_extract_tar_native(self) -> None:
+        ArchiveExtractor().extract_tar(self.__tar(), self.dest)
+        self.__assert_extracted()
+
+    @patch("system.archive_extractor.execute")
+    @patch("shutil.which", side_effect=lambda command: f"/usr/bin/{command}")
+    @patch("system.archive_extractor.current_platform", return_value="linux")
+    def test_extract_tar_pigz(self, *mocks: MagicMock) -> None:
+        mock_execute = mocks[2]
+        ArchiveExtractor().extract_tar("opensearch-1.3.0.tar.gz", self.dest)
+        mock_execute.assert_called_once_with(
+            f"/usr/bin/tar -x -p --use-compress-program=/usr/bin/pigz -f {os.path.abspath('opensearch-1.3.0.tar.gz')}",
+            self.dest
+        )
+
+    @patch("system.archive_extractor.execute")
+    @patch("shutil.which", side_effect=lambda command: None if command == "pigz" else f"/usr/bin/{command}")
+    def test_extract_tar_without_pigz(self, *mocks: MagicMock) -> None:
+        ArchiveExtractor().extract_tar(self.__tar(), self.dest)
+        mocks[1].assert_not_called()
+        self.__assert_extracted()
+
+    @patch("system.archive_extractor.execute")
+    @patch("shutil.which", side_effect=lambda command: f"/usr/bin/{command}")
+    @patch("system.archive_extractor.current_platform", return_value="windows")
+    def test_extract_tar_windows(self, *mocks: MagicMock) -> None:
+        ArchiveExtractor().extract_tar(self.__tar(), self.dest)
+        mocks[2].assert_not_called()
+        self.__assert_extracted()
+
+    @patch("tarfile.data_filter", None, create=True)
+    def test_extract_tar_without_data_filter(self) -> None:
+        ArchiveExtractor(native=False).extract_tar(self.__tar(), self.dest)
+        self.__assert_extracted()
+
+    def test_extract_tar_unsafe_members(self) -> None:
+        outside = os.path.join(self.tmp.name, "outside")
+        os.makedirs(outside)
+        unsafe = {
+            "parent": [("../evil", tarfile.REGTYPE, "")],
+            "absolute": [(os.path.join(outside, "evil"), tarfile.REGTYPE, "")],
+            "symlink": [("lib", tarfile.SYMTYPE, outside), ("lib/evil", tarfile.REGTYPE, "")],
+            "hardlink": [("evil", tarfile.LNKTYPE, "../outside/evil")],
+        }
+        for data_filter in [getattr(tarfile, "data_filter", None), None]:
+            for name, members in unsafe.items():
+                with self.subTest(name=name, data_filter=data_filter), patch("tarfile.data_filter", data_filter, create=True):
+                    path = os.path.join(self.tmp.name, f"{name}.tar")
+                    with tarfile.open(path, "w") as tar:
+                        for member_name, type, linkname in members:
+                            member = tarfile.TarInfo(member_name)
+                            member.type = type
+                            member.linkname = linkname
+                            tar.addfile(member, io.BytesIO(b""))
+                    try:
+                        ArchiveExtractor(native=False).extract_tar(path, os.path.join(self.tmp.name, name))
+                    except tarfile.TarError:
+                        pass
+                    else:
+                        # the data filter extracts absolute names relative to the destination instead
+                        self.assertEqual((name, data_filter), ("absolute", tarfile.data_filter))  # type: ignore[attr-defined]
+                    self.assertEqual(os.listdir(outside), [])
+
+    def test_extract_zip(self) -> None:
+        ArchiveExtractor(workers=4).extract_zip(self.__zip(), self.dest)
+        self.__assert_extracted()
+
+    def test_extract_zip_one_worker(self) -> None:
+        ArchiveExtractor(workers=1).extract_zip(self.__zip(), self.dest)
+        self.__assert_extracted()
+
+    def test_extract_zip_shared_parent_directories(self) -> None:
+        # files only, without entries for their directories, which zipfile creates as each file is extracted
+        path = os.path.join(self.tmp.name, "plugins.zip")
+        names = [f"plugins/plugin-{plugin}/lib/{jar}.jar" for plugin in range(128) for jar in range(8)]
+        with ZipFile(path, "w") as zip:
+            for name in names:
+                zip.writestr(name, name)
+        ArchiveExtractor(workers=16).extract_zip(path, self.dest)
+        for name in names:
+            with open(os.path.join(self.dest, name)) as f:
+                self.assertEqual(f.read(), name)
+
+    @patch("system.archive_extractor.RpmFile")
+    def test_extract_rpm(self, mock_rpm_file: MagicMock) -> None:
+        ArchiveExtractor().extract_rpm("opensearch-1.3.0-linux-x64.rpm", self.dest)
+        mock_rpm_file.assert_called_once_with("opensearch-1.3.0-linux-x64.rpm")
+        mock_rpm_file.return_value.extractall.assert_called_once_with(self.dest)
+
+    @patch("subprocess.Popen")
+    @patch("system.archive_extractor.RpmFile")
+    def test_extract_rpm_unsupported_payload(self, mock_rpm_file: MagicMock, mock_popen: MagicMock) -> None:
+        mock_rpm_file.UnsupportedPayloadError = RpmFile.UnsupportedPayloadError
+        mock_rpm_file.return_value.extractall.side_effect = RpmFile.UnsupportedPayloadError("opensearch.rpm", "has a payload compressed with zstd")
+        mock_popen.return_value.wait.return_value = 0
+        ArchiveExtractor().extract_rpm("opensearch.rpm", self.dest)
+        self.assertEqual(mock_popen.call_args_list[0][0][0], ["rpm2cpio", os.path.abspath("opensearch.rpm")])
+        self.assertEqual(mock_popen.call_args_list[1][0][0], ["cpio", "-imd"])
+        self.assertEqual(mock_popen.call_args_list[1][1]["stdin"], mock_popen.return_value.stdout)
+        mock_popen.return_value.stdout.close.assert_called_once_with()
+
+    @patch("subprocess.Popen")
+    @patch("system.archive_extractor.RpmFile")
+    def test_extract_rpm_unsupported_payload_failed(self, mock_rpm_file: MagicMock, mock_popen: MagicMock) -> None:
+        mock_rpm_file.UnsupportedPayloadError = RpmFile.UnsupportedPayloadError
+        mock_rpm_file.return_value.extractall.side_effect = RpmFile.UnsupportedPayloadError("opensearch.rpm", "has a payload compressed with zstd")
+        mock_popen.return_value.wait.return_value = 2
+        with self.assertRaises(subprocess.CalledProcessError):
+            ArchiveExtractor().extract_rpm("opensearch.rpm", self.dest)
@@ -0,0 +1,40 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from system.checksums import file_digests
+
+
+class TestChecksums(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "artifact.zip")
+        self.content = os.urandom(3 * 1024 * 1024 + 1)
+        with open(self.path, "wb") as f:
+            f.write(self.content)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test_file_digests(self) -> None:
+        self.assertEqual(file_digests(self.path), {
+            "sha256": hashlib.sha256(self.content).hexdigest(),
+            "sha512": hashlib.sha512(self.content).hexdigest(),
+        })
+
+    def test_file_digests_algorithms(self) -> None:
+        self.assertEqual(file_digests(self.path, ["sha1"]), {"sha1": hashlib.sha1(self.content).hexdigest()})
+
+    def test_file_digests_single_pass(self) -> None:
+        with patch("builtins.open", wraps=open) as mock_open:
+            file_digests(self.path)
+        mock_open.assert_called_once_with(self.path, "rb")
@@ -0,0 +1,176 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import http.server
+import os
+import threading
+import unittest
+from typing import Any, List
+
+from system.downloader import Downloader
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestDownloader(unittest.TestCase):
+    CONTENT = b"0123456789" * 1000
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def __send_headers(self, status: int, length: int, extra: dict = {}) -> None:
+            self.send_response(status)
+            self.send_header("Content-Length", str(length))
+            if self.server.etag:  # type: ignore[attr-defined]
+                self.send_header("ETag", self.server.etag)  # type: ignore[attr-defined]
+            for name, value in extra.items():
+                self.send_header(name, value)
+            self.end_headers()
+
+        def do_HEAD(self) -> None:
+            self.server.requests.append(("HEAD", dict(self.headers)))  # type: ignore[attr-defined]
+            self.__send_headers(200, len(TestDownloader.CONTENT))
+
+        def do_GET(self) -> None:
+            server: Any = self.server
+            server.requests.append(("GET", dict(self.headers)))
+            if server.failures:
+                server.failures -= 1
+                self.__send_headers(503, 0)
+                return
+            if self.path == "/missing":
+                self.__send_headers(404, 0)
+                return
+            content = TestDownloader.CONTENT
+            range = self.headers.get("Range", None)
+            if range and self.headers.get("If-Range", None) == server.etag:
+                start = int(range[len("bytes="):-1])
+                if start >= len(content):
+                    self.__send_headers(416, 0, {"Content-Range": f"bytes */{len(content)}"})
+                    return
+                self.__send_headers(206, len(content) - start, {"Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"})
+                self.wfile.write(content[start:])
+                return
+            self.__send_headers(200, len(content))
+            if server.truncate:
+                server.truncate = False
+                self.wfile.write(content[:len(content) // 2])
+                self.close_connection = True
+                return
+            self.wfile.write(content)
+
+    def setUp(self) -> None:
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), TestDownloader.Handler)
+        self.server.etag = '"v1"'  # type: ignore[attr-defined]
+        self.server.failures = 0  # type: ignore[attr-defined]
+        self.server.truncate = False  # type: ignore[attr-defined]
+        self.server.requests = []  # type: ignore[attr-defined]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.temp_dir = TemporaryDirectory()
+        self.dest = os.path.join(self.temp_dir.name, "plugins", "plugin.zip")
+        self.downloader = Downloader(backoff=0)
+
+    def tearDown(self) -> None:
+        self.downloader.__exit__(None, None, None)
+        self.server.shutdown()
+        self.server.server_close()
+        self.temp_dir.__exit__(None, None, None)
+
+    @property
+    def requests(self) -> List[Any]:
+        return self.server.requests  # type: ignore[attr-defined, no-any-return]
+
+    def __assert_downloaded(self, dest: str = None) -> None:
+        with open(dest or self.dest, "rb") as f:
+            self.assertEqual(f.read(), self.CONTENT)
+        self.assertFalse(os.path.exists(f"{dest or self.dest}.part"))
+
+    def test_download(self) -> None:
+        self.assertTrue(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+        self.__assert_downloaded()
+
+    def test_download_skips_identical_etag(self) -> None:
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.assertFalse(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+        self.assertEqual([method for method, headers in self.requests], ["GET", "HEAD"])
+
+        self.server.etag = '"v2"'  # type: ignore[attr-defined]
+        self.assertTrue(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+
+    def test_download_requests_identity_encoding(self) -> None:
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.assertEqual([headers["Accept-Encoding"] for method, headers in self.requests], ["identity", "identity"])
+
+    def test_download_skips_identical_size(self) -> None:
+        self.server.etag = None  # type: ignore[attr-defined]
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.assertFalse(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+
+        with open(self.dest, "wb") as f:
+            f.write(b"other")
+        self.assertTrue(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+        self.__assert_downloaded()
+
+    def test_download_retries(self) -> None:
+        self.server.failures = 2  # type: ignore[attr-defined]
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.__assert_downloaded()
+        self.assertEqual(len(self.requests), 3)
+
+    def test_download_gives_up(self) -> None:
+        self.server.failures = 10  # type: ignore[attr-defined]
+        with self.assertRaises(Downloader.DownloadError):
+            self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.assertEqual(len(self.requests), 4)
+
+    def test_download_does_not_retry_client_errors(self) -> None:
+        with self.assertRaises(Downloader.DownloadError) as ctx:
+            self.downloader.download(f"{self.url}/missing", self.dest)
+        self.assertIn("HTTP 404", str(ctx.exception))
+        self.assertEqual(len(self.requests), 1)
+
+    def test_download_resumes(self) -> None:
+        self.server.truncate = True  # type: ignore[attr-defined]
+        self.downloader.download(f"{self.url}/plugin.zip", self.dest)
+        self.__assert_downloaded()
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual(self.requests[1][1]["Range"], f"bytes={len(self.CONTENT) // 2}-")
+
+    def test_download_restarts_complete_partial(self) -> None:
+        os.makedirs(os.path.dirname(self.dest))
+        with open(f"{self.dest}.part", "wb") as f:
+            f.write(self.CONTENT)
+        with open(f"{self.dest}.part.etag", "w") as f:
+            f.write('"v1"')
+        self.assertTrue(self.downloader.download(f"{self.url}/plugin.zip", self.dest))
+        self.__assert_downloaded()
+        self.assertFalse(os.path.exists(f"{self.dest}.part.etag"))
+        self.assertEqual([headers.get("Range", None) for method, headers in self.requests], [f"bytes={len(self.CONTENT)}-", None])
+
+    def test_download_all(self) -> None:
+        dests = [os.path.join(self.temp_dir.name, f"plugin-{index}.zip") for index in range(8)]
+        self.downloader.download_all([(f"{self.url}/plugin.zip", dest) for dest in dests])
+        for dest in dests:
+            self.__assert_downloaded(dest)
+
+    def test_download_all_raises(self) -> None:
+        dest = os.path.join(self.temp_dir.name, "plugin.zip")
+        with self.assertRaises(Downloader.DownloadError):
+            self.downloader.download_all([(f"{self.url}/missing", self.dest), (f"{self.url}/plugin.zip", dest)])
+        self.__assert_downloaded(dest)
+
+    def test_download_file_url(self) -> None:
+        src = os.path.join(self.temp_dir.name, "src.zip")
+        with open(src, "wb") as f:
+            f.write(self.CONTENT)
+        self.downloader.download(f"file://{src}", self.dest)
+        self.__assert_downloaded()
@@ -5,10 +5,14 @@
 # this file be licensed under the Apache-2.0 license or a
 # compatible open source license.
 
+import gzip
+import os
 import subprocess
 import unittest
+from unittest.mock import Mock, patch
 
-from system.execute import execute
+from system.execute import execute, execute_to_log
+from system.temporary_directory import TemporaryDirectory
 
 
 class TestExecute(unittest.TestCase):
@@ -43,3 +47,20 @@ class TestExecute(unittest.TestCase):
         self.assertEqual(status, 0)
         self.assertEqual(stdout.strip(), "")
         self.assertEqual(stderr.strip(), "error")
+
+    def test_execute_to_log(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            log_path = os.path.join(work_dir.name, "logs", "component.log.gz")
+            execute_to_log("echo output && >&2 echo error", "/", log_path)
+            with gzip.open(log_path, "rt") as f:
+                self.assertEqual(f.read().splitlines(), ["output", "error"])
+
+    @patch("system.execute.logging.error")
+    def test_execute_to_log_failure_tail(self, mock_logging_error: Mock) -> None:
+        with TemporaryDirectory() as work_dir:
+            log_path = os.path.join(work_dir.name, "component.log.gz")
+            with self.assertRaises(subprocess.CalledProcessError):
+                execute_to_log("seq 1 1000 && exit 1", "/", log_path, tail=3)
+            with gzip.open(log_path, "rt") as f:
+                self.assertEqual(len(f.read().splitlines()), 1000)
+        self.assertEqual([call[0][0] for call in mock_logging_error.call_args_list[1:]], ["998", "999", "1000"])
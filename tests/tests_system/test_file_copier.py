@@ -0,0 +1,82 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import errno
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+from system.file_copier import FileCopier
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFileCopier(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = TemporaryDirectory()
+        self.src = os.path.join(self.temp_dir.name, "src.jar")
+        self.dest = os.path.join(self.temp_dir.name, "dest.jar")
+        with open(self.src, "w") as f:
+            f.write("content")
+
+    def tearDown(self) -> None:
+        self.temp_dir.__exit__(None, None, None)
+
+    def __assert_copied(self) -> None:
+        with open(self.dest) as f:
+            self.assertEqual(f.read(), "content")
+
+    def test_hardlink(self) -> None:
+        self.assertEqual(FileCopier().copy(self.src, self.dest), FileCopier.HARDLINK)
+        self.__assert_copied()
+        self.assertTrue(os.path.samefile(self.src, self.dest))
+
+    def test_hardlink_overwrites(self) -> None:
+        with open(self.dest, "w") as f:
+            f.write("previous")
+        FileCopier().copy(self.src, self.dest)
+        self.__assert_copied()
+
+    def test_copy_file_range(self) -> None:
+        if not hasattr(os, "copy_file_range"):
+            self.skipTest("copy_file_range is not available")
+        self.assertEqual(FileCopier(methods=[FileCopier.COPY_FILE_RANGE]).copy(self.src, self.dest), FileCopier.COPY_FILE_RANGE)
+        self.__assert_copied()
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+
+    def test_copy(self) -> None:
+        self.assertEqual(FileCopier(methods=[FileCopier.COPY]).copy(self.src, self.dest), FileCopier.COPY)
+        self.__assert_copied()
+        self.assertFalse(os.path.samefile(self.src, self.dest))
+
+    def test_copy_does_not_write_through_hardlinks(self) -> None:
+        other = os.path.join(self.temp_dir.name, "other.jar")
+        with open(other, "w") as f:
+            f.write("other")
+        os.link(other, self.dest)
+        FileCopier(methods=[FileCopier.COPY]).copy(self.src, self.dest)
+        self.__assert_copied()
+        with open(other) as f:
+            self.assertEqual(f.read(), "other")
+
+    @patch("os.link", side_effect=OSError(errno.EXDEV, "Invalid cross-device link"))
+    def test_falls_back_and_remembers_filesystem(self, mock_link: MagicMock) -> None:
+        copier = FileCopier(methods=[FileCopier.HARDLINK, FileCopier.COPY])
+        self.assertEqual(copier.copy(self.src, self.dest), FileCopier.COPY)
+        self.__assert_copied()
+
+        self.assertEqual(copier.copy(self.src, self.dest), FileCopier.COPY)
+        self.assertEqual(mock_link.call_count, 1)
+
+    @patch("os.link", side_effect=OSError(errno.ENOSPC, "No space left on device"))
+    def test_raises_copy_errors(self, mock_link: MagicMock) -> None:
+        with self.assertRaises(OSError):
+            FileCopier().copy(self.src, self.dest)
+
+    def test_move(self) -> None:
+        self.assertEqual(FileCopier(move=True).copy(self.src, self.dest), FileCopier.MOVE)
+        self.__assert_copied()
+        self.assertFalse(os.path.exists(self.src))
@@ -0,0 +1,45 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import os
+import threading
+import time
+import unittest
+from typing import List
+
+from system.file_lock import FileLock
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestFileLock(unittest.TestCase):
+    def test_creates_lock_file(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "locks", "file.lock")
+            with FileLock(path):
+                self.assertTrue(os.path.isfile(path))
+
+    def test_exclusive(self) -> None:
+        events: List[str] = []
+
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "file.lock")
+
+            def hold(name: str) -> None:
+                with FileLock(path):
+                    events.append(f"{name} acquired")
+                    time.sleep(0.1)
+                    events.append(f"{name} released")
+
+            threads = [threading.Thread(target=hold, args=(name,)) for name in ["a", "b"]]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(len(events), 4)
+        for index in [0, 2]:
+            self.assertEqual(events[index].split(" ")[0], events[index + 1].split(" ")[0])
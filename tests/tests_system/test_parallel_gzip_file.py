@@ -0,0 +1,72 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import gzip
+import os
+import tarfile
+import unittest
+from typing import IO, cast
+
+from system.parallel_gzip_file import ParallelGzipFile
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestParallelGzipFile(unittest.TestCase):
+    DATA = os.urandom(1024 * 1024) * 2 + b"OpenSearch" * 300000
+
+    def __write(self, path: str, workers: int, compresslevel: int = 9) -> bytes:
+        with ParallelGzipFile(path, compresslevel, workers) as gz:
+            # writes of any size, across block boundaries
+            for i in range(0, len(self.DATA), 700000):
+                self.assertEqual(gz.write(self.DATA[i:i + 700000]), len(self.DATA[i:i + 700000]))
+            self.assertEqual(gz.tell(), len(self.DATA))
+        with open(path, "rb") as f:
+            return f.read()
+
+    def test_write(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "data.gz")
+            self.__write(path, 4)
+            with gzip.open(path, "rb") as f:
+                self.assertEqual(f.read(), self.DATA)
+
+    def test_write_reproducible(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            data = self.__write(os.path.join(work_dir.name, "data.gz"), 1)
+            self.assertEqual(self.__write(os.path.join(work_dir.name, "data-4.gz"), 4), data)
+            self.assertEqual(self.__write(os.path.join(work_dir.name, "data-16.gz"), 16), data)
+
+    def test_write_compression_level(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            fast = self.__write(os.path.join(work_dir.name, "fast.gz"), 4, 1)
+            best = self.__write(os.path.join(work_dir.name, "best.gz"), 4, 9)
+            self.assertGreater(len(fast), len(best))
+            self.assertEqual(gzip.decompress(fast), self.DATA)
+
+    def test_write_empty(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "empty.gz")
+            ParallelGzipFile(path).close()
+            with gzip.open(path, "rb") as f:
+                self.assertEqual(f.read(), b"")
+
+    def test_write_closed(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            gz = ParallelGzipFile(os.path.join(work_dir.name, "data.gz"))
+            gz.close()
+            gz.close()
+            with self.assertRaises(ValueError):
+                gz.write(b"data")
+
+    def test_tar(self) -> None:
+        with TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir.name, "data.tar.gz")
+            with ParallelGzipFile(path) as gz:
+                with tarfile.open(fileobj=cast(IO[bytes], gz), mode="w") as tar:
+                    tar.add(os.path.dirname(__file__), arcname="tests_system")
+            with tarfile.open(path, "r:gz") as tar:
+                self.assertIn("tests_system/test_parallel_gzip_file.py", tar.getnames())
@@ -0,0 +1,163 @@
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import bz2
+import gzip
+import lzma
+import os
+import stat
+import struct
+import unittest
+from typing import Callable, Dict, List, Tuple
+
+from system.rpm_file import RpmFile
+from system.temporary_directory import TemporaryDirectory
+
+
+class TestRpmFile(unittest.TestCase):
+    MTIME = 1650000000
+    COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+        "gzip": lambda data: gzip.compress(data, mtime=0),
+        "bzip2": bz2.compress,
+        "xz": lzma.compress,
+    }
+
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.dest = os.path.join(self.tmp.name, "dest")
+        os.makedirs(self.dest)
+
+    def tearDown(self) -> None:
+        self.tmp.__exit__(None, None, None)
+
+    @classmethod
+    def __header(cls, tags: Dict[int, str]) -> bytes:
+        index = b""
+        data = b""
+        for tag, value in tags.items():
+            index += struct.pack(">iiii", tag, 6, len(data), 1)
+            data += value.encode() + b"\0"
+        return b"\x8e\xad\xe8\x01\0\0\0\0" + struct.pack(">II", len(tags), len(data)) + index + data
+
+    @classmethod
+    def __cpio(cls, entries: List[Tuple[str, int, bytes, int, int]]) -> bytes:
+        data = b""
+        for name, mode, content, ino, nlink in entries + [("TRAILER!!!", 0, b"", 0, 1)]:
+            fields = [ino, mode, 0, 0, nlink, cls.MTIME, len(content), 0, 0, 0, 0, len(name) + 1, 0]
+            header = b"070701" + b"".join(b"%08X" % field for field in fields) + name.encode() + b"\0"
+            data += header + b"\0" * ((4 - len(header) % 4) % 4)
+            data += content + b"\0" * ((4 - len(content) % 4) % 4)
+        return data
+
+    def __rpm(self, entries: List[Tuple[str, int, bytes, int, int]], compressor: str = "gzip", tags: Dict[int, str] = None) -> str:
+        path = os.path.join(self.tmp.name, "opensearch-1.3.0-linux-x64.rpm")
+        # a signature header of 36 bytes, padded to 40
+        signature = b"\x8e\xad\xe8\x01\0\0\0\0" + struct.pack(">II", 1, 4) + struct.pack(">iiii", 1000, 4, 0, 1) + b"\0\0\0\x2a"
+        header = self.__header(tags if tags is not None else {1000: "opensearch", 1124: "cpio", 1125: compressor})
+        payload = self.COMPRESSORS.get(compressor, lambda data: data)(self.__cpio(entries))
+        with open(path, "wb") as f:
+            f.write(b"\xed\xab\xee\xdb\x03\x00" + b"\0" * 90 + signature + b"\0" * 4 + header + payload)
+        return path
+
+    def __entries(self) -> List[Tuple[str, int, bytes, int, int]]:
+        return [
+            ("./usr", stat.S_IFDIR | 0o755, b"", 1, 2),
+            ("./usr/share/opensearch", stat.S_IFDIR | 0o750, b"", 2, 2),
+            ("./usr/share/opensearch/bin/opensearch", stat.S_IFREG | 0o755, b"#!/bin/sh\n", 3, 1),
+            ("./usr/share/opensearch/lib/opensearch.jar", stat.S_IFREG | 0o644, os.urandom(3 * 1024 * 1024 + 3), 4, 1),
+            ("./usr/share/opensearch/NOTICE.txt", stat.S_IFREG | 0o644, b"", 5, 2),
+            ("./usr/share/opensearch/LICENSE.txt", stat.S_IFREG | 0o644, b"Apache-2.0", 5, 2),
+            ("./usr/share/opensearch/opensearch", stat.S_IFLNK | 0o777, b"bin/opensearch", 6, 1),
+            ("./etc/opensearch/opensearch.yml", stat.S_IFREG | 0o660, b"cluster.name: opensearch\n", 7, 1),
+        ]
+
+    def __assert_extracted(self, entries: List[Tuple[str, int, bytes, int, int]]) -> None:
+        share = os.path.join(self.dest, "usr", "share", "opensearch")
+        self.assertEqual(stat.S_IMODE(os.stat(share).st_mode), 0o750)
+        self.assertEqual(os.stat(share).st_mtime, self.MTIME)
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(share, "bin", "opensearch")).st_mode), 0o755)
+        self.assertEqual(os.stat(os.path.join(share, "bin", "opensearch")).st_mtime, self.MTIME)
+        with open(os.path.join(share, "lib", "opensearch.jar"), "rb") as f:
+            self.assertEqual(f.read(), entries[3][2])
+        with open(os.path.join(share, "NOTICE.txt")) as f:
+            self.assertEqual(f.read(), "Apache-2.0")
+        self.assertTrue(os.path.samefile(os.path.join(share, "NOTICE.txt"), os.path.join(share, "LICENSE.txt")))
+        self.assertEqual(os.readlink(os.path.join(share, "opensearch")), "bin/opensearch")
+        self.assertEqual(stat.S_IMODE(os.stat(os.path.join(self.dest, "etc", "opensearch", "opensearch.yml")).st_mode), 0o660)
+
+    def test_headers(self) -> None:
+        rpm = RpmFile(self.__rpm([], "xz"))
+        self.assertEqual(rpm.payload_format, "cpio")
+        self.assertEqual(rpm.payload_compressor, "xz")
+
+    def test_headers_defaults(self) -> None:
+        rpm = RpmFile(self.__rpm([], tags={1000: "opensearch"}))
+        self.assertEqual(rpm.payload_format, "cpio")
+        self.assertEqual(rpm.payload_compressor, "gzip")
+
+    def test_extractall(self) -> None:
+        for compressor in self.COMPRESSORS:
+            with self.subTest(compressor=compressor):
+                entries = self.__entries()
+                RpmFile(self.__rpm(entries, compressor)).extractall(self.dest)
+                self.__assert_extracted(entries)
+
+    def test_extractall_empty_hard_links(self) -> None:
+        RpmFile(self.__rpm([
+            ("./var/lib/opensearch/a", stat.S_IFREG | 0o640, b"", 1, 2),
+            ("./var/lib/opensearch/b", stat.S_IFREG | 0o640, b"", 1, 2),
+        ])).extractall(self.dest)
+        path = os.path.join(self.dest, "var", "lib", "opensearch", "a")
+        self.assertEqual(os.path.getsize(path), 0)
+        self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o640)
+        self.assertTrue(os.path.samefile(path, os.path.join(self.dest, "var", "lib", "opensearch", "b")))
+
+    def test_extractall_unsupported_compressor(self) -> None:
+        with self.assertRaises(RpmFile.UnsupportedPayloadError) as ctx:
+            RpmFile(self.__rpm(self.__entries(), "zstd")).extractall(self.dest)
+        self.assertEqual(str(ctx.exception), "opensearch-1.3.0-linux-x64.rpm has a payload compressed with zstd")
+        self.assertEqual(os.listdir(self.dest), [])
+
+    def test_extractall_unsupported_format(self) -> None:
+        with self.assertRaises(RpmFile.UnsupportedPayloadError) as ctx:
+            RpmFile(self.__rpm([], tags={1124: "drpm"})).extractall(self.dest)
+        self.assertEqual(str(ctx.exception), "opensearch-1.3.0-linux-x64.rpm has a drpm payload")
+
+    def test_extractall_outside_destination(self) -> None:
+        with self.assertRaises(RpmFile.InvalidRpmError) as ctx:
+            RpmFile(self.__rpm([("./usr/../../evil", stat.S_IFREG | 0o644, b"", 1, 1)])).extractall(self.dest)
+        self.assertEqual(str(ctx.exception), "opensearch-1.3.0-linux-x64.rpm contains ./usr/../../evil, outside of the destination")
+        self.assertFalse(os.path.exists(os.path.join(self.tmp.name, "evil")))
+
+    def test_extractall_through_link_outside_destination(self) -> None:
+        outside = os.path.join(self.tmp.name, "outside")
+        os.makedirs(outside)
+        outside_mode = stat.S_IMODE(os.stat(outside).st_mode)
+        for name, mode in [("./lib/evil", stat.S_IFREG | 0o644), ("./lib/evil", stat.S_IFLNK | 0o777), ("./lib", stat.S_IFDIR | 0o777)]:
+            with self.subTest(mode=mode):
+                entries = [("./lib", stat.S_IFLNK | 0o777, outside.encode(), 1, 1), (name, mode, b"evil", 2, 1)]
+                with self.assertRaises(RpmFile.InvalidRpmError) as ctx:
+                    RpmFile(self.__rpm(entries)).extractall(self.dest)
+                self.assertEqual(str(ctx.exception), f"opensearch-1.3.0-linux-x64.rpm contains {name}, outside of the destination through a symbolic link")
+                self.assertEqual(os.listdir(outside), [])
+                self.assertEqual(stat.S_IMODE(os.stat(outside).st_mode), outside_mode)
+
+    def test_extractall_replaces_link_to_directory(self) -> None:
+        RpmFile(self.__rpm([
+            ("./usr", stat.S_IFDIR | 0o755, b"", 1, 2),
+            ("./opensearch", stat.S_IFLNK | 0o777, b"usr", 2, 1),
+            ("./opensearch", stat.S_IFREG | 0o755, b"#!/bin/sh\n", 3, 1),
+        ])).extractall(self.dest)
+        path = os.path.join(self.dest, "opensearch")
+        self.assertFalse(os.path.islink(path))
+        with open(path) as f:
+            self.assertEqual(f.read(), "#!/bin/sh\n")
+
+    def test_not_an_rpm(self) -> None:
+        with self.assertRaises(RpmFile.InvalidRpmError) as ctx:
+            RpmFile(__file__)
+        self.assertEqual(str(ctx.exception), "test_rpm_file.py is not an rpm package")
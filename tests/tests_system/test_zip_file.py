@@ -6,6 +6,7 @@
 # compatible open source license.
 
 import os
+import stat
 import unittest
 import zipfile
 
@@ -33,3 +34,92 @@ class TestZipFile(unittest.TestCase):
 
             regular_file = os.path.join(tmp.name, "regular.py")
             self.assertTrue(os.path.exists(regular_file))
+
+    def test_extractall_symlinks(self) -> None:
+        with TemporaryDirectory() as tmp:
+            temp_file = os.path.join(tmp.name, "test.zip")
+            with ZipFile(temp_file, "w") as zip:
+                zip.writestr("bin/opensearch", "#!/bin/sh")
+                link = zipfile.ZipInfo("opensearch")
+                link.external_attr = (stat.S_IFLNK | 0o777) << 16
+                zip.writestr(link, "bin/opensearch")
+
+            with ZipFile(temp_file, "r") as zip:
+                zip.extractall(tmp.name)
+
+            self.assertTrue(os.path.islink(os.path.join(tmp.name, "opensearch")))
+            self.assertEqual(os.readlink(os.path.join(tmp.name, "opensearch")), "bin/opensearch")
+
+    def test_extractall_links_last(self) -> None:
+        with TemporaryDirectory() as tmp:
+            outside = os.path.join(tmp.name, "outside")
+            os.makedirs(outside)
+            temp_file = os.path.join(tmp.name, "test.zip")
+            with ZipFile(temp_file, "w") as zip:
+                link = zipfile.ZipInfo("lib")
+                link.external_attr = (stat.S_IFLNK | 0o777) << 16
+                zip.writestr(link, outside)
+                zip.writestr("lib/evil.sh", "#!/bin/sh")
+
+            dest = os.path.join(tmp.name, "dest")
+            with ZipFile(temp_file, "r") as zip:
+                # the link cannot replace the directory created for the file before it
+                with self.assertRaises(OSError):
+                    zip.extractall(dest)
+
+            self.assertEqual(os.listdir(outside), [])
+            with open(os.path.join(dest, "lib", "evil.sh")) as f:
+                self.assertEqual(f.read(), "#!/bin/sh")
+
+    def test_extract_through_link(self) -> None:
+        with TemporaryDirectory() as tmp:
+            outside = os.path.join(tmp.name, "outside")
+            os.makedirs(outside)
+            temp_file = os.path.join(tmp.name, "test.zip")
+            with ZipFile(temp_file, "w") as zip:
+                link = zipfile.ZipInfo("lib")
+                link.external_attr = (stat.S_IFLNK | 0o777) << 16
+                zip.writestr(link, outside)
+                zip.writestr("lib/evil.sh", "#!/bin/sh")
+                zip.writestr("lib.sh", "#!/bin/sh")
+
+            dest = os.path.join(tmp.name, "dest")
+            with ZipFile(temp_file, "r") as zip:
+                zip.extract("lib", dest)
+                zip.extract("lib.sh", dest)
+                with self.assertRaises(ZipFile.UnsafeMemberError) as ctx:
+                    zip.extract("lib/evil.sh", dest)
+            self.assertEqual(str(ctx.exception), f"lib/evil.sh would be extracted through a symbolic link outside of {os.path.realpath(dest)}")
+            self.assertEqual(os.listdir(outside), [])
+
+    def test_write_files(self) -> None:
+        files = [
+            (os.path.join(self.data_path, "executable.sh"), "executable.sh"),
+            (__file__, "regular.py"),
+            (os.path.dirname(__file__), "tests_system"),
+        ]
+        with TemporaryDirectory() as tmp:
+            for compresslevel in [None, 1, 9]:
+                expected_file = os.path.join(tmp.name, "expected.zip")
+                with ZipFile(expected_file, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zip:
+                    for path, arcname in files:
+                        zip.write(path, arcname)
+                temp_file = os.path.join(tmp.name, "test.zip")
+                with ZipFile(temp_file, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zip:
+                    zip.write_files(files, workers=2)
+
+                with open(expected_file, "rb") as expected, open(temp_file, "rb") as actual:
+                    self.assertEqual(actual.read(), expected.read())
+
+            with ZipFile(temp_file, "r") as zip:
+                self.assertEqual(zip.namelist(), ["executable.sh", "regular.py", "tests_system/"])
+                self.assertIsNone(zip.testzip())
+
+    def test_write_files_stored(self) -> None:
+        with TemporaryDirectory() as tmp:
+            temp_file = os.path.join(tmp.name, "test.zip")
+            with ZipFile(temp_file, "w") as zip:
+                zip.write_files([(__file__, "regular.py")])
+            with ZipFile(temp_file, "r") as zip:
+                self.assertEqual(zip.getinfo("regular.py").compress_type, zipfile.ZIP_STORED)
+                self.assertIsNone(zip.testzip())
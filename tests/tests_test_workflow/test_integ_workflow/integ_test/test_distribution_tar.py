@@ -7,7 +7,7 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 from test_workflow.integ_test.distribution_tar import DistributionTar
 
@@ -43,14 +43,10 @@ class TestDistributionTar(unittest.TestCase):
         self.assertEqual(self.distribution_tar_dashboards.log_dir, os.path.join(self.work_dir, "opensearch-dashboards-1.3.0", "logs"))
 
     def test_install(self) -> None:
-        with patch("tarfile.open") as mock_tarfile_open:
-            mock_tarfile_extractall = MagicMock()
-            mock_tarfile_open.return_value.__enter__.return_value.extractall = mock_tarfile_extractall
-
+        with patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor") as mock_archive_extractor:
             self.distribution_tar.install(os.path.join(self.work_dir, "artifacts", "dist", "opensearch-min-1.3.0-linux-x64.tar.gz"))
 
-            mock_tarfile_open.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", "opensearch-min-1.3.0-linux-x64.tar.gz"), "r:gz")
-            mock_tarfile_extractall.assert_called_with(self.work_dir)
+            mock_archive_extractor.return_value.extract_tar.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", "opensearch-min-1.3.0-linux-x64.tar.gz"), self.work_dir)
 
     def test_start_cmd(self) -> None:
         self.assertEqual(self.distribution_tar.start_cmd, "export OPENSEARCH_INITIAL_ADMIN_PASSWORD=myStrongPassword123! && ./opensearch-tar-install.sh")
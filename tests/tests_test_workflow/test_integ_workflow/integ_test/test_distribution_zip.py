@@ -7,7 +7,7 @@
 
 import os
 import unittest
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock, patch
 
 from test_workflow.integ_test.distribution_zip import DistributionZip
 
@@ -46,14 +46,10 @@ class TestDistributionZipOpenSearch(unittest.TestCase):
         self.assertEqual(self.distribution_zip_dashboards.log_dir, os.path.join(self.work_dir, f"{self.product_dashboards}-{self.version}", "logs"))
 
     def test_install(self) -> None:
-        with patch("test_workflow.integ_test.distribution_zip.ZipFile") as mock_zipfile_open:
-            mock_zipfile_extractall = MagicMock()
-            mock_zipfile_open.return_value.__enter__.return_value.extractall = mock_zipfile_extractall
-
+        with patch("test_workflow.integ_test.distribution_zip.ArchiveExtractor") as mock_archive_extractor:
             self.distribution_zip.install(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"))
 
-            mock_zipfile_open.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"), "r")
-            mock_zipfile_extractall.assert_called_with(self.work_dir)
+            mock_archive_extractor.return_value.extract_zip.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"), self.work_dir)
 
     def test_start_cmd(self) -> None:
         self.assertEqual(self.distribution_zip.start_cmd, "env OPENSEARCH_INITIAL_ADMIN_PASSWORD=myStrongPassword123! .\\opensearch-windows-install.bat")
@@ -88,14 +84,10 @@ class TestDistributionZipOpenSearchDashboards(unittest.TestCase):
         self.assertEqual(self.distribution_zip.config_path, os.path.join(self.work_dir, f"{self.product}-{self.version}", "config", "opensearch_dashboards.yml"))
 
     def test_install(self) -> None:
-        with patch("test_workflow.integ_test.distribution_zip.ZipFile") as mock_zipfile_open:
-            mock_zipfile_extractall = MagicMock()
-            mock_zipfile_open.return_value.__enter__.return_value.extractall = mock_zipfile_extractall
-
+        with patch("test_workflow.integ_test.distribution_zip.ArchiveExtractor") as mock_archive_extractor:
             self.distribution_zip.install(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"))
 
-            mock_zipfile_open.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"), "r")
-            mock_zipfile_extractall.assert_called_with(self.work_dir)
+            mock_archive_extractor.return_value.extract_zip.assert_called_with(os.path.join(self.work_dir, "artifacts", "dist", f"{self.product}-min-{self.version}-windows-x64.zip"), self.work_dir)
 
     def test_start_cmd(self) -> None:
         self.assertEqual(self.distribution_zip.start_cmd, ".\\opensearch-dashboards.bat")
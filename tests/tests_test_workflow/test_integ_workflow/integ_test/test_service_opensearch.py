@@ -36,8 +36,8 @@ class ServiceOpenSearchTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
-    def test_start(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Mock, mock_pid: Mock,
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
+    def test_start(self, mock_archive_extractor: Mock, mock_dump: Mock, mock_file: Mock, mock_pid: Mock,
                    mock_process: Mock) -> None:
         dependency_installer = MagicMock()
 
@@ -56,9 +56,6 @@ class ServiceOpenSearchTests(unittest.TestCase):
         mock_dump_result = MagicMock()
         mock_dump.return_value = mock_dump_result
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value.__enter__.return_value = mock_bundle_tar
-
         # call test target function
         service.start()
 
@@ -76,8 +73,7 @@ class ServiceOpenSearchTests(unittest.TestCase):
         mock_file.return_value.write.assert_has_calls([call(''), call(mock_dump_result)])
 
         dependency_installer.download_dist.assert_called_once_with(self.work_dir)
-        mock_tarfile_open.assert_called_once_with(bundle_full_name, "r:gz")
-        mock_bundle_tar.extractall.assert_called_once_with(self.work_dir)
+        mock_archive_extractor.return_value.extract_tar.assert_called_once_with(bundle_full_name, self.work_dir)
 
         self.assertEqual(mock_pid.call_count, 1)
 
@@ -86,8 +82,8 @@ class ServiceOpenSearchTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
-    def test_start_security_disabled(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Any, mock_pid: Mock,
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
+    def test_start_security_disabled(self, mock_archive_extractor: Mock, mock_dump: Mock, mock_file: Any, mock_pid: Mock,
                                      mock_process: Mock, mock_os_isdir: Mock) -> None:
         dependency_installer = MagicMock()
 
@@ -108,9 +104,6 @@ class ServiceOpenSearchTests(unittest.TestCase):
 
         mock_dump.side_effect = [mock_dump_result_for_security, mock_dump_result_for_additional_config]
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value = mock_bundle_tar
-
         mock_file_handler_for_security = mock_open().return_value
         mock_file_handler_for_additional_config = mock_open().return_value
         mock_file_handler_for_jvm_read = mock_open().return_value
@@ -143,8 +136,8 @@ class ServiceOpenSearchTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
-    def test_start_security_disabled_and_not_installed(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Any,
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
+    def test_start_security_disabled_and_not_installed(self, mock_archive_extractor: Mock, mock_dump: Mock, mock_file: Any,
                                                        mock_pid: Mock, mock_process: Mock, mock_os_isdir: Mock) -> None:
         dependency_installer = MagicMock()
 
@@ -164,9 +157,6 @@ class ServiceOpenSearchTests(unittest.TestCase):
 
         mock_dump.side_effect = [mock_dump_result_for_additional_config]
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value = mock_bundle_tar
-
         mock_file_handler_for_security = mock_open().return_value
         mock_file_handler_for_additional_config = mock_open().return_value
         mock_file_handler_for_jvm_read = mock_open().return_value
@@ -33,8 +33,8 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
-    def test_start(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Mock, mock_pid: Mock, mock_process: Mock) -> None:
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
+    def test_start(self, mock_archive_extractor: Mock, mock_dump: Mock, mock_file: Mock, mock_pid: Mock, mock_process: Mock) -> None:
 
         mock_dependency_installer = MagicMock()
 
@@ -50,9 +50,6 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
         bundle_full_name = "test_bundle_name"
         mock_dependency_installer.download_dist.return_value = bundle_full_name
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value.__enter__.return_value = mock_bundle_tar
-
         mock_dump_result = MagicMock()
         mock_dump.return_value = mock_dump_result
 
@@ -60,8 +57,7 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
         service.start()
 
         mock_dependency_installer.download_dist.called_once_with(self.work_dir)
-        mock_tarfile_open.assert_called_once_with(bundle_full_name, "r:gz")
-        mock_bundle_tar.extractall.assert_called_once_with(self.work_dir)
+        mock_archive_extractor.return_value.extract_tar.assert_called_once_with(bundle_full_name, self.work_dir)
 
         mock_file.assert_called_once_with(os.path.join(self.work_dir, "opensearch-dashboards-1.1.0", "config", "opensearch_dashboards.yml"), "a")
         mock_dump.assert_called_once_with(
@@ -82,8 +78,8 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
-    def test_start_without_security(self, mock_tarfile_open: Mock, mock_dump: Mock, mock_file: Any, mock_pid: Mock, mock_process: Mock, mock_check_call: Mock, mock_os_isdir: Mock) -> None:
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
+    def test_start_without_security(self, mock_archive_extractor: Mock, mock_dump: Mock, mock_file: Any, mock_pid: Mock, mock_process: Mock, mock_check_call: Mock, mock_os_isdir: Mock) -> None:
 
         mock_dependency_installer = MagicMock()
 
@@ -99,9 +95,6 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
         bundle_full_name = "test_bundle_name"
         mock_dependency_installer.download_dist.return_value = bundle_full_name
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value.__enter__.return_value = mock_bundle_tar
-
         mock_file_handler_for_security = mock_open().return_value
         mock_file_handler_for_additional_config = mock_open().return_value
 
@@ -143,10 +136,10 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
     @patch('test_workflow.integ_test.service.Process.pid', new_callable=PropertyMock, return_value=12345)
     @patch("builtins.open", new_callable=mock_open)
     @patch("yaml.dump")
-    @patch("tarfile.open")
+    @patch("test_workflow.integ_test.distribution_tar.ArchiveExtractor")
     def test_start_without_security_and_not_installed(
         self,
-        mock_tarfile_open: Mock,
+        mock_archive_extractor: Mock,
         mock_dump: Mock,
         mock_file: Any,
         mock_pid: Mock,
@@ -169,9 +162,6 @@ class ServiceOpenSearchDashboardsTests(unittest.TestCase):
         bundle_full_name = "test_bundle_name"
         mock_dependency_installer.download_dist.return_value = bundle_full_name
 
-        mock_bundle_tar = MagicMock()
-        mock_tarfile_open.return_value.__enter__.return_value = mock_bundle_tar
-
         mock_file_handler_for_security = mock_open().return_value
         mock_file_handler_for_additional_config = mock_open().return_value
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+# Copyright OpenSearch Contributors
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+
+import argparse
+import os
+import sys
+import tarfile
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src"))
+
+from system.archive_extractor import ArchiveExtractor  # noqa: E402
+from system.temporary_directory import TemporaryDirectory  # noqa: E402
+from system.zip_file import ZipFile  # noqa: E402
+
+"""
+Compares the time taken to extract distributions with tarfile and zipfile, as done before ArchiveExtractor, and with ArchiveExtractor.
+Usage: ./benchmark.py opensearch-2.11.0-linux-x64.tar.gz opensearch-2.11.0-windows-x64.zip --runs 3
+"""
+
+
+def tarfile_extract(path: str, dest: str) -> None:
+    with tarfile.open(path, "r:gz") as tar:
+        tar.extractall(dest)
+
+
+def zipfile_extract(path: str, dest: str) -> None:
+    with ZipFile(path, "r") as zip:
+        zip.extractall(dest)
+
+
+def extractors(path: str) -> Dict[str, Callable[[str, str], None]]:
+    if path.endswith(".zip"):
+        return {
+            "zipfile": zipfile_extract,
+            "ArchiveExtractor(workers=1)": ArchiveExtractor(workers=1).extract_zip,
+            "ArchiveExtractor": ArchiveExtractor().extract_zip,
+        }
+    return {
+        "tarfile": tarfile_extract,
+        "ArchiveExtractor(native=False)": ArchiveExtractor(native=False).extract_tar,
+        "ArchiveExtractor": ArchiveExtractor().extract_tar,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the extraction of distributions.")
+    parser.add_argument("archives", type=str, nargs="+", help="The .tar.gz or .zip distributions to extract.")
+    parser.add_argument("--runs", type=int, default=3, help="The number of times each archive is extracted, the best time is reported.")
+    args = parser.parse_args()
+
+    for path in args.archives:
+        print(f"{os.path.basename(path)} ({os.path.getsize(path) / 1024 / 1024:.1f} MB)")
+        for name, extract in extractors(path).items():
+            times: List[float] = []
+            for _ in range(args.runs):
+                with TemporaryDirectory() as work_dir:
+                    start = time.perf_counter()
+                    extract(path, work_dir.name)
+                    times.append(time.perf_counter() - start)
+            print(f"  {name:<32}{min(times):8.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())